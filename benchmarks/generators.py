@@ -0,0 +1,266 @@
+"""Provide synthetic tables and matching table definitions for benchmarking.
+
+Tables contain numeric columns ``num_<i>`` (valid values are integers in [2, 10]), string columns
+``str_<i>`` (valid values are uppercase), an ``otm`` column of ``"<number>:<word>"`` values to be
+split one-to-many and ``flag_<i>`` 0/1 columns to be joined many-to-one.
+"""
+import string
+
+import numpy as np
+import pandas as pd
+
+from table_enforcer import Column, CompoundColumn, Enforcer
+from table_enforcer import validate as v
+from table_enforcer import recode as r
+
+FLAG_COLUMNS = ["flag_0", "flag_1", "flag_2"]
+FLAG_NAMES = ["DNASeq", "Protein Function", "RNASeq"]
+
+
+def make_strings(rng, count, length, cardinality):
+    """Return an object array of ``count`` uppercase strings drawn from ``cardinality`` distinct values."""
+    letters = np.array(list(string.ascii_uppercase))
+    pool = ["".join(word) for word in rng.choice(letters, size=(cardinality, length))]
+    return np.array(pool, dtype=object)[rng.integers(0, cardinality, size=count)]
+
+
+def inject(rng, values, rate, replacement):
+    """Replace a random ``rate`` fraction of ``values`` in-place using ``replacement(selected_values)``."""
+    if rate > 0:
+        mask = rng.random(len(values)) < rate
+        values[mask] = replacement(values[mask])
+    return values
+
+
+def make_table(
+        rows=10000,
+        numeric_columns=2,
+        string_columns=2,
+        string_length=8,
+        null_rate=0.0,
+        cardinality=None,
+        failure_rate=0.0,
+        index="range",
+        seed=0,) -> pd.DataFrame:
+    """Return a synthetic source table.
+
+    Args:
+        rows (int): Number of rows.
+        numeric_columns (int): Number of ``num_<i>`` columns.
+        string_columns (int): Number of ``str_<i>`` columns.
+        string_length (int): Length of each string value.
+        null_rate (float): Fraction of values in ``num_<i>``/``str_<i>`` columns to set to null.
+        cardinality (int): Number of distinct values per string column (default: ``rows``).
+        failure_rate (float): Fraction of values in ``num_<i>``/``str_<i>`` columns made to fail validation.
+        index (str): ``"range"`` for the default ``RangeIndex`` or ``"string"`` for unique string labels in random order.
+        seed (int): Seed for the random number generator.
+    """
+    rng = np.random.default_rng(seed)
+    if cardinality is None:
+        cardinality = rows
+
+    columns = {}
+
+    for i in range(numeric_columns):
+        values = rng.integers(2, 11, size=rows).astype(float)
+        values = inject(rng, values, failure_rate, lambda x: -x)
+        columns[f"num_{i}"] = inject(rng, values, null_rate, lambda x: np.nan)
+
+    for i in range(string_columns):
+        values = make_strings(rng, rows, string_length, cardinality)
+        values = inject(rng, values, failure_rate, lambda x: np.array([s.lower() for s in x], dtype=object))
+        columns[f"str_{i}"] = inject(rng, values, null_rate, lambda x: None)
+
+    numbers = rng.integers(0, 1000, size=rows).astype(str).astype(object)
+    columns["otm"] = numbers + ":" + make_strings(rng, rows, string_length, min(cardinality, 1000))
+
+    for name in FLAG_COLUMNS:
+        columns[name] = rng.integers(0, 2, size=rows)
+
+    table = pd.DataFrame(columns)
+    if index == "string":
+        table.index = pd.Index(np.char.add("row_", rng.permutation(rows).astype(str)).astype(object))
+    elif index != "range":
+        raise ValueError(f"Unknown index kind '{index}': use 'range' or 'string'.")
+
+    return table
+
+
+# Column logic mirroring the patterns found in the tests and the usage demo
+@v.decorators.minmax(low=2, high=10)
+def bt_2_and_10(series):
+    """Test that the data items fall within range: 2 <= x <= 10."""
+    return series
+
+
+def make_bounded_length(length):
+    """Return a validator testing that strings are exactly ``length`` characters long."""
+    @v.decorators.bounded_length(low=length)
+    def exact_length(series):
+        return series
+
+    return exact_length
+
+
+def make_length_is(length):
+    """Return a null-tolerant validator testing that strings are exactly ``length`` characters long."""
+    def length_is(series):
+        return series.str.len() == length
+
+    return length_is
+
+
+def split_on_colon(df):
+    """Split ``otm`` into a number and a word column, once per output column."""
+    return pd.DataFrame({
+        "otm_number": df.otm.apply(lambda x: x.split(":")[0]),
+        "otm_word": df.otm.apply(lambda x: x.split(":")[1]),
+    })
+
+
+def to_int(series):
+    return series.astype(int)
+
+
+def join_as_tuple(df):
+    """Join the flag columns into a single column of tuples, one row at a time."""
+    return pd.DataFrame({
+        "flags": df[FLAG_COLUMNS].apply(lambda row: tuple(row), axis=1),
+    })
+
+
+def make_translator(name):
+    """Return a recoder mapping 0 -> None and 1 -> ``name``."""
+    def translate(series):
+        return series.map({0: None, 1: name})
+
+    translate.__name__ = f"translate_{name.replace(' ', '_')}"
+    return translate
+
+
+def setify_drop_nones(series):
+    """Convert to sets and drop ``None`` values."""
+    return series.apply(lambda x: set(x) - {None})
+
+
+@r.decorators.inplace(True)
+def clip_negative(series):
+    """Replace negative values with zero, modifying ``series``."""
+    series[series < 0] = 0
+    return series
+
+
+@r.decorators.inplace(False)
+def add_one(series):
+    """Return a new series with one added to every value."""
+    return series + 1
+
+
+def make_chain_column(length=20) -> Column:
+    """Return a ``Column`` on ``num_0`` whose recoders alternate in-place and copying steps."""
+    recoders = []
+    for i in range(length):
+        step = clip_negative if i % 2 else add_one
+
+        def recoder(series, step=step):
+            return step(series)
+
+        recoder.__name__ = f"{step.__name__}_{i}"
+        recoder.inplace = step.inplace
+        recoders.append(recoder)
+
+    return Column(name="num_0", dtype=int, unique=False, validators=[], recoders=recoders)
+
+
+def distinct_letters(series):
+    """Return True for strings whose letters are all different, using a deliberately costly regular expression."""
+    return series.astype(str).str.fullmatch(r"(?:([A-Z])(?!.*\1))+")
+
+
+def make_costly_column() -> Column:
+    """Return a ``Column`` on ``str_0`` whose costly validator comes before a cheap ``not_null``."""
+    return Column(name="str_0", dtype=str, unique=False, validators=[distinct_letters, v.funcs.not_null], recoders=[])
+
+
+def make_many_tests_column(count=30) -> Column:
+    """Return a ``Column`` on ``num_0`` with ``count`` cheap validators, as in wide production schemas."""
+    validators = []
+    for i in range(count):
+        def at_most(series, high=10 + i):
+            return series <= high
+
+        at_most.__name__ = f"at_most_{10 + i}"
+        validators.append(at_most)
+
+    return Column(name="num_0", dtype=float, unique=False, validators=validators, recoders=[])
+
+
+def make_columns(table: pd.DataFrame, string_length=8) -> list:
+    """Return ``Column`` definitions for every ``num_<i>`` and ``str_<i>`` column in ``table``."""
+    columns = []
+    for name in table.columns:
+        if name.startswith("num_"):
+            columns.append(
+                Column(
+                    name=name,
+                    dtype=float,
+                    unique=False,
+                    validators=[v.funcs.not_null, v.funcs.positive, bt_2_and_10],
+                    recoders=[],))
+        elif name.startswith("str_"):
+            columns.append(
+                Column(
+                    name=name,
+                    dtype=str,
+                    unique=False,
+                    validators=[v.funcs.not_null, v.funcs.upper, make_length_is(string_length)],
+                    recoders=[r.funcs.upper],))
+    return columns
+
+
+def make_otm_column(column_transform=split_on_colon) -> CompoundColumn:
+    """Return a one-to-many ``CompoundColumn`` splitting ``otm`` with ``column_transform``."""
+    return CompoundColumn(
+        input_columns=[Column(name="otm", dtype=str, unique=False, validators=[v.funcs.not_null], recoders=[])],
+        output_columns=[
+            Column(name="otm_number", dtype=int, unique=False, validators=[v.funcs.not_null], recoders=[to_int]),
+            Column(
+                name="otm_word",
+                dtype=str,
+                unique=False,
+                validators=[v.funcs.not_null, v.funcs.upper],
+                recoders=[r.funcs.upper],),
+        ],
+        column_transform=column_transform,)
+
+
+def make_mto_column(column_transform=join_as_tuple) -> CompoundColumn:
+    """Return a many-to-one ``CompoundColumn`` joining the flag columns into ``flags`` with ``column_transform``."""
+    input_columns = [
+        Column(
+            name=column,
+            dtype=(str, type(None)),
+            unique=False,
+            validators=[],
+            recoders=[make_translator(name)],) for column, name in zip(FLAG_COLUMNS, FLAG_NAMES)
+    ]
+
+    return CompoundColumn(
+        input_columns=input_columns,
+        output_columns=[
+            Column(name="flags", dtype=set, unique=False, validators=[v.funcs.not_null], recoders=[setify_drop_nones])
+        ],
+        column_transform=column_transform,)
+
+
+def make_enforcer(table: pd.DataFrame, string_length=8, compound=False) -> Enforcer:
+    """Return an ``Enforcer`` for ``table``, optionally including the compound columns."""
+    columns = make_columns(table, string_length=string_length)
+    if compound:
+        columns += [make_otm_column(), make_mto_column()]
+    return Enforcer(columns=columns)
+
+
+def split_table(table: pd.DataFrame, rows=200) -> dict:
+    """Return ``table`` split into tables of at most ``rows`` rows, keyed by made-up file names."""
+    return {f"file_{i}.csv": table.iloc[start:start + rows] for i, start in enumerate(range(0, table.shape[0], rows))}
@@ -0,0 +1,132 @@
+"""Run the benchmark suite, save the results as JSON and compare them against a baseline.
+
+Usage::
+
+    python -m benchmarks.run --rows 100000 --save baseline.json
+    python -m benchmarks.run --rows 100000 --compare baseline.json --tolerance 0.2
+"""
+import argparse
+import json
+import platform
+import re
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import table_enforcer
+
+from .suite import BENCHMARKS
+
+
+def time_call(func, repeat=5) -> dict:
+    """Return the min/median/max wall time in seconds of ``repeat`` calls of ``func``."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return {"min": min(timings), "median": statistics.median(timings), "max": max(timings)}
+
+
+def run(pattern=".*", repeat=5, **params) -> dict:
+    """Run every benchmark whose name matches ``pattern`` and return the results.
+
+    Args:
+        pattern (str): Regular expression selecting benchmarks by name.
+        repeat (int): Number of timed calls per benchmark.
+        params: Table parameters passed to ``generators.make_table``.
+    """
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if re.search(pattern, name) is None:
+            continue
+        results[name] = time_call(setup(**params), repeat=repeat)
+
+    return {
+        "params": params,
+        "repeat": repeat,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "table_enforcer": table_enforcer.__version__,
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance=0.2) -> list:
+    """Return ``(name, baseline, current)`` median timings of benchmarks slower than baseline by ``tolerance``."""
+    regressions = []
+    for name, timing in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        if timing["median"] > before["median"] * (1 + tolerance):
+            regressions.append((name, before["median"], timing["median"]))
+
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pattern", default=".*", help="Regular expression selecting benchmarks by name.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--numeric-columns", type=int, default=2)
+    parser.add_argument("--string-columns", type=int, default=2)
+    parser.add_argument("--string-length", type=int, default=8)
+    parser.add_argument("--null-rate", type=float, default=0.0)
+    parser.add_argument("--cardinality", type=int, default=None)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--index", choices=["range", "string"], default="range", help="Kind of row index.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="Write results to this JSON file.")
+    parser.add_argument("--compare", help="Compare results against this baseline JSON file.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown vs baseline (0.2 = 20%%).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run the suite from the command line and return the exit code: 1 if regressions were found."""
+    args = parse_args(argv)
+    params = dict(
+        rows=args.rows,
+        numeric_columns=args.numeric_columns,
+        string_columns=args.string_columns,
+        string_length=args.string_length,
+        null_rate=args.null_rate,
+        cardinality=args.cardinality,
+        failure_rate=args.failure_rate,
+        index=args.index,
+        seed=args.seed,)
+
+    current = run(pattern=args.pattern, repeat=args.repeat, **params)
+
+    for name, timing in current["results"].items():
+        print(f"{name:45s} median {timing['median'] * 1000:10.3f} ms   min {timing['min'] * 1000:10.3f} ms")
+
+    if args.save:
+        with open(args.save, mode="w") as handle:
+            json.dump(current, handle, indent=2)
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+
+        regressions = compare(current, baseline, tolerance=args.tolerance)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
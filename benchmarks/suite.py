@@ -0,0 +1,208 @@
+"""Define the benchmarks.
+
+Each benchmark is a setup function taking the table parameters accepted by
+``generators.make_table`` and returning a zero-argument callable: the code being timed.
+"""
+import pickle
+from collections import OrderedDict
+
+from table_enforcer import validate as v
+from table_enforcer import recode as r
+from table_enforcer import transform as tr
+from table_enforcer.shared import SharedTable, attach
+
+from . import generators as g
+
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(name):
+    """Register the decorated setup function under ``name``."""
+    def decorator(setup):
+        """Register the setup function."""
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+@benchmark("enforcer.validate")
+def enforcer_validate(**params):
+    table = g.make_table(**params)
+    enforcer = g.make_enforcer(table, string_length=params.get("string_length", 8))
+    return lambda: enforcer.validate(table)
+
+
+@benchmark("enforcer.recode")
+def enforcer_recode(**params):
+    table = g.make_table(**params)
+    enforcer = g.make_enforcer(table, string_length=params.get("string_length", 8))
+    return lambda: enforcer.recode(table)
+
+
+@benchmark("enforcer.validate.jobs")
+def enforcer_validate_jobs(**params):
+    table = g.make_table(**params)
+    enforcer = g.make_enforcer(table, string_length=params.get("string_length", 8))
+    return lambda: enforcer.validate(table, jobs=2)
+
+
+@benchmark("enforcer.recode.jobs")
+def enforcer_recode_jobs(**params):
+    table = g.make_table(**params)
+    enforcer = g.make_enforcer(table, string_length=params.get("string_length", 8))
+    return lambda: enforcer.recode(table, jobs=2)
+
+
+@benchmark("shared.handoff")
+def shared_handoff(**params):
+    table = g.make_table(**params)
+
+    def handoff():
+        with SharedTable(table) as shared:
+            attach(pickle.loads(pickle.dumps(shared.handle)))
+
+    return handoff
+
+
+@benchmark("enforcer.summarize")
+def enforcer_summarize(**params):
+    table = g.make_table(**params)
+    enforcer = g.make_enforcer(table, string_length=params.get("string_length", 8))
+    return lambda: enforcer.summarize(table)
+
+
+@benchmark("enforcer.validate.small_tables")
+def enforcer_validate_small_tables(**params):
+    table = g.make_table(**params)
+    enforcer = g.make_enforcer(table, string_length=params.get("string_length", 8), compound=True)
+    tables = g.split_table(table)
+    return lambda: {name: enforcer.validate(small) for name, small in tables.items()}
+
+
+@benchmark("enforcer.validate_many.small_tables")
+def enforcer_validate_many_small_tables(**params):
+    table = g.make_table(**params)
+    enforcer = g.make_enforcer(table, string_length=params.get("string_length", 8), compound=True)
+    tables = g.split_table(table)
+    return lambda: enforcer.validate_many(tables)
+
+
+@benchmark("enforcer.recode.small_tables")
+def enforcer_recode_small_tables(**params):
+    table = g.make_table(**params)
+    enforcer = g.make_enforcer(table, string_length=params.get("string_length", 8), compound=True)
+    tables = g.split_table(table)
+    return lambda: {name: enforcer.recode(small) for name, small in tables.items()}
+
+
+@benchmark("enforcer.recode_many.small_tables")
+def enforcer_recode_many_small_tables(**params):
+    table = g.make_table(**params)
+    enforcer = g.make_enforcer(table, string_length=params.get("string_length", 8), compound=True)
+    tables = g.split_table(table)
+    return lambda: enforcer.recode_many(tables)
+
+
+@benchmark("column.validate.failed_only")
+def column_validate_failed_only(**params):
+    table = g.make_table(**params)
+    column = g.make_costly_column()
+    column.validate(table, failed_only=True)  # measure each validator once
+    return lambda: column.validate(table, failed_only=True)
+
+
+@benchmark("column.validate.failed_only.full")
+def column_validate_failed_only_full(**params):
+    table = g.make_table(**params)
+    column = g.make_costly_column()
+    return lambda: column.validate(table, failed_only=True, full=True)
+
+
+@benchmark("column.validate.failed_only.many_tests")
+def column_validate_failed_only_many_tests(**params):
+    table = g.make_table(**params)
+    column = g.make_many_tests_column()
+    return lambda: column.validate(table, failed_only=True, full=True)
+
+
+@benchmark("column.validate_bitmaps.many_tests")
+def column_validate_bitmaps_many_tests(**params):
+    table = g.make_table(**params)
+    column = g.make_many_tests_column()
+    return lambda: dict(column.validate_bitmaps(table))["num_0"].failures()
+
+
+@benchmark("compound.otm.validate")
+def otm_validate(**params):
+    table = g.make_table(**params)
+    column = g.make_otm_column()
+    return lambda: column.validate(table)
+
+
+@benchmark("compound.otm.recode")
+def otm_recode(**params):
+    table = g.make_table(**params)
+    column = g.make_otm_column()
+    return lambda: column.recode(table)
+
+
+@benchmark("compound.otm.split.recode")
+def otm_split_recode(**params):
+    table = g.make_table(**params)
+    column = g.make_otm_column(column_transform=tr.funcs.split("otm", names=["otm_number", "otm_word"], sep=":"))
+    return lambda: column.recode(table)
+
+
+@benchmark("compound.mto.validate")
+def mto_validate(**params):
+    table = g.make_table(**params)
+    column = g.make_mto_column()
+    return lambda: column.validate(table)
+
+
+@benchmark("compound.mto.recode")
+def mto_recode(**params):
+    table = g.make_table(**params)
+    column = g.make_mto_column()
+    return lambda: column.recode(table)
+
+
+@benchmark("column.recode.chain")
+def recode_chain(**params):
+    table = g.make_table(**params)
+    column = g.make_chain_column()
+    return lambda: column.recode(table)
+
+
+@benchmark("compound.mto.zip.recode")
+def mto_zip_recode(**params):
+    table = g.make_table(**params)
+    column = g.make_mto_column(column_transform=tr.funcs.zip_columns(g.FLAG_COLUMNS, name="flags"))
+    return lambda: column.recode(table)
+
+
+def register_series_benchmark(name, func, column, dropna=False):
+    """Register a benchmark calling ``func`` on ``column`` of the generated table."""
+    def setup(**params):
+        series = g.make_table(**params)[column]
+        if dropna:
+            series = series.dropna()
+        return lambda: func(series)
+
+    benchmark(name)(setup)
+
+
+for _name in ["not_null", "positive", "negative", "unique"]:
+    register_series_benchmark(f"validate.funcs.{_name}", getattr(v.funcs, _name), "num_0")
+
+for _name in ["upper", "lower"]:
+    register_series_benchmark(f"validate.funcs.{_name}", getattr(v.funcs, _name), "str_0")
+    register_series_benchmark(f"recode.funcs.{_name}", getattr(r.funcs, _name), "str_0")
+
+register_series_benchmark("validate.decorators.minmax", g.bt_2_and_10, "num_0")
+register_series_benchmark("validate.decorators.bounded_length", g.make_bounded_length(8), "str_0", dropna=True)
+register_series_benchmark("validate.decorators.match", v.decorators.match(r"[a-z]+$")(lambda series: series), "str_0")
+register_series_benchmark("recode.decorators.replace", r.decorators.replace(r"[aeiou]", "")(lambda series: series), "str_0")
+register_series_benchmark(
+    "validate.decorators.choice", v.decorators.choice(g.FLAG_NAMES)(lambda series: series), "str_0")
@@ -59,8 +59,13 @@ setup(
     author="Gus Dunn",
     author_email='w.gus.dunn@gmail.com',
     url='https://github.com/xguse/table_enforcer',
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     include_package_data=True,
+    entry_points={
+        'console_scripts': [
+            'table-enforcer=table_enforcer.cli:main',
+        ],
+    },
     install_requires=requirements,
     license="MIT license",
     zip_safe=False,
@@ -70,8 +75,8 @@ setup(
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
     ],
+    python_requires='>=3.7',
     test_suite='tests',
     tests_require=test_requirements,)
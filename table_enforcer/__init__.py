@@ -1,10 +1,45 @@
 # -*- coding: utf-8 -*-
-"""Top-level package for Table Enforcer."""
+"""Top-level package for Table Enforcer.
+
+Submodules (and pandas with them) are only imported when one of their names is first accessed,
+so that ``import table_enforcer`` stays cheap for short-lived processes.
+"""
+import importlib
 
 __author__ = """Gus Dunn"""
 __email__ = 'w.gus.dunn@gmail.com'
 __version__ = '0.4.4'
 
-from table_enforcer.main_classes import *  # noqa: F401,F403
-from table_enforcer.utils import validate  # noqa: F401,F403
-from table_enforcer.utils import recode  # noqa: F401,F403
+# public name -> (module providing it, attribute of that module or ``None`` for the module itself)
+_LAZY_ATTRIBUTES = {
+    "Enforcer": ("table_enforcer.main_classes", "Enforcer"),
+    "BaseColumn": ("table_enforcer.main_classes", "BaseColumn"),
+    "Column": ("table_enforcer.main_classes", "Column"),
+    "CompoundColumn": ("table_enforcer.main_classes", "CompoundColumn"),
+    "load_schema": ("table_enforcer.schema", "load_schema"),
+    "validate": ("table_enforcer.utils.validate", None),
+    "recode": ("table_enforcer.utils.recode", None),
+    "transform": ("table_enforcer.utils.transform", None),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """Import and return the object or subpackage exported as ``name``."""
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily imported names along with the module's own attributes."""
+    return sorted(set(globals()) | set(__all__))
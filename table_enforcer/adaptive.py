@@ -0,0 +1,167 @@
+"""Run a column's tests in the order most likely to settle the outcome cheaply.
+
+Every column records, across calls, how long each of its tests takes per row and how often it fails
+(``ValidatorStats``). When only the failed rows are wanted, or only whether every row passes, tests
+are run in increasing order of cost per failure found: cheap tests that often fail go first. To
+decide whether a table passes, evaluation stops at the first failure. To find the failed rows, once
+fewer than ``NARROW_BELOW`` of the rows still pass, each row-local test (see
+``validate.decorators.row_local``) only runs on the rows that passed the tests before it; the
+results of tests a row was spared are left null. Failure rates are only measured on calls that saw
+every row, since rows that passed earlier tests are not a fair sample.
+
+Full validation results (``Column.validate`` without ``failed_only``) always run every test on every row.
+"""
+import time
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from table_enforcer.utils.strings import to_bool
+
+__all__ = [
+    "NARROW_BELOW",
+    "STATS_COLUMNS",
+    "ValidatorStats",
+    "run_tests",
+]
+
+# fraction of rows still passing below which row-local tests only run on the passing rows
+NARROW_BELOW = 0.5
+
+STATS_COLUMNS = ["calls", "rows", "seconds", "failures", "cost_per_row", "failure_rate"]
+
+# indexes of the values recorded per test
+_CALLS, _ROWS, _SECONDS, _FAILURES, _SAMPLED_ROWS, _SAMPLED_FAILURES = range(6)
+
+# a test: (name, function, whether it is row-local)
+TEST = t.Tuple[str, t.Callable[[pd.Series], pd.Series], bool]
+
+
+class ValidatorStats(object):
+    """Observed cost and failures of each test of one column, accumulated across calls."""
+
+    def __init__(self) -> None:
+        """Construct a new, empty ``ValidatorStats`` object."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        self._stats = {}
+
+    def record(self, name: str, rows: int, seconds: float, failures: int, narrowed=False) -> None:
+        """Record a call of the test ``name`` on ``rows`` rows, of which ``failures`` failed.
+
+        ``narrowed`` calls only saw the rows that passed earlier tests: they do not count towards the
+        failure rate.
+        """
+        stats = self._stats.setdefault(name, [0, 0, 0.0, 0, 0, 0])
+        stats[_CALLS] += 1
+        stats[_ROWS] += rows
+        stats[_SECONDS] += seconds
+        stats[_FAILURES] += failures
+        if not narrowed:
+            stats[_SAMPLED_ROWS] += rows
+            stats[_SAMPLED_FAILURES] += failures
+
+    def cost_per_row(self, name: str) -> t.Optional[float]:
+        """Return the mean seconds per row spent in the test ``name``, or None if it never ran on a row."""
+        stats = self._stats.get(name)
+        if stats is None or stats[_ROWS] == 0:
+            return None
+        return stats[_SECONDS] / stats[_ROWS]
+
+    def failure_rate(self, name: str) -> t.Optional[float]:
+        """Return the fraction of rows failing the test ``name`` in calls that saw every row, or None if there were none."""
+        stats = self._stats.get(name)
+        if stats is None or stats[_SAMPLED_ROWS] == 0:
+            return None
+        return stats[_SAMPLED_FAILURES] / stats[_SAMPLED_ROWS]
+
+    def order(self, names: t.List[str]) -> t.List[str]:
+        """Return ``names`` in increasing order of expected cost per failure found.
+
+        Tests never seen on every row run first, in their original order, so that their cost and
+        failure rate get measured; tests never seen failing run last, cheapest first.
+        """
+        def key(name):
+            cost, rate = self.cost_per_row(name), self.failure_rate(name)
+            if rate is None:
+                return (0, 0.0)
+            if rate == 0:
+                return (2, cost)
+            return (1, cost / rate)
+
+        return sorted(names, key=key)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the recorded statistics, one row per test, with ``STATS_COLUMNS``."""
+        records = {
+            name: stats[:_SAMPLED_ROWS] + [self.cost_per_row(name), self.failure_rate(name)]
+            for name, stats in self._stats.items()
+        }
+        return pd.DataFrame.from_dict(records, orient="index", columns=STATS_COLUMNS)
+
+    def __repr__(self) -> str:
+        """Summarize the statistics."""
+        return f"ValidatorStats({list(self._stats)})"
+
+
+def run_tests(
+        column,
+        series: pd.Series,
+        tests: t.List[TEST],
+        stop_on_failure=False,) -> t.Tuple[t.Optional[pd.DataFrame], np.ndarray]:
+    """Run ``tests`` on the positionally indexed ``series`` in the order given by ``column.validator_stats``.
+
+    Return ``(failed, passing)``: ``passing`` holds whether each row passed every test evaluated on it.
+    ``failed`` holds the results of the failed rows, one nullable boolean column per test in the order
+    of ``tests``, indexed by row position; it is None if ``stop_on_failure`` and a test failed, in which
+    case the remaining tests were not run.
+
+    Args:
+        column (Column): The column the tests belong to; its statistics are updated.
+        series (pd.Series): The values to test, indexed by row position.
+        tests (list): ``(name, function, row_local)`` for each test.
+        stop_on_failure (bool): If ``True``, stop as soon as any row fails a test.
+    """
+    stats = column.validator_stats
+    functions = {name: (func, local) for name, func, local in tests}
+    rows = len(series)
+    passing = np.ones(rows, dtype=bool)
+    results = {}
+
+    for name in stats.order(list(functions)):
+        func, local = functions[name]
+
+        positions = None
+        if local and not stop_on_failure:
+            remaining = np.flatnonzero(passing)
+            if remaining.size < NARROW_BELOW * rows:
+                positions = remaining
+
+        data = series if positions is None else series.take(positions).reset_index(drop=True)
+
+        start = time.perf_counter()
+        outcome = column._call("validator", name, func, data)
+        seconds = time.perf_counter() - start
+
+        passed = to_bool(pd.Series(outcome)).to_numpy(dtype=bool)
+        failures = len(passed) - int(np.count_nonzero(passed))
+        stats.record(name, len(passed), seconds, failures, narrowed=positions is not None)
+
+        if stop_on_failure and failures:
+            return None, passing
+
+        if positions is None:
+            passing &= passed
+            results[name] = pd.arrays.BooleanArray(passed, np.zeros(rows, dtype=bool))
+        else:
+            passing[positions] &= passed
+            values, mask = np.ones(rows, dtype=bool), np.ones(rows, dtype=bool)
+            values[positions], mask[positions] = passed, False
+            results[name] = pd.arrays.BooleanArray(values, mask)
+
+    failed = np.flatnonzero(~passing)
+    failed_results = pd.DataFrame({name: results[name][failed] for name, _, _ in tests}, index=failed)
+    return failed_results, passing
@@ -0,0 +1,152 @@
+"""Validate and recode many small tables with a single pass of an ``Enforcer`` over their concatenation.
+
+For tables of a few hundred rows, the fixed cost of every call (building result frames, concatenating
+columns, finding failed rows) outweighs the work done per row. A ``Batch`` concatenates the tables
+once, remembering the source table of every row, so that each validator and recoder runs once per
+batch; results are then split back per table. Rows in failure reports are labeled by ``(source, row)``:
+the key of their source table and their label in it. Unique columns only need to be unique within
+each source table. Only tables with the same columns and dtypes are concatenated, so that no
+column is upcast (e.g. from int to float by a table holding nulls): others go in batches of their own.
+
+As for ``table_enforcer.distributed``, this assumes validators, recoders and ``column_transform``
+functions are row-local; transforms must also return the rows of their input in the same order.
+"""
+import typing as t
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+from table_enforcer.errors import ValidationError
+
+__all__ = [
+    "SOURCE_LEVEL",
+    "Batch",
+    "validate_many",
+    "recode_many",
+]
+
+SOURCE_LEVEL = "source"
+
+
+class Batch(object):
+    """A batch of tables concatenated into one, remembering which rows came from which table."""
+
+    def __init__(self, tables) -> None:
+        """Construct a new ``Batch`` object.
+
+        Args:
+            tables (Mapping, Iterable): DataFrames keyed by source key, or a sequence of DataFrames
+                (keyed by their position).
+        """
+        keyed = isinstance(tables, Mapping)
+        if keyed:
+            self.keys, self.tables = list(tables.keys()), list(tables.values())
+        else:
+            self.tables = list(tables)
+            self.keys = list(range(len(self.tables)))
+
+        lengths = np.array([table.shape[0] for table in self.tables], dtype=np.intp)
+        self.bounds = np.concatenate([[0], np.cumsum(lengths)])
+        self.sources = np.repeat(np.arange(len(self.tables)), lengths)
+        self.table = pd.concat(self.tables, ignore_index=True) if self.tables else pd.DataFrame()
+
+    def split(self, df: pd.DataFrame) -> t.List[pd.DataFrame]:
+        """Return the rows of ``df``, indexed like ``self.table``, split per table and labeled with its index."""
+        parts = []
+        for table, start, stop in zip(self.tables, self.bounds[:-1], self.bounds[1:]):
+            part = df.iloc[start:stop]
+            part.index = table.index
+            parts.append(part)
+        return parts
+
+    def failed_sources(self, failed: pd.DataFrame) -> np.ndarray:
+        """Return the positions of the tables holding the rows of the positionally indexed ``failed``."""
+        return np.unique(self.sources[failed.index.to_numpy(dtype=np.intp)])
+
+    def label(self, failed: pd.DataFrame) -> pd.DataFrame:
+        """Return positionally indexed ``failed`` rows labeled by ``(source, row)``."""
+        positions = failed.index.to_numpy(dtype=np.intp)
+        sources = self.sources[positions]
+        rows = [self.tables[source].index[position - self.bounds[source]] for source, position in zip(sources, positions)]
+
+        failed = failed.copy()
+        failed.index = pd.MultiIndex.from_arrays([[self.keys[source] for source in sources], rows],
+                                                 names=[SOURCE_LEVEL, "row"])
+        return failed
+
+
+def _dtype_groups(tables: t.List[pd.DataFrame]) -> t.List[t.List[int]]:
+    """Return the positions of ``tables`` grouped by their columns and dtypes, in order of first appearance."""
+    groups = {}
+    for position, table in enumerate(tables):
+        groups.setdefault(tuple(table.dtypes.items()), []).append(position)
+    return list(groups.values())
+
+
+def _map_batches(tables, process: t.Callable[[Batch], list]):
+    """Return ``process(batch)`` (one value per table) over batches of ``tables`` sharing columns and dtypes.
+
+    Values are keyed like ``tables`` if it is a mapping, otherwise listed in its order.
+    """
+    keyed = isinstance(tables, Mapping)
+    keys = list(tables.keys()) if keyed else None
+    tables = list(tables.values()) if keyed else list(tables)
+
+    values = [None] * len(tables)
+    for positions in _dtype_groups(tables):
+        batch = Batch({keys[position] if keyed else position: tables[position] for position in positions})
+        for position, value in zip(positions, process(batch)):
+            values[position] = value
+
+    return dict(zip(keys, values)) if keyed else values
+
+
+def validate_many(enforcer, tables):
+    """Return whether each of ``tables`` passes all validation tests, validating them as one batch.
+
+    The result is a ``dict`` of bools keyed like ``tables`` if it is a mapping, otherwise a list of bools.
+
+    Args:
+        enforcer (Enforcer): The table definition.
+        tables (Mapping, Iterable): DataFrames keyed by source key, or a sequence of DataFrames.
+    """
+    def process(batch):
+        passed = np.ones(len(batch.tables), dtype=bool)
+        for column in enforcer.columns:
+            for _, failed in column._check(batch.table, groups=batch.sources, full=False):
+                passed[batch.failed_sources(failed)] = False
+        return [bool(value) for value in passed]
+
+    return _map_batches(tables, process)
+
+
+def recode_many(enforcer, tables, validate=False, cache=None):
+    """Return each of ``tables`` fully recoded, recoding them as one batch.
+
+    The result is a ``dict`` of DataFrames keyed like ``tables`` if it is a mapping, otherwise a list of
+    DataFrames; each keeps the index of its source table.
+
+    Args:
+        enforcer (Enforcer): The table definition.
+        tables (Mapping, Iterable): DataFrames keyed by source key, or a sequence of DataFrames.
+        validate (bool): If ``True``, every recoded table must pass validation tests: ``ValidationError``
+            is raised for the first column with failures, listing them by ``(source, row)``.
+        cache (RecoderCache): If given, results of pure recoders are looked up in and saved to ``cache``.
+    """
+    def process(batch):
+        if not validate:
+            return batch.split(enforcer.recode(batch.table, cache=cache))
+
+        recoded_columns = [pd.DataFrame(index=batch.table.index)]
+        for column in enforcer.columns:
+            recoded, failures = column._recode_and_check(
+                batch.table, cache=cache, groups=batch.sources, full=False)
+            for name, failed in failures:
+                if failed.shape[0] > 0:
+                    raise ValidationError(f"Rows that failed to validate for column '{name}':\n{batch.label(failed)}")
+            recoded_columns.append(recoded)
+
+        return batch.split(pd.concat(recoded_columns, axis=1))
+
+    return _map_batches(tables, process)
@@ -0,0 +1,163 @@
+"""Store validation results packed eight rows to a byte, one bitmap per test.
+
+A ``ValidationBitmap`` holds, for each test of a column, a bitmap of the rows passing it (null
+results counting as passing, as in ``find_failed_rows``) and, only for tests that returned nulls, a
+validity bitmap of the rows with a non-null result, as Arrow does. Results take an eighth of the
+memory of a boolean ``DataFrame``; failed rows and failure counts are found with byte-wise AND and
+population counts, without unpacking. Rows are only unpacked into a ``DataFrame`` on demand:
+``failed_frame()`` unpacks the failed rows, ``to_frame()`` every row.
+"""
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from table_enforcer.utils.strings import to_bool
+
+__all__ = [
+    "ValidationBitmap",
+]
+
+# number of set bits in each byte value
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def _pack(result) -> t.Tuple[np.ndarray, t.Optional[np.ndarray]]:
+    """Return the packed passing bits of a test ``result`` and its packed validity bits (None without nulls)."""
+    values = result.array if isinstance(result, pd.Series) else result
+
+    if isinstance(values, np.ndarray) and values.dtype == bool:
+        return np.packbits(values), None
+
+    if isinstance(values, pd.arrays.BooleanArray):
+        nulls = values.isna()
+        passed = np.packbits(values.to_numpy(dtype=bool, na_value=True))
+        return passed, (np.packbits(~nulls) if nulls.any() else None)
+
+    series = pd.Series(values)
+    nulls = series.isnull().to_numpy()
+    passed = np.packbits(to_bool(series).to_numpy(dtype=bool))
+    return passed, (np.packbits(~nulls) if nulls.any() else None)
+
+
+def _popcount(bits: np.ndarray) -> int:
+    """Return the number of set bits in ``bits``."""
+    return int(_POPCOUNT[bits].sum(dtype=np.int64))
+
+
+def _get(bits: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Return the bits at ``positions`` as bools."""
+    return ((bits[positions >> 3] >> (7 - (positions & 7))) & 1).astype(bool)
+
+
+class ValidationBitmap(object):
+    """The validation results of one column, packed eight rows to a byte, one bitmap per test."""
+
+    def __init__(self, rows: int, index: pd.Index = None) -> None:
+        """Construct a new, empty ``ValidationBitmap`` object.
+
+        Args:
+            rows (int): Number of rows validated.
+            index (pd.Index): Labels of the rows (default: their positions).
+        """
+        self.rows = rows
+        self.index = index
+        self._passed = {}
+        self._valid = {}
+
+    @classmethod
+    def from_frame(cls, results: pd.DataFrame) -> "ValidationBitmap":
+        """Return the validation ``results`` of a column (one column per test) packed."""
+        bitmap = cls(results.shape[0], index=results.index)
+        for name in results.columns:
+            bitmap.add(name, results[name])
+        return bitmap
+
+    def add(self, name: str, result) -> int:
+        """Pack and add the ``result`` (one bool or null per row) of the test ``name``; return its number of failures."""
+        if len(result) != self.rows:
+            raise ValueError(f"Result of '{name}' has {len(result)} rows, expected {self.rows}.")
+        self._passed[name], valid = _pack(result)
+        if valid is not None:
+            self._valid[name] = valid
+        return self.rows - _popcount(self._passed[name])
+
+    @property
+    def names(self) -> t.List[str]:
+        """Return the names of the tests, in the order they were added."""
+        return list(self._passed)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes taken by the bitmaps."""
+        return sum(bits.nbytes for bits in self._passed.values()) + sum(bits.nbytes for bits in self._valid.values())
+
+    def reduce(self, how="all") -> np.ndarray:
+        """Return the packed bits of the rows passing all (``how="all"``) or any (``"any"``) of the tests."""
+        if how not in ("all", "any"):
+            raise ValueError(f"how must be 'all' or 'any', not {how!r}.")
+
+        reduced = np.full((self.rows + 7) // 8, 0xFF if how == "all" else 0, dtype=np.uint8)
+        operation = np.bitwise_and if how == "all" else np.bitwise_or
+        for bits in self._passed.values():
+            operation(reduced, bits, out=reduced)
+
+        if how == "all" and self.rows % 8:
+            # clear the padding bits of the last byte
+            reduced[-1] &= np.uint8(0xFF << (8 - self.rows % 8) & 0xFF)
+        return reduced
+
+    def passes(self) -> bool:
+        """Return True if every row passes every test."""
+        return self.failed_count() == 0
+
+    def failed_count(self) -> int:
+        """Return the number of rows failing at least one test."""
+        return self.rows - _popcount(self.reduce("all"))
+
+    def failures(self) -> pd.Series:
+        """Return the number of rows failing each test."""
+        return pd.Series({name: self.rows - _popcount(bits) for name, bits in self._passed.items()},
+                         index=self.names, dtype="int64")
+
+    def nulls(self) -> pd.Series:
+        """Return the number of null results of each test."""
+        return pd.Series({name: self.rows - _popcount(self._valid[name]) if name in self._valid else 0
+                          for name in self._passed}, index=self.names, dtype="int64")
+
+    def failed_positions(self) -> np.ndarray:
+        """Return the positions of the rows failing at least one test, unpacking only the bytes holding them."""
+        reduced = self.reduce("all")
+        blocks = np.flatnonzero(reduced != 0xFF)
+        block_bits = np.unpackbits(reduced[blocks][:, np.newaxis], axis=1)
+        block, bit = np.nonzero(block_bits == 0)
+        positions = blocks[block] * 8 + bit
+        return positions[positions < self.rows]
+
+    def _frame(self, positions: t.Optional[np.ndarray]) -> pd.DataFrame:
+        """Return the unpacked results of the rows at ``positions`` (all rows if None), labeled by ``index``."""
+        columns = {}
+        for name, bits in self._passed.items():
+            values = np.unpackbits(bits, count=self.rows).astype(bool) if positions is None else _get(bits, positions)
+            valid = self._valid.get(name)
+            if valid is not None:
+                valid = np.unpackbits(valid, count=self.rows).astype(bool) if positions is None else _get(valid, positions)
+                values = pd.arrays.BooleanArray(values, ~valid)
+            columns[name] = values
+
+        rows = pd.RangeIndex(self.rows) if positions is None else positions
+        if self.index is not None:
+            rows = self.index if positions is None else self.index[positions]
+        return pd.DataFrame(columns, index=rows, columns=self.names)
+
+    def failed_frame(self) -> pd.DataFrame:
+        """Return the results of the rows failing at least one test, as ``find_failed_rows`` would."""
+        return self._frame(self.failed_positions())
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the results of every row: bool columns, or nullable ``boolean`` ones for tests with nulls."""
+        return self._frame(None)
+
+    def __repr__(self) -> str:
+        """Summarize the bitmap."""
+        return f"ValidationBitmap(rows={self.rows}, tests={self.names}, failed_rows={self.failed_count()})"
@@ -0,0 +1,118 @@
+"""Provide failure budgets that stop enforcement as soon as a table is clearly corrupt."""
+import typing as t
+
+import pandas as pd
+
+__all__ = [
+    "FailureBudget",
+    "FailureReport",
+]
+
+
+class FailureReport(object):
+    """The validation failures found so far, per column."""
+
+    def __init__(self) -> None:
+        """Construct a new, empty ``FailureReport`` object."""
+        self.rows_checked = 0
+        self.failures = {}
+        # labels of the failed rows, kept up to date so that checking the budget stays cheap
+        self._failed_rows = {}
+        self._all_failed_rows = set()
+
+    def add(self, failures) -> None:
+        """Add failed-only validation results keyed by column name.
+
+        Args:
+            failures (Mapping, Iterable): Failed rows keyed by column name, or ``(name, failed)`` pairs
+                (as returned for the members of a ``CompoundColumn``, where names may repeat).
+        """
+        if hasattr(failures, "items"):
+            failures = failures.items()
+
+        for name, failed in failures:
+            if failed.shape[0] > 0:
+                self.failures.setdefault(name, []).append(failed)
+                self._failed_rows.setdefault(name, set()).update(failed.index)
+                self._all_failed_rows.update(failed.index)
+
+    def failed_rows_per_column(self) -> t.Dict[str, int]:
+        """Return the number of distinct failed rows for each column with failures."""
+        return {name: len(rows) for name, rows in self._failed_rows.items()}
+
+    def failed_rows(self) -> int:
+        """Return the number of distinct rows that failed in any column."""
+        return len(self._all_failed_rows)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the failed validation results indexed by ``column_name`` and ``row``."""
+        if not self.failures:
+            return pd.DataFrame(index=pd.MultiIndex.from_arrays([[], []], names=["column_name", "row"]))
+
+        frames = {name: pd.concat(frames) for name, frames in self.failures.items()}
+        report = pd.concat(frames, names=["column_name", "row"])
+        return report[~report.index.duplicated(keep="first")]
+
+    def __repr__(self) -> str:
+        """Summarize the report."""
+        return f"FailureReport(rows_checked={self.rows_checked}, failed_rows={self.failed_rows_per_column()})"
+
+
+class FailureBudget(object):
+    """Limits on validation failures beyond which enforcement is aborted."""
+
+    def __init__(
+            self,
+            max_failed_rows: int = None,
+            max_failed_rows_per_column: int = None,
+            max_failure_ratio: float = None,
+            chunksize: int = None,) -> None:
+        """Construct a new ``FailureBudget`` object.
+
+        Failures within the budget are tolerated. Every limit left as ``None`` is not enforced.
+
+        Args:
+            max_failed_rows (int): Maximum number of rows failing in any column.
+            max_failed_rows_per_column (int): Maximum number of failing rows in a single column.
+            max_failure_ratio (float): Maximum fraction of the rows checked so far that may fail.
+            chunksize (int): If given, enforce the table this many rows at a time, checking the budget
+                after every column of every chunk, so that a corrupt table is abandoned early.
+
+        After each enforcement under this budget, ``report`` holds the ``FailureReport`` of the
+        failures found (up to the point enforcement was aborted, if it was).
+        """
+        self.max_failed_rows = max_failed_rows
+        self.max_failed_rows_per_column = max_failed_rows_per_column
+        self.max_failure_ratio = max_failure_ratio
+        self.chunksize = chunksize
+        self.report = None
+
+    def chunks(self, table: pd.DataFrame) -> t.Iterator[pd.DataFrame]:
+        """Yield ``table`` in slices of ``self.chunksize`` rows (or whole if no chunksize is set)."""
+        if self.chunksize is None:
+            yield table
+            return
+
+        for start in range(0, table.shape[0], self.chunksize):
+            yield table.iloc[start:start + self.chunksize]
+
+    def exceeded(self, report: FailureReport) -> t.Optional[str]:
+        """Return a description of the first limit ``report`` exceeds, or ``None`` if it is within budget."""
+        failed_rows = report.failed_rows()
+
+        if self.max_failed_rows is not None and failed_rows > self.max_failed_rows:
+            return f"{failed_rows} rows failed validation (max_failed_rows={self.max_failed_rows})"
+
+        if self.max_failed_rows_per_column is not None:
+            for name, count in report.failed_rows_per_column().items():
+                if count > self.max_failed_rows_per_column:
+                    return (f"{count} rows failed validation for column '{name}' "
+                            f"(max_failed_rows_per_column={self.max_failed_rows_per_column})")
+
+        if self.max_failure_ratio is not None and report.rows_checked > 0:
+            ratio = failed_rows / report.rows_checked
+            if ratio > self.max_failure_ratio:
+                return (f"{failed_rows} of {report.rows_checked} rows checked failed validation "
+                        f"(max_failure_ratio={self.max_failure_ratio})")
+
+        return None
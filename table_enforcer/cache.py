@@ -0,0 +1,202 @@
+"""Provide a persistent, size-bounded, value-level cache for the results of expensive recoders.
+
+Only recoders declared with ``recode.decorators.pure`` are cached. Entries are keyed by the
+identity of the recoder (its qualified name plus its ``version`` tag or a hash of its bytecode)
+and the pickled input value, so editing a recoder never serves stale results.
+"""
+import pickle
+import sqlite3
+import threading
+import typing as t
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from table_enforcer.fingerprint import function_identity
+
+__all__ = [
+    "RecoderCache",
+]
+
+RECODER_FUNCTION = t.Callable[[pd.Series], pd.Series]
+
+# SQLite versions before 3.32 refuse statements with more than 999 parameters
+_BATCH_SIZE = 900
+
+
+def _batches(items: list, size: int = _BATCH_SIZE):
+    """Yield successive slices of ``items`` of length ``size``."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _restore_dtype(recoded: pd.Series, dtype) -> pd.Series:
+    """Return the object-dtype ``recoded`` as ``dtype`` (inferring a dtype if it is unknown)."""
+    if dtype is None:
+        return recoded.infer_objects()
+
+    if isinstance(dtype, pd.CategoricalDtype) and not recoded.dropna().isin(dtype.categories).all():
+        # values cached from other calls: infer the categories again
+        dtype = pd.CategoricalDtype(ordered=dtype.ordered)
+    return recoded.astype(dtype)
+
+
+class RecoderCache(object):
+    """An SQLite-backed store of recoder results with least-recently-used eviction.
+
+    A cache may be shared by threads (e.g. columns recoded by ``Enforcer.arecode``): its single
+    connection is guarded by a lock. Processes must each open their own ``RecoderCache``.
+    """
+
+    def __init__(self, path, max_entries: int = 1000000) -> None:
+        """Construct a new ``RecoderCache`` object.
+
+        Args:
+            path (str, Path): Location of the SQLite database file; created if it does not exist.
+            max_entries (int): Number of results to keep before evicting the least recently used ones.
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                recoder TEXT NOT NULL,
+                key BLOB NOT NULL,
+                value BLOB NOT NULL,
+                last_used INTEGER NOT NULL,
+                PRIMARY KEY (recoder, key)
+            )""")
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        # the dtype of each recoder's results, restored on hits so that they match computed results
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS dtypes (
+                recoder TEXT PRIMARY KEY,
+                dtype BLOB NOT NULL
+            )""")
+        self._db.commit()
+        self._clock = self._db.execute("SELECT COALESCE(MAX(last_used), 0) FROM results").fetchone()[0]
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._db.close()
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+            self._db.execute("DELETE FROM dtypes")
+            self._db.commit()
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def get_many(self, recoder: str, keys: t.List[bytes]) -> t.Dict[bytes, t.Any]:
+        """Return a dict of the cached results found for ``keys`` and mark them as recently used."""
+        found = {}
+
+        with self._lock:
+            now = self._tick()
+            for batch in _batches(keys):
+                marks = ",".join("?" * len(batch))
+                rows = self._db.execute(
+                    f"SELECT key, value FROM results WHERE recoder = ? AND key IN ({marks})",
+                    [recoder, *batch],).fetchall()
+                found.update((bytes(key), pickle.loads(value)) for key, value in rows)
+                self._db.execute(
+                    f"UPDATE results SET last_used = ? WHERE recoder = ? AND key IN ({marks})",
+                    [now, recoder, *batch],)
+            self._db.commit()
+
+        return found
+
+    def set_many(self, recoder: str, items: t.Dict[bytes, t.Any]) -> None:
+        """Store the results in ``items`` and evict the oldest entries if the cache is too large."""
+        rows = [(recoder, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)) for key, value in items.items()]
+
+        with self._lock:
+            now = self._tick()
+            self._db.executemany(
+                "INSERT OR REPLACE INTO results (recoder, key, value, last_used) VALUES (?, ?, ?, ?)",
+                ((*row, now) for row in rows),)
+            self._evict()
+            self._db.commit()
+
+    def _evict(self) -> None:
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY last_used LIMIT ?)",
+                (excess,),)
+
+    def get_dtype(self, recoder: str):
+        """Return the dtype of the results last computed by ``recoder``, or None if unknown."""
+        with self._lock:
+            row = self._db.execute("SELECT dtype FROM dtypes WHERE recoder = ?", (recoder,)).fetchone()
+        return None if row is None else pickle.loads(row[0])
+
+    def set_dtype(self, recoder: str, dtype) -> None:
+        """Record ``dtype`` as the dtype of the results computed by ``recoder``."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO dtypes (recoder, dtype) VALUES (?, ?)",
+                (recoder, pickle.dumps(dtype, protocol=pickle.HIGHEST_PROTOCOL)),)
+            self._db.commit()
+
+    def apply(self, recoder: RECODER_FUNCTION, series: pd.Series) -> pd.Series:
+        """Return ``recoder(series)``, computing the recoder only on distinct values missing from the cache.
+
+        Null values and series holding unhashable items are passed straight to ``recoder``. The result
+        has the dtype ``recoder`` returns (e.g. ``string``, ``Int64`` or ``category``), whether values
+        were computed or found in the cache.
+        """
+        try:
+            codes, uniques = pd.factorize(series)
+        except TypeError:
+            return recoder(series)
+
+        identity = function_identity(recoder)
+        keys = [pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL) for value in uniques]
+
+        found = self.get_many(identity, keys)
+        missing = [i for i, key in enumerate(keys) if key not in found]
+        with self._lock:
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+
+        results = np.empty(len(keys), dtype=object)
+        results[:] = [found.get(key) for key in keys]
+
+        dtype = None
+        if missing:
+            computed = recoder(pd.Series(uniques[missing], name=series.name))
+            results[missing] = list(computed)
+            self.set_many(identity, {keys[i]: value for i, value in zip(missing, computed)})
+            dtype = getattr(computed, "dtype", None)
+            if dtype is not None:
+                self.set_dtype(identity, dtype)
+        elif keys:
+            dtype = self.get_dtype(identity)
+
+        recoded = pd.Series(results[codes], index=series.index, name=series.name)
+
+        is_null = codes == -1
+        if is_null.any():
+            recoded_nulls = recoder(series[is_null])
+            recoded[is_null] = recoded_nulls.values
+            if dtype is None:
+                dtype = getattr(recoded_nulls, "dtype", None)
+
+        return _restore_dtype(recoded, dtype)
@@ -0,0 +1,293 @@
+"""Enforce an ``Enforcer`` definition on CSV/Parquet files from the command line.
+
+Usage::
+
+    table-enforcer mypackage.schemas:enforcer data/*.csv --output-dir recoded --report report.json
+    table-enforcer path/to/schema.py:enforcer big.parquet --format parquet --chunksize 500000
+
+The definition is given as ``module:attribute`` (or ``path/to/file.py:attribute``); the attribute
+may be an ``Enforcer`` or a callable returning one. A ``.yaml``/``.yml``/``.json`` path is loaded
+as a declarative schema (see ``table_enforcer.schema``). Each input file is read in chunks, recoded and
+validated; rows that pass are streamed to ``<output-dir>/<name>.<format>`` and rows that fail are
+streamed, with the checks they failed, to ``<output-dir>/<name>.quarantine.<format>``. Files are
+processed in parallel worker processes. Uniqueness is only checked within each chunk.
+
+The exit code is 0 if every row of every file passed, 1 if any row failed or any file could not be
+processed, and 2 for usage errors.
+"""
+import argparse
+import functools
+import glob
+import importlib
+import importlib.util
+import json
+import sys
+import time
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+__all__ = [
+    "load_enforcer",
+    "enforce_file",
+    "main",
+]
+
+FORMATS = {".csv": "csv", ".parquet": "parquet", ".pq": "parquet"}
+SCHEMA_SUFFIXES = {".yaml", ".yml", ".json"}
+ANNOTATION_COLUMN = "failed_validations"
+
+
+@functools.lru_cache(maxsize=None)
+def load_enforcer(spec: str):
+    """Return the ``Enforcer`` named by ``spec``: ``module:attribute``, ``path/to/file.py:attribute`` or a schema file.
+
+    Loaded definitions are kept for the life of the process, so each worker builds a schema once.
+    """
+    if Path(spec).suffix.lower() in SCHEMA_SUFFIXES:
+        from table_enforcer.schema import load_schema
+        return load_schema(spec)
+
+    module_name, _, attribute = spec.rpartition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Enforcer definition '{spec}' is not of the form 'module:attribute'.")
+
+    if module_name.endswith(".py"):
+        path = Path(module_name)
+        module_spec = importlib.util.spec_from_file_location(path.stem, path)
+        if module_spec is None:
+            raise ValueError(f"Cannot load module from '{module_name}'.")
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(module_name)
+
+    enforcer = getattr(module, attribute)
+    if not hasattr(enforcer, "recode_quarantine") and callable(enforcer):
+        enforcer = enforcer()
+    return enforcer
+
+
+def file_format(path: Path) -> str:
+    """Return ``"csv"`` or ``"parquet"`` according to the suffix of ``path``."""
+    try:
+        return FORMATS[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(f"Cannot tell the format of '{path}': expected one of {sorted(FORMATS)}.") from None
+
+
+def read_chunks(path: Path, chunksize: int) -> t.Iterator[pd.DataFrame]:
+    """Yield ``path`` in chunks of at most ``chunksize`` rows, numbering rows consecutively across chunks."""
+    if file_format(path) == "csv":
+        yield from pd.read_csv(path, chunksize=chunksize)
+        return
+
+    import pyarrow.parquet as pq
+
+    start = 0
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+        chunk = batch.to_pandas()
+        chunk.index = pd.RangeIndex(start, start + chunk.shape[0])
+        start += chunk.shape[0]
+        yield chunk
+
+
+class ChunkWriter(object):
+    """Append dataframes to a CSV or Parquet file, written aside and moved into place when closed."""
+
+    def __init__(self, path: Path, fmt: str) -> None:
+        """Construct a new ``ChunkWriter`` object.
+
+        Args:
+            path (Path): File to write.
+            fmt (str): ``"csv"`` or ``"parquet"``.
+        """
+        self.path = path
+        self.format = fmt
+        self.rows = 0
+        self._tmp_path = path.with_name(path.name + ".tmp")
+        self._parquet = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append the rows of ``df``."""
+        if df.shape[0] == 0:
+            return
+
+        if self.format == "csv":
+            df.to_csv(self._tmp_path, mode="w" if self.rows == 0 else "a", header=self.rows == 0, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self._parquet is None:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                self._parquet = pq.ParquetWriter(self._tmp_path, table.schema)
+            else:
+                table = pa.Table.from_pandas(df, schema=self._parquet.schema, preserve_index=False)
+            self._parquet.write_table(table)
+
+        self.rows += df.shape[0]
+
+    def close(self, discard=False) -> None:
+        """Finish the file and replace ``path`` with it.
+
+        If no rows were written, or if ``discard``, ``path`` is removed instead, so that the output of
+        an earlier run never outlives this one.
+        """
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+
+        if self.rows and not discard:
+            self._tmp_path.replace(self.path)
+            return
+
+        for path in (self._tmp_path, self.path):
+            if path.exists():
+                path.unlink()
+
+
+def enforce_file(spec: str, path, output_dir, fmt=None, chunksize=100000) -> dict:
+    """Recode and validate one file and return its report.
+
+    Args:
+        spec (str): The ``Enforcer`` definition (see ``load_enforcer``).
+        path (str, Path): Input CSV/Parquet file.
+        output_dir (str, Path): Directory receiving the recoded and quarantined rows.
+        fmt (str): Output format, ``"csv"`` or ``"parquet"`` (default: the input's format).
+        chunksize (int): Number of rows read, recoded and written at a time.
+    """
+    path = Path(path)
+    report = {
+        "input": str(path),
+        "output": None,
+        "quarantine": None,
+        "rows": 0,
+        "valid_rows": 0,
+        "quarantined_rows": 0,
+        "failures": {},
+        "seconds": 0.0,
+        "rows_per_second": None,
+        "error": None,
+    }
+    start = time.perf_counter()
+
+    valid = quarantine = None
+    try:
+        enforcer = load_enforcer(spec)
+        fmt = fmt or file_format(path)
+        output_dir = Path(output_dir)
+        valid = ChunkWriter(output_dir / f"{path.stem}.{fmt}", fmt)
+        quarantine = ChunkWriter(output_dir / f"{path.stem}.quarantine.{fmt}", fmt)
+        failures = report["failures"]
+
+        def quarantine_sink(rows: pd.DataFrame) -> None:
+            if rows.shape[0] == 0:
+                return
+            for checks in rows[ANNOTATION_COLUMN]:
+                for check in checks:
+                    failures[check] = failures.get(check, 0) + 1
+            if fmt == "csv":
+                rows = rows.assign(**{ANNOTATION_COLUMN: rows[ANNOTATION_COLUMN].str.join(";")})
+            quarantine.write(rows)
+
+        for chunk in read_chunks(path, chunksize):
+            report["rows"] += chunk.shape[0]
+            enforcer.recode_quarantine(
+                chunk,
+                valid_sink=valid.write,
+                quarantine_sink=quarantine_sink,
+                annotation_column=ANNOTATION_COLUMN,)
+
+    except Exception as err:
+        report["error"] = f"{type(err).__name__}: {err}"
+    finally:
+        for writer in (valid, quarantine):
+            if writer is not None:
+                writer.close(discard=report["error"] is not None)
+
+    if valid is not None:
+        report["valid_rows"] = valid.rows
+        report["output"] = str(valid.path) if valid.path.exists() else None
+    if quarantine is not None:
+        report["quarantined_rows"] = quarantine.rows
+        report["quarantine"] = str(quarantine.path) if quarantine.path.exists() else None
+
+    report["seconds"] = time.perf_counter() - start
+    if report["seconds"] > 0:
+        report["rows_per_second"] = report["rows"] / report["seconds"]
+
+    return report
+
+
+def expand_inputs(patterns: t.List[str]) -> t.List[Path]:
+    """Return the files matched by ``patterns`` (paths or glob patterns), without duplicates."""
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        paths.extend(Path(match) for match in matches if Path(match) not in paths)
+    return paths
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="table-enforcer", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "enforcer", help="Enforcer definition: 'module:attribute', 'path/to/file.py:attribute' or a schema file.")
+    parser.add_argument("inputs", nargs="+", help="Input CSV/Parquet files or glob patterns.")
+    parser.add_argument("-o", "--output-dir", default=".", help="Directory for recoded and quarantined rows.")
+    parser.add_argument("-f", "--format", choices=["csv", "parquet"], help="Output format (default: input format).")
+    parser.add_argument("-c", "--chunksize", type=int, default=100000, help="Rows processed at a time.")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of worker processes.")
+    parser.add_argument("-r", "--report", help="Write the JSON failure report to this file ('-' for stdout).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run the command line interface and return the exit code."""
+    args = parse_args(argv)
+
+    paths = expand_inputs(args.inputs)
+    stems = [path.stem for path in paths]
+    duplicated = sorted({stem for stem in stems if stems.count(stem) > 1})
+    if duplicated:
+        print(f"table-enforcer: error: input files would overwrite each other's output: {duplicated}", file=sys.stderr)
+        return 2
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    enforce = functools.partial(
+        enforce_file, args.enforcer, output_dir=output_dir, fmt=args.format, chunksize=args.chunksize)
+
+    if args.jobs > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(paths))) as pool:
+            reports = list(pool.map(enforce, paths))
+    else:
+        reports = [enforce(path) for path in paths]
+
+    for report in reports:
+        if report["error"] is not None:
+            print(f"{report['input']}: FAILED {report['error']}", file=sys.stderr)
+            continue
+        print(
+            f"{report['input']}: {report['rows']} rows in {report['seconds']:.3f} s "
+            f"({report['rows_per_second'] or 0:,.0f} rows/s), {report['quarantined_rows']} quarantined",
+            file=sys.stderr)
+
+    passed = all(report["error"] is None and report["quarantined_rows"] == 0 for report in reports)
+    summary = {"enforcer": args.enforcer, "passed": passed, "files": reports}
+
+    if args.report == "-":
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+    elif args.report:
+        with open(args.report, mode="w") as handle:
+            json.dump(summary, handle, indent=2)
+
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Validate and recode partitioned Dask DataFrames without collecting them into one pandas frame.
+
+Each partition is validated or recoded by the ``Enforcer`` on its own (``map_partitions``), which
+assumes validators, recoders and ``column_transform`` functions are row-local. The one exception
+the package knows about, ``unique=True``, is checked over the whole table by a ``value_counts``
+reduction across partitions; for unique output columns of ``CompoundColumn`` objects, the reduction
+runs over the transformed partitions.
+
+The partitions may be computed with any Dask scheduler: the local threaded or multiprocessing
+schedulers need no cluster. Enforcers sent to worker processes must be picklable by ``cloudpickle``.
+"""
+import typing as t
+
+import dask
+import dask.dataframe as dd
+import pandas as pd
+
+from table_enforcer.errors import ValidationError
+from table_enforcer.incremental import _row_passes, _unique_outputs
+
+__all__ = [
+    "validate",
+    "recode",
+]
+
+
+def _partition_passes(partition: pd.DataFrame, enforcer) -> pd.Series:
+    """Return a one-item Series: whether every row of ``partition`` passes the row-local tests."""
+    passes = True
+    for column in enforcer.columns:
+        passes &= bool(_row_passes(column, partition).all())
+    return pd.Series([passes])
+
+
+def _duplicated_values(frame: dd.DataFrame, names: t.List[str]) -> dict:
+    """Return lazy Series of the values occurring more than once in each of the columns ``names``.
+
+    Repeated nulls count as duplicates, as they do for ``Enforcer.validate``.
+    """
+    duplicated = {}
+    for name in names:
+        counts = frame[name].value_counts(dropna=False)
+        duplicated[name] = counts[counts > 1]
+    return duplicated
+
+
+def _partition_outputs(partition: pd.DataFrame, enforcer) -> pd.DataFrame:
+    return _unique_outputs(enforcer, partition)
+
+
+def _infer_outputs_meta(enforcer, frame: dd.DataFrame) -> pd.DataFrame:
+    """Return an empty dataframe with the columns and dtypes of the unique outputs of ``frame``."""
+    try:
+        return _unique_outputs(enforcer, frame._meta)
+    except Exception:
+        # some transforms cannot handle empty input: transform the first rows instead
+        return _unique_outputs(enforcer, frame.head(npartitions=-1, n=100)).iloc[:0]
+
+
+def validate(enforcer, frame: dd.DataFrame) -> bool:
+    """Return True if all validation tests pass over every partition of ``frame``: False otherwise.
+
+    Args:
+        enforcer (Enforcer): The table definition to validate against.
+        frame (dd.DataFrame): A Dask dataframe on which to apply validation logic.
+    """
+    passes = frame.map_partitions(_partition_passes, enforcer, meta=(None, bool)).all()
+
+    unique_names, _ = enforcer._unique_columns()
+    duplicated = list(_duplicated_values(frame, unique_names).values())
+
+    if any(c.unique for column in enforcer.columns for c in getattr(column, "output_columns", [])):
+        outputs = frame.map_partitions(_partition_outputs, enforcer, meta=_infer_outputs_meta(enforcer, frame))
+        duplicated.extend(_duplicated_values(outputs, list(outputs.columns)).values())
+
+    passes, duplicated = dask.compute(passes, duplicated)
+    return bool(passes) and all(values.empty for values in duplicated)
+
+
+def _recode_partition(partition: pd.DataFrame, enforcer, validate: bool) -> pd.DataFrame:
+    return enforcer.recode(partition, validate=validate)
+
+
+def _check_unique(partition: pd.DataFrame, duplicated: dict) -> pd.DataFrame:
+    """Return ``partition`` unchanged, raising ``ValidationError`` if any unique column has duplicates."""
+    for name, values in duplicated.items():
+        if not values.empty:
+            is_repeated = partition[name].isin(values.index.dropna())
+            if values.index.hasnans:
+                is_repeated |= partition[name].isna()
+            rows = partition.loc[is_repeated, [name]]
+            raise ValidationError(
+                f"Rows that failed to validate for column '{name}' (values repeated across partitions: "
+                f"{list(values.index)}):\n{rows}")
+    return partition
+
+
+def _infer_meta(enforcer, frame: dd.DataFrame) -> pd.DataFrame:
+    """Return an empty dataframe with the columns and dtypes of the recoded ``frame``."""
+    try:
+        return enforcer.recode(frame._meta)
+    except Exception:
+        # some recoders cannot handle empty input: recode the first rows instead
+        return enforcer.recode(frame.head(npartitions=-1, n=100)).iloc[:0]
+
+
+def recode(enforcer, frame: dd.DataFrame, validate=False, meta=None) -> dd.DataFrame:
+    """Return a lazily recoded copy of ``frame``, recoding each partition independently.
+
+    Args:
+        enforcer (Enforcer): The table definition used to recode.
+        frame (dd.DataFrame): A Dask dataframe on which to apply recoding logic.
+        validate (bool): If ``True``, recoded table must pass validation tests. Unique columns are
+            checked across partitions: computing the result raises ``ValidationError`` if they repeat.
+        meta (pd.DataFrame): Empty dataframe describing the recoded columns and dtypes
+            (default: inferred by recoding the empty metadata of ``frame``, or its first rows).
+    """
+    if meta is None:
+        meta = _infer_meta(enforcer, frame)
+
+    recoded = frame.map_partitions(_recode_partition, enforcer, validate, meta=meta)
+
+    if validate:
+        _, unique_names = enforcer._unique_columns()
+        if unique_names:
+            duplicated = dask.delayed(_duplicated_values(recoded, unique_names))
+            recoded = recoded.map_partitions(_check_unique, duplicated, meta=meta)
+
+    return recoded
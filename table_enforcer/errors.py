@@ -5,9 +5,20 @@
 from table_enforcer import __author__, __email__
 
 
+def _restore(cls, args):
+    """Return an error of type ``cls`` with ``args``, bypassing its ``__init__``."""
+    error = cls.__new__(cls)
+    error.args = args
+    return error
+
+
 class TableEnforcerError(Exception):
     """Base error class."""
 
+    def __reduce__(self):
+        """Pickle the message and attributes rather than the ``__init__`` arguments, e.g. to leave a worker process."""
+        return (_restore, (type(self), self.args), self.__dict__ or None)
+
 
 class NotImplementedYet(NotImplementedError, TableEnforcerError):
     """Raise when a section of code that has been left for another time is asked to execute."""
@@ -29,4 +40,13 @@ class RecodingError(TableEnforcerError):
     def __init__(self, column, recoder, exception):
         """Set up the Exception."""
         msg = f"Recoder '{recoder.__name__}' raised the following error on column '{column}': {repr(exception)}."
-        self.args = (msg,)
\ No newline at end of file
+        self.args = (msg,)
+
+
+class FailureBudgetExceeded(ValidationError):
+    """Raise when validation failures exceed a ``FailureBudget``; carries the partial ``FailureReport``."""
+
+    def __init__(self, reason, report):
+        """Set up the Exception."""
+        self.report = report
+        self.args = (f"Failure budget exceeded after checking {report.rows_checked} rows: {reason}.",)
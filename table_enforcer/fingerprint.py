@@ -0,0 +1,132 @@
+"""Provide stable identities for validator/recoder functions and the schemas built from them.
+
+A fingerprint is a hex digest that only changes when something that can change the results of
+validating or recoding changes: column names, dtypes, uniqueness flags or the logic of the
+functions involved. Function logic is identified by an explicit ``version`` tag when one has been
+set (see ``version`` and ``recode.decorators.pure``) and otherwise by hashing the function's
+bytecode, constants and closure values. Module-level objects a function reads at call time are not
+part of its bytecode; tag such functions with a version you bump when those objects change.
+"""
+import hashlib
+import types
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "version",
+    "function_identity",
+    "digest",
+]
+
+
+def version(tag):
+    """Tag a validator or recoder with an explicit version to use instead of its bytecode hash."""
+    def decorator(function):
+        """Set the version tag."""
+        function.version = tag
+        return function
+
+    return decorator
+
+
+def _data_identity(value) -> str:
+    """Return a digest of the contents, dtype(s) and shape of an array, Series, Index or DataFrame.
+
+    Their reprs elide the middle of large objects with "...", so they cannot be used.
+    """
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        contents = np.ascontiguousarray(value).tobytes()
+    else:
+        pandas_value = pd.Series(value.ravel()) if isinstance(value, np.ndarray) else value
+        try:
+            contents = pd.util.hash_pandas_object(pandas_value).to_numpy().tobytes()
+        except TypeError:
+            # unhashable items (e.g. lists)
+            contents = repr(pandas_value.to_numpy().tolist()).encode()
+
+    dtypes = value.dtypes.tolist() if isinstance(value, pd.DataFrame) else [value.dtype]
+    names = list(value.columns) if isinstance(value, pd.DataFrame) else [getattr(value, "name", None)]
+    header = f"{type(value).__qualname__}{value.shape}{dtypes}{names}".encode()
+    return hashlib.sha1(header + contents).hexdigest()
+
+
+def _canonical(value, _seen=None) -> str:
+    """Return a repr of ``value`` that is identical across processes."""
+    if _seen is None:
+        _seen = set()
+
+    if isinstance(value, (types.FunctionType, types.BuiltinFunctionType, types.MethodType)):
+        return function_identity(value, _seen=_seen)
+    if isinstance(value, types.CodeType):
+        return _code_identity(value, _seen=_seen)
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(_canonical(i, _seen) for i in value)) + "}"
+    if isinstance(value, dict):
+        items = sorted(f"{_canonical(k, _seen)}:{_canonical(i, _seen)}" for k, i in value.items())
+        return "{" + ",".join(items) + "}"
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__ + "(" + ",".join(_canonical(i, _seen) for i in value) + ")"
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, (np.ndarray, pd.Series, pd.Index, pd.DataFrame)):
+        return _data_identity(value)
+
+    text = repr(value)
+    if " at 0x" in text:
+        # default object reprs hold memory addresses: describe the object by its state instead
+        state = getattr(value, "__dict__", {})
+        return f"{type(value).__module__}.{type(value).__qualname__}{_canonical(state, _seen)}"
+    return text
+
+
+def _code_identity(code: types.CodeType, _seen) -> str:
+    """Return a digest of a code object's bytecode, names and constants."""
+    parts = [
+        code.co_code.hex(),
+        ",".join(code.co_names),
+        ",".join(_canonical(const, _seen) for const in code.co_consts),
+    ]
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+def function_identity(func: t.Callable, _seen=None) -> str:
+    """Return a string identifying the qualified name and logic of a validator or recoder function."""
+    if _seen is None:
+        _seen = set()
+
+    module = getattr(func, "__module__", None) or type(func).__module__
+    name = getattr(func, "__qualname__", None) or type(func).__qualname__
+    qualname = f"{module}.{name}"
+
+    tag = getattr(func, "version", None)
+    if tag is not None:
+        return f"{qualname}:v{tag}"
+
+    if id(func) in _seen:
+        # recursive references (e.g. a closure that refers to itself)
+        return qualname
+    _seen.add(id(func))
+
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return f"{qualname}:{_canonical(getattr(func, '__dict__', {}), _seen)}"
+
+    cells = [cell.cell_contents for cell in (func.__closure__ or ()) if _cell_is_set(cell)]
+    defaults = func.__defaults__ or ()
+    logic = "|".join([_code_identity(code, _seen), _canonical(tuple(cells), _seen), _canonical(defaults, _seen)])
+    return f"{qualname}:{hashlib.sha1(logic.encode()).hexdigest()}"
+
+
+def _cell_is_set(cell) -> bool:
+    try:
+        cell.cell_contents
+    except ValueError:
+        return False
+    return True
+
+
+def digest(*parts) -> str:
+    """Return a hex digest of the canonical representation of ``parts``."""
+    return hashlib.sha1(_canonical(parts).encode()).hexdigest()
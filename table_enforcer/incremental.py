@@ -0,0 +1,220 @@
+"""Provide an on-disk store of per-row outcomes supporting incremental validation and recoding.
+
+Rows are identified by a hash of the contents of the source columns that an ``Enforcer``
+actually reads. Rows whose hash is already present in the store reuse the recorded outcome,
+so only new or changed rows are sent through the validators and recoders.
+
+This assumes validators and recoders are row-local: the outcome for a row depends only on
+the values in that row. The one exception that the package knows about, ``unique=True``,
+is always re-evaluated over the whole table: the transformed values of unique output columns
+of ``CompoundColumn`` objects are recorded per row for that purpose.
+"""
+import pickle
+import typing as t
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from table_enforcer.errors import ValidationError
+from table_enforcer.utils import validate as v
+
+__all__ = [
+    "IncrementalStore",
+    "hash_rows",
+]
+
+
+def hash_rows(table: pd.DataFrame, columns: t.List[str]) -> pd.Series:
+    """Return a ``uint64`` hash of the contents of ``columns`` for every row in ``table``."""
+    return pd.util.hash_pandas_object(table[columns], index=False)
+
+
+def _source_columns(enforcer) -> t.List[str]:
+    """Return the names of the source table columns read by ``enforcer``."""
+    names = []
+    for column in enforcer.columns:
+        members = getattr(column, "input_columns", [column])
+        names.extend(c.name for c in members if c.name not in names)
+    return names
+
+
+def _unique_outputs(enforcer, table: pd.DataFrame) -> pd.DataFrame:
+    """Return the transformed values of the unique output columns of ``enforcer``, indexed like ``table``."""
+    outputs = [pd.DataFrame(index=table.index)]
+    for column in enforcer.columns:
+        names = [c.name for c in getattr(column, "output_columns", []) if c.unique]
+        if names:
+            outputs.append(column.column_transform(table)[names].set_axis(table.index, axis=0))
+    return pd.concat(outputs, axis=1)
+
+
+def _row_passes(column, table: pd.DataFrame) -> pd.Series:
+    """Return a boolean Series indexed like ``table``: whether each row passes ``column``'s validators.
+
+    The ``unique`` test is ignored because its outcome depends on the other rows in the table.
+    """
+    results = column.validate(table).drop(columns="unique", errors="ignore")
+    passes = results.fillna(True).all(axis=1).astype(bool)
+
+    if isinstance(passes.index, pd.MultiIndex):
+        passes = passes.groupby(level="row").all()
+
+    return passes.reindex(table.index, fill_value=True)
+
+
+class IncrementalStore(object):
+    """A local file recording per-row validation and recode outcomes for one ``Enforcer``."""
+
+    def __init__(self, path) -> None:
+        """Construct a new ``IncrementalStore`` object.
+
+        Args:
+            path (str, Path): Location of the file used to persist the store.
+        """
+        self.path = Path(path)
+        self.fingerprint = None
+        self._reset()
+
+    def _reset(self) -> None:
+        """Forget all recorded outcomes."""
+        self.validated = pd.Series([], index=pd.Index([], dtype="uint64"), dtype=bool)
+        self.recoded = pd.DataFrame(index=pd.Index([], dtype="uint64"))
+        self.recode_validated = pd.Series([], index=pd.Index([], dtype="uint64"), dtype=bool)
+        self.unique_outputs = pd.DataFrame(index=pd.Index([], dtype="uint64"))
+
+    def load(self, fingerprint: str) -> None:
+        """Load the stored outcomes, discarding them if they were made under a different schema."""
+        self.fingerprint = fingerprint
+        self._reset()
+
+        if not self.path.exists():
+            return
+
+        with self.path.open(mode="rb") as handle:
+            state = pickle.load(handle)
+
+        if state.get("fingerprint") != fingerprint or "unique_outputs" not in state:
+            return
+
+        self.validated = state["validated"]
+        self.recoded = state["recoded"]
+        self.recode_validated = state["recode_validated"]
+        self.unique_outputs = state["unique_outputs"]
+
+    def save(self) -> None:
+        """Persist the current outcomes to ``self.path``."""
+        state = {
+            "fingerprint": self.fingerprint,
+            "validated": self.validated,
+            "recoded": self.recoded,
+            "recode_validated": self.recode_validated,
+            "unique_outputs": self.unique_outputs,
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open(mode="wb") as handle:
+            pickle.dump(state, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(self.path)
+
+    def validate(self, enforcer, table: pd.DataFrame) -> bool:
+        """Return True if all validation tests pass, only validating rows not seen before.
+
+        Args:
+            enforcer (Enforcer): The table definition to validate against.
+            table (pd.DataFrame): A dataframe on which to apply validation logic.
+        """
+        self.load(enforcer.fingerprint)
+
+        hashes = hash_rows(table, _source_columns(enforcer))
+        is_new = ~hashes.isin(self.validated.index)
+        new_rows = table.loc[is_new.values]
+
+        if new_rows.shape[0] > 0:
+            passes = pd.Series(True, index=new_rows.index)
+            for column in enforcer.columns:
+                passes &= _row_passes(column, new_rows)
+
+            outcome = pd.Series(passes.values, index=hashes[is_new].values)
+            self.validated = pd.concat([self.validated, outcome])
+
+            outputs = _unique_outputs(enforcer, new_rows).set_axis(hashes[is_new].values, axis=0)
+            self.unique_outputs = pd.concat([self.unique_outputs, outputs])
+
+        keep = ~self.validated.index.duplicated(keep="last") & self.validated.index.isin(hashes.values)
+        self.validated = self.validated.loc[keep]
+        keep = ~self.unique_outputs.index.duplicated(keep="last") & self.unique_outputs.index.isin(hashes.values)
+        self.unique_outputs = self.unique_outputs.loc[keep]
+        self.save()
+
+        all_pass = bool(self.validated.loc[hashes.values].all())
+
+        unique_names, _ = enforcer._unique_columns()
+        for name in unique_names:
+            all_pass &= bool(v.funcs.unique(table[name]).all())
+
+        # unique outputs of compound columns, over the transformed values of every row of the table
+        outputs = self.unique_outputs.loc[hashes.values]
+        for name in outputs.columns:
+            all_pass &= bool(v.funcs.unique(outputs[name]).all())
+
+        return all_pass
+
+    def recode(self, enforcer, table: pd.DataFrame, validate=False, cache=None) -> pd.DataFrame:
+        """Return a fully recoded dataframe, only recoding rows not seen before.
+
+        Args:
+            enforcer (Enforcer): The table definition used to recode.
+            table (pd.DataFrame): A dataframe on which to apply recoding logic.
+            validate (bool): If ``True``, recoded table must pass validation tests.
+            cache (RecoderCache): If given, results of pure recoders are looked up in and saved to ``cache``.
+        """
+        self.load(enforcer.fingerprint)
+
+        hashes = hash_rows(table, _source_columns(enforcer))
+        known = self.recoded.index
+        if validate:
+            known = self.recode_validated.index[self.recode_validated.values]
+        is_new = ~hashes.isin(known)
+
+        new_rows = table.loc[is_new.values]
+        if new_rows.shape[0] > 0 or self.recoded.shape[1] == 0:
+            recoded_new = enforcer.recode(new_rows, validate=validate, cache=cache)
+        else:
+            recoded_new = self.recoded.iloc[:0].set_axis(new_rows.index, axis=0)
+
+        recoded_cached = self.recoded.reindex(index=hashes[~is_new].values, columns=recoded_new.columns)
+        recoded_cached.index = table.index[~is_new.values]
+
+        if recoded_cached.shape[0] == 0:
+            recoded = recoded_new
+        elif recoded_new.shape[0] == 0:
+            recoded = recoded_cached
+        else:
+            # put the rows back in table order by position: labels may repeat
+            positions = np.concatenate([np.flatnonzero(~is_new.values), np.flatnonzero(is_new.values)])
+            recoded = pd.concat([recoded_cached, recoded_new]).take(np.argsort(positions, kind="stable"))
+
+        if validate:
+            _, unique_names = enforcer._unique_columns()
+            for name in unique_names:
+                passed = v.funcs.unique(recoded[name])
+                if not passed.all():
+                    raise ValidationError(
+                        f"Rows that failed to validate for column '{name}':\n{recoded.loc[~passed.values, [name]]}")
+
+        stored = recoded_new.copy()
+        stored.index = hashes[is_new].values
+        self.recoded = pd.concat([self.recoded, stored])
+        self.recode_validated = pd.concat([
+            self.recode_validated,
+            pd.Series(np.repeat(validate, stored.shape[0]), index=stored.index, dtype=bool),
+        ])
+
+        keep = ~self.recoded.index.duplicated(keep="last") & self.recoded.index.isin(hashes.values)
+        self.recoded = self.recoded.loc[keep]
+        self.recode_validated = self.recode_validated.loc[keep]
+        self.save()
+
+        return recoded
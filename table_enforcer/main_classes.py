@@ -1,11 +1,24 @@
 # -*- coding: utf-8 -*-
 """Main module."""
+import asyncio
+import functools
+import time
 import typing as t
 
+import numpy as np
 import pandas as pd
 
-from box import Box
-from table_enforcer.errors import ValidationError, RecodingError
+from table_enforcer.adaptive import STATS_COLUMNS, ValidatorStats, run_tests
+from table_enforcer.batch import recode_many, validate_many
+from table_enforcer.bitmap import ValidationBitmap
+from table_enforcer.budget import FailureReport
+from table_enforcer.errors import ValidationError, RecodingError, FailureBudgetExceeded
+from table_enforcer.fingerprint import digest, function_identity
+from table_enforcer.incremental import _unique_outputs
+from table_enforcer.preflight import preflight
+from table_enforcer.profiling import Profiler
+from table_enforcer.summary import summarize
+from table_enforcer.utils.strings import to_bool
 from .utils import validate as v
 
 __all__ = [
@@ -20,8 +33,82 @@ RECODER_FUNCTION = t.Callable[[pd.Series], pd.Series]
 
 
 def find_failed_rows(results):
-    failed_rows = results.apply(lambda vec: ~vec.all(), axis=1)
-    return results.loc[failed_rows]
+    failed_rows = ~results.all(axis=1).to_numpy(dtype=bool)
+    return results.iloc[failed_rows]
+
+
+def positional(series: pd.Series) -> pd.Series:
+    """Return a Series sharing the values of ``series`` but indexed by row position (a ``RangeIndex``)."""
+    if isinstance(series.index, pd.RangeIndex) and series.index.start == 0 and series.index.step == 1:
+        return series
+    return pd.Series(series.array, index=pd.RangeIndex(len(series)), name=series.name, copy=False)
+
+
+def unique_within(groups: np.ndarray, series: pd.Series) -> pd.Series:
+    """Test that the data items do not repeat within the rows of each group (one group code per row)."""
+    pairs = pd.DataFrame({"group": groups, "value": series.array}, index=series.index)
+    return ~pairs.duplicated(keep=False)
+
+
+def label_rows(results: pd.DataFrame, index: pd.Index) -> pd.DataFrame:
+    """Return positionally indexed ``results`` labeled with the rows of ``index`` found at those positions."""
+    if results.index.equals(pd.RangeIndex(len(index))):
+        results.index = index
+    else:
+        results.index = index.take(results.index.to_numpy())
+    return results
+
+
+def _level(values: list) -> t.Tuple[pd.Index, np.ndarray]:
+    """Return the distinct ``values`` in order of appearance and the code of each value."""
+    level = pd.Index(dict.fromkeys(values))
+    return level, level.get_indexer(values)
+
+
+def stack_validations(parts: t.List[t.Tuple[str, str, pd.DataFrame]], index: pd.Index) -> pd.DataFrame:
+    """Return positional member results stacked and labeled by ``(validation_type, column_name, row)``.
+
+    The row labels are attached by building the ``MultiIndex`` from codes, so ``index`` is never
+    sorted or re-hashed per member.
+
+    Args:
+        parts (list): ``(validation_type, column_name, results)`` for each member, in stacking order.
+        index (pd.Index): The index of the table the members were validated on.
+    """
+    lengths = [results.shape[0] for _, _, results in parts]
+    types, type_codes = _level([validation_type for validation_type, _, _ in parts])
+    names, name_codes = _level([name for _, name, _ in parts])
+    positions = np.concatenate([results.index.to_numpy(dtype=np.intp) for _, _, results in parts])
+
+    if index.is_unique:
+        row_codes, rows = positions, index
+    else:
+        codes, rows = index.factorize()
+        row_codes = codes[positions]
+
+    stacked = pd.concat([results for _, _, results in parts], ignore_index=True)
+    stacked.index = pd.MultiIndex(
+        levels=[types, names, rows],
+        codes=[np.repeat(type_codes, lengths), np.repeat(name_codes, lengths), row_codes],
+        names=["validation_type", "column_name", "row"],
+        verify_integrity=False,)
+    return stacked
+
+
+def polars_backend(table, **options):
+    """Return the Polars backend module if ``table`` is a Polars DataFrame/LazyFrame: ``None`` otherwise.
+
+    Raise ``ValueError`` if any of the pandas-only ``options`` is set.
+    """
+    if not type(table).__module__.startswith("polars"):
+        return None
+
+    unsupported = sorted(name for name, value in options.items() if value is not None)
+    if unsupported:
+        raise ValueError(f"Options not supported for Polars tables: {unsupported}.")
+
+    from table_enforcer import polars_backend as backend
+    return backend
 
 
 def set_from_kwargs(kwargs, key, default):
@@ -38,9 +125,45 @@ class Enforcer(object):
     def __init__(self, columns):
         """Initialize an enforcer instance."""
         self.columns = columns
+        self.profiler = None
+        self._fingerprint = None
+
+    @property
+    def fingerprint(self) -> str:
+        """Return a hex digest identifying this table definition.
+
+        Computed on first access and memoized: build a new ``Enforcer`` after changing its columns.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = digest("Enforcer", [column.fingerprint for column in self.columns])
+        return self._fingerprint
 
-    def _make_validations(self, table: pd.DataFrame) -> Box:
-        """Return a dict-like object containing dataframes of which tests passed/failed for each column."""
+    def enable_profiling(self, callbacks=None, trace_memory=False) -> Profiler:
+        """Attach a new ``Profiler`` to every column and return it.
+
+        Args:
+            callbacks (list): Functions called with a ``dict`` describing every validator/recoder call.
+            trace_memory (bool): If ``True``, also record peak allocations (slow).
+        """
+        self.profiler = Profiler(callbacks=callbacks, trace_memory=trace_memory)
+        for column in self.columns:
+            column.set_profiler(self.profiler)
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """Detach the profiler from every column."""
+        self.profiler = None
+        for column in self.columns:
+            column.set_profiler(None)
+
+    def profile_report(self) -> pd.DataFrame:
+        """Return a dataframe of the cost of each validator/recoder per column since profiling was enabled."""
+        if self.profiler is None:
+            raise ValueError("Profiling is not enabled: call `enable_profiling()` first.")
+        return self.profiler.report()
+
+    def _make_validations(self, table: pd.DataFrame) -> t.List[pd.DataFrame]:
+        """Return a list containing dataframes of which tests passed/failed for each column."""
         results = []
 
         for column in self.columns:
@@ -48,28 +171,394 @@ class Enforcer(object):
 
         return results
 
-    def validate(self, table: pd.DataFrame) -> bool:
-        """Return True if all validation tests pass: False otherwise."""
-        validations = self._make_validations(table=table)
+    def _unique_columns(self) -> t.Tuple[t.List[str], t.List[str]]:
+        """Return the names of unique columns in the source table and in the recoded table."""
+        source, recoded = [], []
+        for column in self.columns:
+            if isinstance(column, CompoundColumn):
+                source.extend(c.name for c in column.input_columns if c.unique)
+                recoded.extend(c.name for c in column.output_columns if c.unique)
+            elif column.unique:
+                source.append(column.name)
+                recoded.append(column.name)
+        return source, recoded
+
+    def _enforce_budget(self, table: pd.DataFrame, budget, recode=False, cache=None) -> t.Tuple[pd.DataFrame, FailureReport]:
+        """Validate (and optionally recode) ``table`` chunk by chunk, aborting once ``budget`` is exceeded.
+
+        Return the recoded table (``None`` unless ``recode``) and the report of the failures found,
+        which is also left in ``budget.report``.
+        """
+        report = budget.report = FailureReport()
+        recoded_chunks = []
+
+        for chunk in budget.chunks(table):
+            report.rows_checked += chunk.shape[0]
+            recoded_columns = [pd.DataFrame(index=chunk.index)]
+
+            for column in self.columns:
+                if recode:
+                    recoded, failures = column._recode_and_check(chunk, cache=cache)
+                    recoded_columns.append(recoded)
+                else:
+                    failures = column._check(chunk)
+
+                report.add(failures)
+                reason = budget.exceeded(report)
+                if reason is not None:
+                    raise FailureBudgetExceeded(reason, report)
+
+            recoded_chunks.append(pd.concat(recoded_columns, axis=1))
+
+        df = pd.concat(recoded_chunks) if recode else None
+
+        if budget.chunksize is not None:
+            # uniqueness has only been checked within each chunk so far
+            source_unique, recoded_unique = self._unique_columns()
+            if recode:
+                frames = [df[recoded_unique]]
+            else:
+                # unique outputs of compound columns are checked on the transformed table
+                frames = [table[source_unique], _unique_outputs(self, table)]
+
+            for frame in frames:
+                for name in frame.columns:
+                    failed = v.funcs.unique(frame[name]).to_frame("unique")
+                    report.add([(name, failed[~failed.unique])])
 
-        results = [df.all().all() for df in validations]
+            reason = budget.exceeded(report)
+            if reason is not None:
+                raise FailureBudgetExceeded(reason, report)
 
-        return all(results)
+        return df, report
 
-    def recode(self, table: pd.DataFrame, validate=False) -> pd.DataFrame:
+    def validate(self, table: pd.DataFrame, store=None, budget=None, jobs=None) -> bool:
+        """Return True if all validation tests pass: False otherwise.
+
+        Args:
+            table (pd.DataFrame): A dataframe on which to apply validation logic.
+            store (IncrementalStore): If given, only validate rows that are not already recorded in ``store``.
+            budget (FailureBudget): If given, return True as long as failures stay within ``budget``,
+                and return False as soon as they exceed it. The report of the failures found so far
+                is left in ``budget.report``.
+            jobs (int): If more than 1, validate columns in this many worker processes, sharing
+                ``table`` with them through shared memory (see ``table_enforcer.parallel``).
+                Not combined with ``store`` or ``budget``.
+        """
+        backend = polars_backend(table, store=store, budget=budget, jobs=jobs)
+        if backend is not None:
+            return backend.validate(self, table)
+
+        if store is not None:
+            return store.validate(self, table)
+
+        if budget is not None:
+            try:
+                self._enforce_budget(table, budget)
+            except FailureBudgetExceeded:
+                return False
+            return True
+
+        if jobs is not None and jobs > 1:
+            from table_enforcer import parallel
+            return parallel.validate(self, table, jobs)
+
+        # stops at the first column with a failure
+        return all(column._passes(table) for column in self.columns)
+
+    def recode(
+            self,
+            table: pd.DataFrame,
+            validate=False,
+            store=None,
+            cache=None,
+            budget=None,
+            spill=None,
+            jobs=None,) -> pd.DataFrame:
         """Return a fully recoded dataframe.
 
         Args:
             table (pd.DataFrame): A dataframe on which to apply recoding logic.
             validate (bool): If ``True``, recoded table must pass validation tests.
+            store (IncrementalStore): If given, only recode rows that are not already recorded in ``store``.
+            cache (RecoderCache): If given, results of pure recoders are looked up in and saved to ``cache``.
+            budget (FailureBudget): If given, the recoded table is validated and failures within
+                ``budget`` are tolerated. ``FailureBudgetExceeded``, carrying the report of the failures
+                found so far, is raised as soon as they exceed it.
+            spill (SpillDirectory): If given, intermediate and final column results are written to
+                ``spill`` and read back memory-mapped, so they need not all fit in memory at once.
+            jobs (int): If more than 1, recode columns in this many worker processes, sharing
+                ``table`` with them through shared memory (see ``table_enforcer.parallel``).
+                Not combined with ``store``, ``budget`` or ``spill``.
         """
+        backend = polars_backend(table, store=store, cache=cache, budget=budget, spill=spill, jobs=jobs)
+        if backend is not None:
+            return backend.recode(self, table, validate=validate)
+
+        if store is not None:
+            return store.recode(self, table, validate=validate, cache=cache)
+
+        if budget is not None:
+            df, _ = self._enforce_budget(table, budget, recode=True, cache=cache)
+            return df
+
+        if jobs is not None and jobs > 1 and spill is None:
+            from table_enforcer import parallel
+            return parallel.recode(self, table, jobs, validate=validate, cache=cache)
+
+        if spill is not None:
+            recoded_columns = [column.recode(table, validate=validate, cache=cache, spill=spill) for column in self.columns]
+            return pd.concat([pd.DataFrame(index=table.index), *recoded_columns], axis=1, copy=False)
+
         df = pd.DataFrame(index=table.index)
 
         for column in self.columns:
-            df = column.update_dataframe(df, table=table, validate=validate)
+            df = column.update_dataframe(df, table=table, validate=validate, cache=cache)
 
         return df
 
+    def _quarantine_chunk(self, table: pd.DataFrame, annotation_column: str, cache=None) -> t.Tuple[pd.DataFrame, pd.DataFrame]:
+        """Return the recoded valid rows and the annotated invalid source rows of ``table``.
+
+        Rows are recoded and checked under their positions, so that repeated labels never mix up
+        the valid and invalid rows: labels are only put back on the results.
+        """
+        positional_table = table.copy(deep=False)
+        positional_table.index = pd.RangeIndex(table.shape[0])
+
+        recoded_columns = [pd.DataFrame(index=positional_table.index)]
+        positions, checks = [], []
+
+        for column in self.columns:
+            recoded, failures = column._recode_and_check(positional_table, cache=cache)
+            recoded_columns.append(recoded)
+
+            for name, failed in failures:
+                rows, tests = np.nonzero(~failed.fillna(True).to_numpy(dtype=bool))
+                positions.append(failed.index.to_numpy(dtype=np.intp)[rows])
+                checks.append(np.array([f"{name}:{validator}" for validator in failed.columns], dtype=object)[tests])
+
+        positions = np.concatenate(positions) if positions else np.array([], dtype=np.intp)
+        if positions.shape[0] == 0:
+            recoded = pd.concat(recoded_columns, axis=1)
+            recoded.index = table.index
+            return recoded, table.iloc[:0].assign(**{annotation_column: []})
+
+        # the checks failed by each row, in the order of the columns and of their tests
+        order = np.argsort(positions, kind="stable")
+        positions, checks = positions[order], np.concatenate(checks)[order]
+        invalid_rows, starts = np.unique(positions, return_index=True)
+
+        quarantine = table.take(invalid_rows)
+        quarantine[annotation_column] = [part.tolist() for part in np.split(checks, starts[1:])]
+
+        # select the valid rows column by column: the recoded table is only copied once
+        is_valid = np.ones(table.shape[0], dtype=bool)
+        is_valid[invalid_rows] = False
+        valid_rows = np.flatnonzero(is_valid)
+        valid = pd.concat([recoded.take(valid_rows) for recoded in recoded_columns], axis=1, copy=False)
+        valid.index = table.index.take(valid_rows)
+
+        return valid, quarantine
+
+    def recode_quarantine(
+            self,
+            table: pd.DataFrame,
+            chunksize: int = None,
+            valid_sink: t.Callable[[pd.DataFrame], None] = None,
+            quarantine_sink: t.Callable[[pd.DataFrame], None] = None,
+            annotation_column="failed_validations",
+            cache=None,) -> t.Tuple[pd.DataFrame, pd.DataFrame]:
+        """Return the recoded rows that pass validation and a quarantine of the source rows that do not.
+
+        Every row is recoded and validated once; the rows are then split by a single combined failure
+        mask. The quarantine holds the original (not recoded) rows plus ``annotation_column``: a list of
+        the ``"column:validator"`` checks each row failed.
+
+        Args:
+            table (pd.DataFrame): A dataframe on which to apply recoding logic.
+            chunksize (int): If given, process the table this many rows at a time. Uniqueness is then
+                only checked within each chunk.
+            valid_sink (Callable): If given, called with the valid rows of each chunk instead of
+                collecting them; ``None`` is returned in their place.
+            quarantine_sink (Callable): As ``valid_sink``, for the quarantined rows.
+            annotation_column (str): Name of the column listing the failed checks in the quarantine.
+            cache (RecoderCache): If given, results of pure recoders are looked up in and saved to ``cache``.
+        """
+        if chunksize is None or table.shape[0] == 0:
+            chunks = [table]
+        else:
+            chunks = (table.iloc[start:start + chunksize] for start in range(0, table.shape[0], chunksize))
+
+        valid_parts, quarantine_parts = [], []
+        for chunk in chunks:
+            valid, quarantine = self._quarantine_chunk(chunk, annotation_column=annotation_column, cache=cache)
+
+            if valid_sink is None:
+                valid_parts.append(valid)
+            else:
+                valid_sink(valid)
+
+            if quarantine_sink is None:
+                quarantine_parts.append(quarantine)
+            else:
+                quarantine_sink(quarantine)
+
+        valid = pd.concat(valid_parts) if len(valid_parts) > 1 else next(iter(valid_parts), None)
+        quarantine = pd.concat(quarantine_parts) if quarantine_parts else None
+
+        return valid, quarantine
+
+    def preflight(self, source, sample_size=10000, head=100, tail=100, confidence=0.95, seed=None) -> pd.DataFrame:
+        """Return estimated failure rates per column from a random sample of ``source`` plus its first/last rows.
+
+        See ``table_enforcer.preflight.preflight`` for a description of the report.
+
+        Args:
+            source (pd.DataFrame, iterable): The table, or an iterable of its chunks (e.g. ``pd.read_csv(..., chunksize=n)``).
+            sample_size (int): Number of rows to sample at random.
+            head (int): Number of rows to check from the start of the table.
+            tail (int): Number of rows to check from the end of the table.
+            confidence (float): Confidence level of the intervals.
+            seed (int): Seed for the random number generator.
+        """
+        return preflight(
+            self, source, sample_size=sample_size, head=head, tail=tail, confidence=confidence, seed=seed)
+
+    def summarize(self, source) -> pd.DataFrame:
+        """Return pass/fail, null and distinct counts per (column, test), without keeping per-row results.
+
+        See ``table_enforcer.summary.summarize`` for a description of the summary.
+
+        Args:
+            source (pd.DataFrame, iterable): The table, or an iterable of its chunks. Polars
+                DataFrames/LazyFrames are summarized by a single aggregating query.
+        """
+        backend = polars_backend(source)
+        if backend is not None:
+            return backend.summarize(self, source)
+
+        return summarize(self, source)
+
+    def validator_stats(self) -> pd.DataFrame:
+        """Return the observed calls, rows, seconds and failures of each test, indexed by (column, validator).
+
+        Members of compound columns are listed under their own names. These statistics decide the
+        order in which tests run when only failed rows are wanted (see ``table_enforcer.adaptive``).
+        """
+        frames = {}
+        for column in self.columns:
+            for member in getattr(column, "input_columns", []) + getattr(column, "output_columns", [column]):
+                frames[member.name] = member.validator_stats.to_frame()
+
+        if not frames:
+            return pd.DataFrame(columns=STATS_COLUMNS, index=pd.MultiIndex.from_tuples([], names=["column", "validator"]))
+        return pd.concat(frames, names=["column", "validator"])
+
+    def validate_bitmaps(self, table: pd.DataFrame) -> t.List[t.Tuple[str, ValidationBitmap]]:
+        """Return ``(name, bitmap)`` with the validation results of every (member) column packed into a ``ValidationBitmap``.
+
+        Members of compound columns are listed inputs first, then outputs: an output named like an
+        input gets its own pair.
+
+        Results take one bit per row and test; see ``table_enforcer.bitmap`` for the reductions
+        available without unpacking them.
+
+        Args:
+            table (pd.DataFrame): A dataframe on which to apply validation logic.
+        """
+        bitmaps = []
+        for column in self.columns:
+            bitmaps.extend(column.validate_bitmaps(table))
+        return bitmaps
+
+    def validate_many(self, tables):
+        """Return whether each of ``tables`` passes all validation tests, validating them as one batch.
+
+        Amortizes the per-call cost over many small tables: see ``table_enforcer.batch``. The result is
+        a ``dict`` of bools keyed like ``tables`` if it is a mapping, otherwise a list of bools. Unique
+        columns only need to be unique within each table.
+
+        Args:
+            tables (Mapping, Iterable): DataFrames keyed by source key, or a sequence of DataFrames.
+        """
+        return validate_many(self, tables)
+
+    def recode_many(self, tables, validate=False, cache=None):
+        """Return each of ``tables`` fully recoded, recoding them as one batch.
+
+        The result is a ``dict`` of DataFrames keyed like ``tables`` if it is a mapping, otherwise a
+        list of DataFrames; each keeps the index of its source table.
+
+        Args:
+            tables (Mapping, Iterable): DataFrames keyed by source key, or a sequence of DataFrames.
+            validate (bool): If ``True``, recoded tables must pass validation tests. Failures are
+                reported by ``(source, row)``.
+            cache (RecoderCache): If given, results of pure recoders are looked up in and saved to ``cache``.
+        """
+        return recode_many(self, tables, validate=validate, cache=cache)
+
+    async def _map_columns(self, func, executor=None, max_concurrency=None, timeout=None) -> list:
+        """Return the results of ``func(column)`` for each column, each call running in ``executor``.
+
+        The event loop is free to serve other tasks while columns are processed. If the returned
+        coroutine is cancelled or times out, columns that have not started yet are never run; a
+        column already running in a worker thread finishes in the background.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run(column):
+            if semaphore is None:
+                return await loop.run_in_executor(executor, func, column)
+            async with semaphore:
+                return await loop.run_in_executor(executor, func, column)
+
+        return await asyncio.wait_for(asyncio.gather(*[run(column) for column in self.columns]), timeout)
+
+    async def avalidate(self, table: pd.DataFrame, executor=None, max_concurrency=None, timeout=None) -> bool:
+        """Return True if all validation tests pass: False otherwise, without blocking the event loop.
+
+        Args:
+            table (pd.DataFrame): A dataframe on which to apply validation logic.
+            executor (concurrent.futures.Executor): Where to run column work (default: the loop's default executor).
+            max_concurrency (int): Maximum number of columns processed at once (default: no limit).
+            timeout (float): Seconds after which to raise ``asyncio.TimeoutError`` (default: no limit).
+        """
+        validations = await self._map_columns(
+            lambda column: column.validate(table),
+            executor=executor,
+            max_concurrency=max_concurrency,
+            timeout=timeout,)
+
+        return all(df.all().all() for df in validations)
+
+    async def arecode(
+            self,
+            table: pd.DataFrame,
+            validate=False,
+            cache=None,
+            executor=None,
+            max_concurrency=None,
+            timeout=None,) -> pd.DataFrame:
+        """Return a fully recoded dataframe without blocking the event loop.
+
+        Args:
+            table (pd.DataFrame): A dataframe on which to apply recoding logic.
+            validate (bool): If ``True``, recoded table must pass validation tests.
+            cache (RecoderCache): If given, results of pure recoders are looked up in and saved to ``cache``.
+            executor (concurrent.futures.Executor): Where to run column work (default: the loop's default executor).
+            max_concurrency (int): Maximum number of columns processed at once (default: no limit).
+            timeout (float): Seconds after which to raise ``asyncio.TimeoutError`` (default: no limit).
+        """
+        recoded_columns = await self._map_columns(
+            lambda column: column.recode(table=table, validate=validate, cache=cache),
+            executor=executor,
+            max_concurrency=max_concurrency,
+            timeout=timeout,)
+
+        return pd.concat([pd.DataFrame(index=table.index), *recoded_columns], axis=1)
+
 
 class BaseColumn(object):
     """Base Class for Columns.
@@ -77,27 +566,83 @@ class BaseColumn(object):
     Lays out essential methods api.
     """
 
-    def update_dataframe(self, df, table, validate=False):
+    profiler = None
+
+    @property
+    def fingerprint(self) -> str:
+        """Return a hex digest identifying this column definition.
+
+        Derived from names, dtypes, uniqueness flags and validator/recoder identities. Computed on
+        first access and memoized: build a new column object after changing its definition.
+        """
+        if getattr(self, "_fingerprint", None) is None:
+            self._fingerprint = digest(type(self).__name__, self._identity())
+        return self._fingerprint
+
+    def _identity(self) -> list:
+        """Return the schema-relevant attributes from which ``self.fingerprint`` is derived."""
+        raise NotImplementedError("This method must be defined for each subclass.")
+
+    def set_profiler(self, profiler: Profiler) -> None:
+        """Record the cost of every validator/recoder call in ``profiler`` (``None`` to stop profiling)."""
+        self.profiler = profiler
+
+    def update_dataframe(self, df, table, validate=False, cache=None):
         """Perform ``self.recode`` and add resulting column(s) to ``df`` and return ``df``."""
         df = df.copy()
-        recoded_columns = self.recode(table=table, validate=validate)
+        recoded_columns = self.recode(table=table, validate=validate, cache=cache)
         return pd.concat([df, recoded_columns], axis=1)
 
-    def validate(self, table: pd.DataFrame, failed_only=False) -> pd.DataFrame:
+    def validate(self, table: pd.DataFrame, failed_only=False, full=False) -> pd.DataFrame:
         """Return a dataframe of validation results for the appropriate series vs the vector of validators.
 
         Args:
             table (pd.DataFrame): A dataframe on which to apply validation logic.
             failed_only (bool): If ``True``: return only the indexes that failed to validate.
+            full (bool): If ``True``, run every test on every failed row. Otherwise, with ``failed_only``,
+                tests run in adaptive order and results of tests a failed row was spared are null
+                (see ``table_enforcer.adaptive``).
+        """
+        raise NotImplementedError("This method must be defined for each subclass.")
+
+    def validate_bitmaps(self, table: pd.DataFrame) -> t.List[t.Tuple[str, ValidationBitmap]]:
+        """Return ``(name, bitmap)`` with the validation results of ``table`` packed for each (member) column.
+
+        Args:
+            table (pd.DataFrame): A dataframe on which to apply validation logic.
+        """
+        raise NotImplementedError("This method must be defined for each subclass.")
+
+    def _passes(self, table: pd.DataFrame) -> bool:
+        """Return True if every row of ``table`` passes every validation test, stopping at the first failure."""
+        raise NotImplementedError("This method must be defined for each subclass.")
+
+    def _check(self, table: pd.DataFrame, groups=None, full=True) -> t.List[t.Tuple[str, pd.DataFrame]]:
+        """Return ``(name, failed)`` with the failed-only validation results of ``table`` for each (member) column.
+
+        Members are listed in order, inputs before outputs: an input and an output of the same name
+        each get their own pair. If ``groups`` (an array of one group code per row) is given, values of unique columns only
+        need to be unique among the rows of the same group. ``full`` is as for ``validate``.
+        """
+        raise NotImplementedError("This method must be defined for each subclass.")
+
+    def _recode_and_check(self, table: pd.DataFrame, cache=None, groups=None,
+                          full=True) -> t.Tuple[pd.DataFrame, t.List[t.Tuple[str, pd.DataFrame]]]:
+        """Return the recoded column(s) and the failed-only validation results of the recoded data.
+
+        Unlike ``recode(validate=True)``, validation failures are returned rather than raised.
+        ``groups`` and ``full`` are as for ``_check``.
         """
         raise NotImplementedError("This method must be defined for each subclass.")
 
-    def recode(self, table: pd.DataFrame, validate=False) -> pd.DataFrame:
+    def recode(self, table: pd.DataFrame, validate=False, cache=None, spill=None) -> pd.DataFrame:
         """Pass the appropriate columns through each recoder function sequentially and return the final result.
 
         Args:
             table (pd.DataFrame): A dataframe on which to apply recoding logic.
             validate (bool): If ``True``, recoded table must pass validation tests.
+            cache (RecoderCache): If given, results of pure recoders are looked up in and saved to ``cache``.
+            spill (SpillDirectory): If given, recoded columns are written to ``spill`` and read back memory-mapped.
         """
         raise NotImplementedError("This method must be defined for each subclass.")
 
@@ -131,6 +676,23 @@ class Column(BaseColumn):
         self.unique = unique
         self.validators = self._dict_of_funcs(validators)
         self.recoders = self._dict_of_funcs(recoders)
+        self._fingerprint = None
+
+    def _identity(self) -> list:
+        """Return the schema-relevant attributes from which ``self.fingerprint`` is derived."""
+        return [
+            self.name,
+            self.dtype,
+            self.unique,
+            [function_identity(func) for func in self.validators.values()],
+            [function_identity(func) for func in self.recoders.values()],
+        ]
+
+    def _call(self, kind: str, name: str, func, series: pd.Series) -> pd.Series:
+        """Return ``func(series)``, recording its cost if a profiler is attached."""
+        if self.profiler is None:
+            return func(series)
+        return self.profiler.call(self.name, kind, name, func, series)
 
     def _dict_of_funcs(self, funcs: list) -> pd.Series:
         """Return a pd.Series of functions with index derived from the function name."""
@@ -149,60 +711,189 @@ class Column(BaseColumn):
         if series.name != name:
             raise ValueError(f"The name of provided series '{series.name}' does not match this column's name '{name}'.")
 
-    def validate(self, table: pd.DataFrame, failed_only=False) -> pd.DataFrame:
+    def validate(self, table: pd.DataFrame, failed_only=False, full=False) -> pd.DataFrame:
         """Return a dataframe of validation results for the appropriate series vs the vector of validators.
 
         Args:
             table (pd.DataFrame): A dataframe on which to apply validation logic.
             failed_only (bool): If ``True``: return only the indexes that failed to validate.
+            full (bool): If ``True``, run every test on every failed row. Otherwise, with ``failed_only``,
+                tests run in adaptive order and results of tests a failed row was spared are null
+                (see ``table_enforcer.adaptive``).
         """
+        backend = polars_backend(table)
+        if backend is not None:
+            return backend.validate_column(self, table, failed_only=failed_only)
+
         series = table[self.name]
 
         self._check_series_name(series)
 
-        validators = self.validators
+        if failed_only and not full:
+            return label_rows(self._validate_failed(series), series.index)
+
+        if failed_only:
+            return label_rows(self._validate_bitmap(series).failed_frame(), series.index)
+
+        return label_rows(self._validate_positions(series), series.index)
 
-        results = pd.DataFrame({validator: series for validator in validators}, index=series.index)
+    def validate_bitmaps(self, table: pd.DataFrame) -> t.List[t.Tuple[str, ValidationBitmap]]:
+        """Return ``[(name, bitmap)]`` with the validation results of ``table`` packed into a ``ValidationBitmap``.
 
-        for name, func in validators.items():
-            results[name] = func(results[name])
+        Every test runs on every row, but results are packed as soon as each test returns: memory
+        holds one unpacked result at a time, plus one bit per row and test.
 
-        results['dtype'] = self._validate_series_dtype(series)
+        Args:
+            table (pd.DataFrame): A dataframe on which to apply validation logic.
+        """
+        series = table[self.name]
+        self._check_series_name(series)
+        bitmap = self._validate_bitmap(series)
+        bitmap.index = series.index
+        return [(self.name, bitmap)]
+
+    @property
+    def validator_stats(self) -> ValidatorStats:
+        """Return the observed cost and failure rate of each test of this column, across calls."""
+        if getattr(self, "_validator_stats", None) is None:
+            self._validator_stats = ValidatorStats()
+        return self._validator_stats
+
+    def _tests(self, groups=None) -> list:
+        """Return ``(name, function, row_local)`` for each test, in the order of the validation results' columns.
+
+        If ``groups`` (an array of one group code per row) is given, values only need to be unique
+        among the rows of the same group.
+        """
+        tests = [(name, func, getattr(func, "row_local", True)) for name, func in self.validators.items()]
+        tests.append(("dtype", self._validate_series_dtype, True))
 
         if self.unique:
-            results['unique'] = v.funcs.unique(series)
+            unique = v.funcs.unique if groups is None else functools.partial(unique_within, groups)
+            tests.append(("unique", unique, False))
 
-        if failed_only:
-            results = find_failed_rows(results)
+        return tests
 
-        return results
+    def _timed_tests(self, series: pd.Series, groups=None) -> t.Iterator[t.Tuple[str, t.Any, float]]:
+        """Yield ``(name, result, seconds)`` for each test run on the positionally indexed ``series``."""
+        for name, func, _ in self._tests(groups):
+            start = time.perf_counter()
+            result = self._call("validator", name, func, series)
+            yield name, result, time.perf_counter() - start
+
+    def _validate_positions(self, series: pd.Series, groups=None) -> pd.DataFrame:
+        """Return the validation results of ``series`` indexed by row position, leaving its labels aside.
+
+        Validators receive the values of ``series`` under a ``RangeIndex``, so results never need to
+        be aligned on string or non-monotonic indexes. ``groups`` is as for ``_tests``.
+        """
+        series = positional(series)
+        stats = self.validator_stats
+        results = {}
+
+        for name, result, seconds in self._timed_tests(series, groups):
+            passed = to_bool(pd.Series(result))
+            stats.record(name, len(passed), seconds, len(passed) - int(np.count_nonzero(passed.to_numpy())))
+            results[name] = result
+
+        return pd.DataFrame(results, index=series.index)
+
+    def _validate_bitmap(self, series: pd.Series, groups=None) -> ValidationBitmap:
+        """Return the validation results of ``series`` packed into a bitmap indexed by row position."""
+        series = positional(series)
+        stats = self.validator_stats
+        bitmap = ValidationBitmap(series.shape[0])
+
+        for name, result, seconds in self._timed_tests(series, groups):
+            if isinstance(result, pd.Series) and not result.index.equals(series.index):
+                result = result.reindex(series.index)
+            stats.record(name, bitmap.rows, seconds, bitmap.add(name, result))
+
+        return bitmap
+
+    def _validate_failed(self, series: pd.Series, groups=None) -> pd.DataFrame:
+        """Return the adaptively computed results of the rows of ``series`` that fail, indexed by row position."""
+        failed, _ = run_tests(self, positional(series), self._tests(groups))
+        return failed
+
+    def _passes(self, table: pd.DataFrame) -> bool:
+        """Return True if every row of ``table`` passes every validation test, stopping at the first failure."""
+        series = table[self.name]
+        self._check_series_name(series)
+        failed, _ = run_tests(self, positional(series), self._tests(), stop_on_failure=True)
+        return failed is not None and failed.shape[0] == 0
+
+    def _check(self, table: pd.DataFrame, groups=None, full=True) -> t.List[t.Tuple[str, pd.DataFrame]]:
+        """Return ``[(name, failed)]`` with the failed-only validation results of ``table``."""
+        if groups is None:
+            return [(self.name, self.validate(table, failed_only=True, full=full))]
 
-    def recode(self, table: pd.DataFrame, validate=False) -> pd.DataFrame:
+        series = table[self.name]
+        self._check_series_name(series)
+        if full:
+            failed = self._validate_bitmap(series, groups=groups).failed_frame()
+        else:
+            failed = self._validate_failed(series, groups=groups)
+        return [(self.name, label_rows(failed, series.index))]
+
+    def _recode_and_check(self, table: pd.DataFrame, cache=None, groups=None,
+                          full=True) -> t.Tuple[pd.DataFrame, t.List[t.Tuple[str, pd.DataFrame]]]:
+        """Return the recoded column and the failed-only validation results of the recoded data."""
+        recoded = self.recode(table, cache=cache)
+        return recoded, self._check(recoded, groups=groups, full=full)
+
+    def recode(self, table: pd.DataFrame, validate=False, cache=None, spill=None) -> pd.DataFrame:
         """Pass the provided series obj through each recoder function sequentially and return the final result.
 
         Args:
             table (pd.DataFrame): A dataframe on which to apply recoding logic.
             validate (bool): If ``True``, recoded table must pass validation tests.
+            cache (RecoderCache): If given, results of pure recoders are looked up in and saved to ``cache``.
+            spill (SpillDirectory): If given, recoded columns are written to ``spill`` and read back memory-mapped.
         """
+        backend = polars_backend(table, cache=cache, spill=spill)
+        if backend is not None:
+            return backend.recode_column(self, table, validate=validate)
+
         series = table[self.name]
 
         self._check_series_name(series)
 
         col = self.name
 
-        data = series.copy()
+        # copy the caller's data at most once: before the first recoder that may modify its input
+        data = series
+        owned = False
+
+        for name, recoder in self.recoders.items():
+            func = recoder
+            if cache is not None and getattr(recoder, "pure", False):
+                func = functools.partial(cache.apply, recoder)
+
+            mutates = getattr(recoder, "inplace", None) is not False
+            if mutates and not owned:
+                data = data.copy()
+                owned = True
 
-        for recoder in self.recoders.values():
             try:
-                data = recoder(data)
+                recoded = self._call("recoder", name, func, data)
             except (BaseException) as err:
                 raise RecodingError(col, recoder, err)
 
+            owned = owned or recoded is not data
+            data = recoded
+
+        if not owned:
+            data = data.copy()
+
         if validate:
-            failed_rows = find_failed_rows(self.validate(data.to_frame()))
+            failed_rows = self.validate(data.to_frame(), failed_only=True)
             if failed_rows.shape[0] > 0:
                 raise ValidationError(f"Rows that failed to validate for column '{self.name}':\n{failed_rows}")
 
+        if spill is not None:
+            return spill.spill(data.to_frame())
+
         return data.to_frame()
 
 
@@ -224,21 +915,43 @@ class CompoundColumn(BaseColumn):
         self.input_columns = input_columns
         self.output_columns = output_columns
         self.column_transform = column_transform
-
-    def _do_validation_set(self, table: pd.DataFrame, columns, validation_type, failed_only=False) -> pd.DataFrame:
-        """Return a dataframe of validation results for the appropriate series vs the vector of validators."""
-        validations = []
+        self._fingerprint = None
+
+    def set_profiler(self, profiler: Profiler) -> None:
+        """Record the cost of every validator/recoder call in ``profiler`` (``None`` to stop profiling)."""
+        self.profiler = profiler
+        for column in self.input_columns + self.output_columns:
+            column.set_profiler(profiler)
+
+    def _identity(self) -> list:
+        """Return the schema-relevant attributes from which ``self.fingerprint`` is derived."""
+        return [
+            [column.fingerprint for column in self.input_columns],
+            [column.fingerprint for column in self.output_columns],
+            function_identity(self.column_transform),
+        ]
+
+    def _validation_parts(self, table: pd.DataFrame, columns, validation_type, failed_only=False,
+                          full=True) -> t.List[t.Tuple[str, str, pd.DataFrame]]:
+        """Return ``(validation_type, column_name, results)`` for each of ``columns``, results indexed by row position."""
+        parts = []
 
         for column in columns:
-            validation = column.validate(table=table, failed_only=failed_only)
-            validation["column_name"] = column.name
-            validation["validation_type"] = validation_type
-            validations.append(validation)
+            series = table[column.name]
+            column._check_series_name(series)
+            if not failed_only:
+                validation = column._validate_positions(series)
+            elif full:
+                validation = column._validate_bitmap(series).failed_frame()
+            else:
+                validation = column._validate_failed(series)
+            parts.append((validation_type, column.name, validation))
+
+        return parts
 
-        validation_table = pd.concat(validations)
-        validation_table.index.name = 'row'
-
-        return validation_table.reset_index().set_index(["validation_type", "column_name", "row"])
+    def _do_validation_set(self, table: pd.DataFrame, columns, validation_type, failed_only=False) -> pd.DataFrame:
+        """Return a dataframe of validation results for the appropriate series vs the vector of validators."""
+        return stack_validations(self._validation_parts(table, columns, validation_type, failed_only), table.index)
 
     def _validate_input(self, table: pd.DataFrame, failed_only=False) -> pd.DataFrame:
         """Return a dataframe of validation results for the appropriate series vs the vector of validators."""
@@ -248,17 +961,54 @@ class CompoundColumn(BaseColumn):
             validation_type="input",
             failed_only=failed_only,)
 
-    def _recode_set(self, table: pd.DataFrame, columns, validate=False) -> pd.DataFrame:
+    def _passes(self, table: pd.DataFrame) -> bool:
+        """Return True if every row of ``table`` passes the tests of every input and output column.
+
+        The transform is only run once every input column has passed.
+        """
+        if not all(column._passes(table) for column in self.input_columns):
+            return False
+        transformed_columns = self.column_transform(table)
+        return all(column._passes(transformed_columns) for column in self.output_columns)
+
+    def _check(self, table: pd.DataFrame, groups=None, full=True) -> t.List[t.Tuple[str, pd.DataFrame]]:
+        """Return ``(name, failed)`` with the failed-only validation results of each input, then output, column."""
+        failures = []
+        transformed_columns = self.column_transform(table)
+
+        for column in self.input_columns:
+            failures.extend(column._check(table, groups=groups, full=full))
+        for column in self.output_columns:
+            failures.extend(column._check(transformed_columns, groups=groups, full=full))
+
+        return failures
+
+    def _recode_and_check(self, table: pd.DataFrame, cache=None, groups=None,
+                          full=True) -> t.Tuple[pd.DataFrame, t.List[t.Tuple[str, pd.DataFrame]]]:
+        """Return the recoded output columns and the failed-only validation results of every recoded member."""
+        failures = []
+
+        recoded_input = self._recode_input(table, cache=cache)
+        for column in self.input_columns:
+            failures.extend(column._check(recoded_input, groups=groups, full=full))
+
+        recoded_output = self._recode_output(recoded_input, cache=cache)
+        for column in self.output_columns:
+            failures.extend(column._check(recoded_output, groups=groups, full=full))
+
+        return recoded_output, failures
+
+    def _recode_set(self, table: pd.DataFrame, columns, validate=False, cache=None, spill=None) -> pd.DataFrame:
         recoded_columns = []
 
         for column in columns:
-            recoded = column.recode(table=table, validate=validate)
+            recoded = column.recode(table=table, validate=validate, cache=cache, spill=spill)
             recoded_columns.append(recoded)
 
-        return pd.concat(recoded_columns, axis=1)
+        return pd.concat(recoded_columns, axis=1, copy=spill is None)
 
-    def _recode_input(self, table: pd.DataFrame, validate=False) -> pd.DataFrame:
-        return self._recode_set(table=table, columns=self.input_columns, validate=validate)
+    def _recode_input(self, table: pd.DataFrame, validate=False, cache=None, spill=None) -> pd.DataFrame:
+        return self._recode_set(table=table, columns=self.input_columns, validate=validate, cache=cache, spill=spill)
 
     def _validate_output(self, table: pd.DataFrame, failed_only=False) -> pd.DataFrame:
         transformed_columns = self.column_transform(table)
@@ -268,27 +1018,67 @@ class CompoundColumn(BaseColumn):
             validation_type="output",
             failed_only=failed_only,)
 
-    def _recode_output(self, table: pd.DataFrame, validate=False) -> pd.DataFrame:
+    def _recode_output(self, table: pd.DataFrame, validate=False, cache=None, spill=None) -> pd.DataFrame:
         transformed_columns = self.column_transform(table)
-        return self._recode_set(table=transformed_columns, columns=self.output_columns, validate=validate)
+        if spill is not None:
+            transformed_columns = spill.spill(transformed_columns)
+        return self._recode_set(
+            table=transformed_columns, columns=self.output_columns, validate=validate, cache=cache, spill=spill)
 
-    def validate(self, table: pd.DataFrame, failed_only=False) -> pd.DataFrame:
+    def validate(self, table: pd.DataFrame, failed_only=False, full=False) -> pd.DataFrame:
         """Return a dataframe of validation results for the appropriate series vs the vector of validators.
 
         Args:
             table (pd.DataFrame): A dataframe on which to apply validation logic.
             failed_only (bool): If ``True``: return only the indexes that failed to validate.
+            full (bool): If ``True``, run every test on every failed row. Otherwise, with ``failed_only``,
+                tests run in adaptive order and tests a failed row was spared read as passing, like the
+                tests of other members.
         """
+        backend = polars_backend(table)
+        if backend is not None:
+            return backend.validate_column(self, table, failed_only=failed_only)
+
+        transformed_columns = self.column_transform(table)
+        input_parts = self._validation_parts(table, self.input_columns, "input", failed_only, full)
+        output_parts = self._validation_parts(transformed_columns, self.output_columns, "output", failed_only, full)
+
+        if transformed_columns.index is table.index or transformed_columns.index.equals(table.index):
+            return stack_validations(input_parts + output_parts, table.index).fillna(True)
+
         return pd.concat([
-            self._validate_input(table, failed_only=failed_only),
-            self._validate_output(table, failed_only=failed_only),
+            stack_validations(input_parts, table.index),
+            stack_validations(output_parts, transformed_columns.index),
         ]).fillna(True)
 
-    def recode(self, table: pd.DataFrame, validate=False) -> pd.DataFrame:
+    def validate_bitmaps(self, table: pd.DataFrame) -> t.List[t.Tuple[str, ValidationBitmap]]:
+        """Return ``(name, bitmap)`` with the packed validation results of each input, then output, column.
+
+        Args:
+            table (pd.DataFrame): A dataframe on which to apply validation logic.
+        """
+        bitmaps = []
+        transformed_columns = self.column_transform(table)
+
+        for column in self.input_columns:
+            bitmaps.extend(column.validate_bitmaps(table))
+        for column in self.output_columns:
+            bitmaps.extend(column.validate_bitmaps(transformed_columns))
+
+        return bitmaps
+
+    def recode(self, table: pd.DataFrame, validate=False, cache=None, spill=None) -> pd.DataFrame:
         """Pass the appropriate columns through each recoder function sequentially and return the final result.
 
         Args:
             table (pd.DataFrame): A dataframe on which to apply recoding logic.
             validate (bool): If ``True``, recoded table must pass validation tests.
+            cache (RecoderCache): If given, results of pure recoders are looked up in and saved to ``cache``.
+            spill (SpillDirectory): If given, recoded columns are written to ``spill`` and read back memory-mapped.
         """
-        return self._recode_output(self._recode_input(table, validate=validate), validate=validate)
+        backend = polars_backend(table, cache=cache, spill=spill)
+        if backend is not None:
+            return backend.recode_column(self, table, validate=validate)
+
+        recoded_input = self._recode_input(table, validate=validate, cache=cache, spill=spill)
+        return self._recode_output(recoded_input, validate=validate, cache=cache, spill=spill)
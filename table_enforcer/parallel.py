@@ -0,0 +1,122 @@
+"""Validate and recode the columns of a table in a pool of worker processes.
+
+The table is handed to the workers as a ``SharedTable`` (see ``table_enforcer.shared``): each
+worker maps the shared column buffers once instead of being sent a pickled copy of the table with
+every task. Each task then processes one column of the ``Enforcer`` and returns whether it passes,
+or the handle of its recoded column(s), written back to shared memory.
+
+Workers are forked by default, so they inherit the enforcer as it is: validators and recoders may
+be lambdas or closures. With another start method (e.g. ``mp_context="spawn"``), the columns must
+be picklable.
+"""
+import multiprocessing
+import typing as t
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import pandas as pd
+
+from table_enforcer.cache import RecoderCache
+from table_enforcer.shared import SharedTable, attach
+from table_enforcer.spill import SpillDirectory, SpilledFrame
+
+__all__ = [
+    "validate",
+    "recode",
+]
+
+# state of the current worker process, set up by ``_init_worker``
+_WORKER = {}
+
+
+def _init_worker(columns: list, handle: SpilledFrame, cache_options: t.Optional[tuple]) -> None:
+    """Attach the shared table and open the recoder cache once per worker process."""
+    _WORKER["columns"] = columns
+    _WORKER["table"] = attach(handle)
+    # SQLite connections must not cross a fork: every worker opens its own
+    _WORKER["cache"] = RecoderCache(*cache_options) if cache_options is not None else None
+
+
+def _column_passes(position: int) -> bool:
+    return _WORKER["columns"][position]._passes(_WORKER["table"])
+
+
+def _recode_column(position: int, validate: bool, path: str) -> SpilledFrame:
+    column = _WORKER["columns"][position]
+    recoded = column.recode(_WORKER["table"], validate=validate, cache=_WORKER["cache"])
+    # the parent puts the labels back: only the values need to be shared
+    recoded.index = pd.RangeIndex(recoded.shape[0])
+    return SpillDirectory(path).dump(recoded)
+
+
+def _pool(enforcer, shared: SharedTable, jobs: int, mp_context, cache=None) -> ProcessPoolExecutor:
+    """Return a pool of at most ``jobs`` workers, one per column at most, each attached to ``shared``."""
+    if isinstance(mp_context, str):
+        mp_context = multiprocessing.get_context(mp_context)
+
+    cache_options = (cache.path, cache.max_entries) if cache is not None else None
+    return ProcessPoolExecutor(
+        max_workers=max(1, min(jobs, len(enforcer.columns))),
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(enforcer.columns, shared.handle, cache_options),)
+
+
+def validate(enforcer, table: pd.DataFrame, jobs: int, mp_context="fork") -> bool:
+    """Return True if all validation tests pass, validating the columns in ``jobs`` worker processes.
+
+    Returns False as soon as any column fails; columns not started yet are then never validated.
+
+    Args:
+        enforcer (Enforcer): The table definition.
+        table (pd.DataFrame): A dataframe on which to apply validation logic.
+        jobs (int): Number of worker processes.
+        mp_context (str, multiprocessing.context.BaseContext): How to start the workers.
+    """
+    if not enforcer.columns:
+        return True
+
+    with SharedTable(table) as shared:
+        with _pool(enforcer, shared, jobs, mp_context) as pool:
+            pending = {pool.submit(_column_passes, position) for position in range(len(enforcer.columns))}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    if not all(future.result() for future in done):
+                        return False
+                return True
+            finally:
+                # columns not started yet are never validated (``shutdown(cancel_futures=True)`` needs Python 3.9)
+                for future in pending:
+                    future.cancel()
+
+
+def recode(enforcer, table: pd.DataFrame, jobs: int, validate=False, cache=None, mp_context="fork") -> pd.DataFrame:
+    """Return a fully recoded dataframe, recoding the columns in ``jobs`` worker processes.
+
+    Recoded columns are written back to shared memory by the workers and copied once into the result.
+
+    Args:
+        enforcer (Enforcer): The table definition.
+        table (pd.DataFrame): A dataframe on which to apply recoding logic.
+        jobs (int): Number of worker processes.
+        validate (bool): If ``True``, recoded table must pass validation tests.
+        cache (RecoderCache): If given, results of pure recoders are looked up in and saved to
+            ``cache``; each worker opens its own connection to it.
+        mp_context (str, multiprocessing.context.BaseContext): How to start the workers.
+    """
+    if not enforcer.columns:
+        return pd.DataFrame(index=table.index)
+
+    with SharedTable(table) as shared:
+        with _pool(enforcer, shared, jobs, mp_context, cache=cache) as pool:
+            futures = [
+                pool.submit(_recode_column, position, validate, str(Path(shared.directory.path) / f"column{position}"))
+                for position in range(len(enforcer.columns))
+            ]
+            recoded_columns = [attach(future.result()) for future in futures]
+
+        recoded = pd.concat([pd.DataFrame(index=pd.RangeIndex(table.shape[0])), *recoded_columns], axis=1)
+
+    recoded.index = table.index
+    return recoded
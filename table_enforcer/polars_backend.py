@@ -0,0 +1,548 @@
+"""Validate and recode Polars DataFrames/LazyFrames as Polars query plans.
+
+``Enforcer``, ``Column`` and ``CompoundColumn`` hand Polars tables to this module. Builtin validators,
+recoders and column transforms are translated into Polars expressions (see ``EXPRESSIONS`` and
+``register_expression``), so a whole schema runs as one optimized, multithreaded query. Any other
+function, e.g. a custom validator written for ``pandas.Series``, still works: it is wrapped in an
+expression that converts its input to pandas and its output back (``map_batches``).
+
+The results follow the pandas backend: validation results hold one boolean column per validator plus
+``dtype`` (and ``unique``), with a leading ``row`` column in place of the pandas index. Null results
+count as passing, as they do in ``find_failed_rows``. Recoding returns a DataFrame for a DataFrame
+and a LazyFrame for a LazyFrame.
+"""
+import typing as t
+
+import pandas as pd
+import polars as pl
+
+from table_enforcer.errors import ValidationError
+from table_enforcer.summary import _frame as _summary_frame
+from table_enforcer.utils import recode as r
+from table_enforcer.utils import transform as tr
+from table_enforcer.utils import validate as v
+
+__all__ = [
+    "EXPRESSIONS",
+    "register_expression",
+    "is_polars",
+    "validate_column",
+    "recode_column",
+    "validate",
+    "recode",
+    "summarize",
+]
+
+ROW_COLUMN = "row"
+
+# builtin function -> callable turning the expression of its input into the expression of its output
+EXPRESSIONS = {}
+
+# name recorded in the ``spec`` of builtin decorators/transforms -> callable building its expression(s)
+SPEC_EXPRESSIONS = {}
+
+POLARS_DTYPES = {int: pl.Int64, float: pl.Float64, str: pl.Utf8, bool: pl.Boolean}
+
+
+def register_expression(func):
+    """Register the decorated callable as the Polars translation of the builtin ``func``.
+
+    The callable receives the expression of ``func``'s input and returns the expression of its output,
+    or ``None`` if this particular use cannot be translated.
+    """
+    def decorator(translator):
+        """Register the translator."""
+        EXPRESSIONS[func] = translator
+        return translator
+
+    return decorator
+
+
+def _register_spec(name):
+    """Register the decorated callable as the translation of builtins whose ``spec`` is named ``name``."""
+    def decorator(translator):
+        """Register the translator."""
+        SPEC_EXPRESSIONS[name] = translator
+        return translator
+
+    return decorator
+
+
+def is_polars(table) -> bool:
+    """Return True if ``table`` is a Polars DataFrame or LazyFrame."""
+    return isinstance(table, (pl.DataFrame, pl.LazyFrame))
+
+
+def _identity(series):
+    return series
+
+
+def _is_identity(func) -> bool:
+    """Return True if ``func`` is a plain function returning its only argument unchanged."""
+    code = getattr(func, "__code__", None)
+    reference = _identity.__code__
+    if code is None or code.co_argcount != 1 or code.co_names:
+        return False
+    return code.co_code == reference.co_code and code.co_consts == reference.co_consts
+
+
+# the code of the wrapper each parameterized builtin returns -> the name in its ``spec``
+_BUILTIN_CODES = {
+    v.decorators.minmax(0, 0)(_identity).__code__: "minmax",
+    v.decorators.choice([])(_identity).__code__: "choice",
+    v.decorators.bounded_length(0)(_identity).__code__: "bounded_length",
+    v.decorators.match("")(_identity).__code__: "match",
+    r.decorators.replace("", "")(_identity).__code__: "replace",
+    tr.funcs.split("", [""], "").__code__: "split",
+    tr.funcs.extract("", "()").__code__: "extract",
+    tr.funcs.fixed_width("", [1], [""]).__code__: "fixed_width",
+}
+
+
+def _spec(func):
+    """Return the ``spec`` recorded by the builtin that built ``func``, or None."""
+    spec = getattr(func, "spec", None)
+    code = getattr(func, "__code__", None)
+    if spec is None or _BUILTIN_CODES.get(code) != spec[0]:
+        # ``functools.wraps`` copies ``spec`` onto the wrappers of other decorators: ignore those
+        return None
+    return spec
+
+
+def _unwrap_schema_function(func):
+    """Return the function behind a ``table_enforcer.schema.SchemaFunction``, or ``func`` itself."""
+    inner = getattr(func, "_func", None)
+    if inner is not None and type(func).__name__ == "SchemaFunction":
+        return inner
+    return func
+
+
+def _native_regex(pattern: str) -> bool:
+    """Return True if Polars' regex engine accepts ``pattern``."""
+    try:
+        pl.Series([""]).str.contains(pattern)
+    except Exception:
+        return False
+    return True
+
+
+def _translate(func, expr: pl.Expr) -> t.Optional[pl.Expr]:
+    """Return the expression for ``func`` applied to ``expr``, or None if ``func`` has no translation."""
+    func = _unwrap_schema_function(func)
+
+    if _is_identity(func):
+        return expr
+
+    try:
+        translator = EXPRESSIONS.get(func)
+    except TypeError:
+        translator = None
+    if translator is not None:
+        return translator(expr)
+
+    spec = _spec(func)
+    if spec is None or spec[0] not in SPEC_EXPRESSIONS:
+        return None
+
+    inner = _translate(func.__wrapped__, expr)
+    if inner is None:
+        return None
+    return SPEC_EXPRESSIONS[spec[0]](inner, **spec[1])
+
+
+def _fallback(func, expr: pl.Expr, name: str) -> pl.Expr:
+    """Return an expression applying the pandas function ``func`` to ``expr``."""
+    def apply(series: pl.Series) -> pl.Series:
+        result = func(series.to_pandas().rename(name))
+        return pl.from_pandas(pd.Series(result).reset_index(drop=True))
+
+    return expr.map_batches(apply)
+
+
+def _expression(func, expr: pl.Expr, name: str) -> pl.Expr:
+    translated = _translate(func, expr)
+    if translated is None:
+        return _fallback(func, expr, name)
+    return translated
+
+
+# Builtin validators
+
+@register_expression(v.funcs.not_null)
+def _not_null(expr):
+    return expr.is_not_null()
+
+
+@register_expression(v.funcs.positive)
+def _positive(expr):
+    return (expr > 0).fill_null(False)
+
+
+@register_expression(v.funcs.negative)
+def _negative(expr):
+    return (expr < 0).fill_null(False)
+
+
+@register_expression(v.funcs.unique)
+def _unique(expr):
+    return ~expr.is_duplicated()
+
+
+def _has_cased(expr):
+    return expr.str.to_uppercase() != expr.str.to_lowercase()
+
+
+@register_expression(v.funcs.upper)
+def _is_upper(expr):
+    return (expr.str.to_uppercase() == expr) & _has_cased(expr)
+
+
+@register_expression(v.funcs.lower)
+def _is_lower(expr):
+    return (expr.str.to_lowercase() == expr) & _has_cased(expr)
+
+
+@_register_spec("minmax")
+def _minmax(expr, low, high):
+    return expr.is_between(low, high, closed="both").fill_null(False)
+
+
+@_register_spec("choice")
+def _choice(expr, choices):
+    choices = set(choices)
+    allows_null = None in choices
+    return expr.is_in([item for item in choices if item is not None]).fill_null(allows_null)
+
+
+@_register_spec("bounded_length")
+def _bounded_length(expr, low, high=None):
+    if high is None:
+        high = low
+    return expr.str.len_chars().is_between(low, high, closed="both").fill_null(False)
+
+
+@_register_spec("match")
+def _match(expr, pattern, flags=0, fullmatch=False):
+    if flags or not _native_regex(pattern):
+        return None
+    anchored = f"^(?:{pattern})$" if fullmatch else f"^(?:{pattern})"
+    return expr.cast(pl.Utf8).str.contains(anchored).fill_null(True)
+
+
+# Builtin recoders
+
+@register_expression(r.funcs.upper)
+def _upper(expr):
+    return expr.str.to_uppercase()
+
+
+@register_expression(r.funcs.lower)
+def _lower(expr):
+    return expr.str.to_lowercase()
+
+
+@_register_spec("replace")
+def _replace(expr, pattern, repl, flags=0):
+    if flags or "\\" in repl or "$" in repl or not _native_regex(pattern):
+        return None
+    return expr.str.replace_all(pattern, repl)
+
+
+# Builtin column transforms: build a mapping of output name -> expression from the input expressions
+
+def _typed(parts: t.Dict[str, pl.Expr], dtypes) -> t.Optional[t.Dict[str, pl.Expr]]:
+    if dtypes is None:
+        return parts
+    if not isinstance(dtypes, dict):
+        dtypes = {name: dtypes for name in parts}
+
+    typed = dict(parts)
+    for name, dtype in dtypes.items():
+        if dtype not in POLARS_DTYPES:
+            return None
+        typed[name] = parts[name].cast(POLARS_DTYPES[dtype])
+    return typed
+
+
+@_register_spec("split")
+def _split(inputs, column, names, sep, dtypes=None):
+    fields = inputs[column].str.splitn(sep, len(names))
+    return _typed({name: fields.struct.field(f"field_{i}") for i, name in enumerate(names)}, dtypes)
+
+
+@_register_spec("extract")
+def _extract(inputs, column, pattern, names, flags=0, dtypes=None):
+    if flags or not _native_regex(pattern):
+        return None
+    expr = inputs[column].str
+    return _typed({name: expr.extract(pattern, group_index=i + 1) for i, name in enumerate(names)}, dtypes)
+
+
+@_register_spec("fixed_width")
+def _fixed_width(inputs, column, widths, names, dtypes=None):
+    parts, start = {}, 0
+    for name, width in zip(names, widths):
+        parts[name] = inputs[column].str.slice(start, width)
+        start += width
+    return _typed(parts, dtypes)
+
+
+def _transform(column, inputs: t.Dict[str, pl.Expr]) -> t.Dict[str, pl.Expr]:
+    """Return the expressions of ``column``'s transformed output columns, given its input expressions."""
+    transform = _unwrap_schema_function(column.column_transform)
+    spec = _spec(transform)
+    if spec is not None and spec[0] in SPEC_EXPRESSIONS:
+        parts = SPEC_EXPRESSIONS[spec[0]](inputs, **spec[1])
+        if parts is not None:
+            return {c.name: parts[c.name] for c in column.output_columns}
+
+    names = [c.name for c in column.input_columns]
+    output_names = [c.name for c in column.output_columns]
+
+    def apply(packed: pl.Series) -> pl.Series:
+        table = packed.struct.unnest().to_pandas()
+        transformed = column.column_transform(table).reset_index(drop=True)[output_names]
+        return pl.from_pandas(transformed).to_struct("transformed")
+
+    packed = pl.struct([inputs[name].alias(name) for name in names]).map_batches(apply)
+    return {name: packed.struct.field(name) for name in output_names}
+
+
+# Validation
+
+def _dtype_matches(python_type, dtype) -> t.Optional[bool]:
+    """Return whether values of the Polars ``dtype`` are instances of ``python_type`` (None: undecidable)."""
+    if python_type is object:
+        return True
+    if dtype == pl.Object:
+        return None
+    if python_type is type(None):
+        return dtype == pl.Null
+    if python_type is bool:
+        return dtype == pl.Boolean
+    if python_type is int:
+        return dtype.is_integer()
+    if python_type is float:
+        return dtype.is_float()
+    if python_type is str:
+        return dtype in (pl.Utf8, pl.Categorical)
+    if python_type in (list, tuple, set):
+        return False
+    return None
+
+
+def _dtype_check(column, expr: pl.Expr, dtype) -> pl.Expr:
+    types = column.dtype if isinstance(column.dtype, tuple) else (column.dtype, )
+    matches = [_dtype_matches(python_type, dtype) for python_type in types]
+
+    if None in matches:
+        return _fallback(column._validate_series_dtype, expr, column.name)
+
+    allows_null = type(None) in types
+    return pl.lit(any(matches)) & expr.is_not_null() | pl.lit(allows_null) & expr.is_null()
+
+
+def _checks(column, expr: pl.Expr, dtype) -> t.Dict[str, pl.Expr]:
+    """Return the expressions of every test of the plain ``column``, applied to ``expr``, keyed by test name."""
+    checks = {name: _expression(func, expr, column.name).fill_null(True) for name, func in column.validators.items()}
+    checks["dtype"] = _dtype_check(column, expr, dtype)
+    if column.unique:
+        checks["unique"] = _unique(expr)
+    return checks
+
+
+def _schema(frame) -> dict:
+    return dict(frame.schema)
+
+
+def _lazy(table) -> pl.LazyFrame:
+    return table.lazy() if isinstance(table, pl.DataFrame) else table
+
+
+def _collect_like(table, lazy: pl.LazyFrame):
+    return lazy.collect() if isinstance(table, pl.DataFrame) else lazy
+
+
+def _member_checks(column, frame: pl.LazyFrame,
+                   inputs=None) -> t.List[t.Tuple[str, str, pl.Expr, t.Dict[str, pl.Expr]]]:
+    """Return ``(validation_type, column_name, expr, checks)`` for ``column`` and, if compound, its members."""
+    schema = _schema(frame)
+    if not hasattr(column, "input_columns"):
+        expr = pl.col(column.name) if inputs is None else inputs[column.name]
+        return [("", column.name, expr, _checks(column, expr, schema[column.name]))]
+
+    members = []
+    for member in column.input_columns:
+        expr = pl.col(member.name)
+        members.append(("input", member.name, expr, _checks(member, expr, schema[member.name])))
+
+    outputs = _transform(column, {c.name: pl.col(c.name) for c in column.input_columns})
+    output_schema = _schema(frame.select([expr.alias(name) for name, expr in outputs.items()]))
+    for member in column.output_columns:
+        expr = outputs[member.name]
+        members.append(("output", member.name, expr, _checks(member, expr, output_schema[member.name])))
+
+    return members
+
+
+def validate_column(column, table, failed_only=False):
+    """Return the validation results of ``column`` for the Polars ``table``, as a table of the same kind.
+
+    Plain columns give one row per table row. Compound columns stack the results of their members
+    with ``validation_type`` and ``column_name`` columns, as the pandas backend does.
+    """
+    frame = _lazy(table).with_row_index(ROW_COLUMN)
+    members = _member_checks(column, frame)
+
+    parts = []
+    for validation_type, name, _, checks in members:
+        part = frame.select([pl.col(ROW_COLUMN)] + [expr.alias(test) for test, expr in checks.items()])
+        if validation_type:
+            part = part.with_columns(pl.lit(validation_type).alias("validation_type"), pl.lit(name).alias("column_name"))
+        if failed_only:
+            part = part.filter(~pl.all_horizontal([pl.col(test) for test in checks]))
+        parts.append(part)
+
+    if len(parts) == 1:
+        results = parts[0]
+    else:
+        results = pl.concat(parts, how="diagonal").with_columns(pl.exclude(
+            [ROW_COLUMN, "validation_type", "column_name"]).fill_null(True))
+        leading = ["validation_type", "column_name", ROW_COLUMN]
+        results = results.select(leading + [c for c in _schema(results) if c not in leading])
+
+    return _collect_like(table, results)
+
+
+def validate(enforcer, table) -> bool:
+    """Return True if all validation tests pass for the Polars ``table``: False otherwise."""
+    frame = _lazy(table)
+    checks = []
+    for column in enforcer.columns:
+        for _, _, _, member_checks in _member_checks(column, frame):
+            checks.extend(member_checks.values())
+
+    if not checks:
+        return True
+    return bool(frame.select(pl.all_horizontal(checks).all()).collect().item())
+
+
+def summarize(enforcer, table) -> pd.DataFrame:
+    """Return the counts of ``table_enforcer.summary.summarize`` for the Polars ``table``, from one aggregating query."""
+    frame = _lazy(table)
+    aggregates, keys = [pl.len().alias("rows")], []
+    for column in enforcer.columns:
+        for _, name, expr, checks in _member_checks(column, frame):
+            member = len(keys)
+            aggregates.append(expr.null_count().alias(f"{member}.nulls"))
+            aggregates.append(expr.drop_nulls().n_unique().alias(f"{member}.distinct"))
+            aggregates.extend(check.sum().alias(f"{member}.{test}") for test, check in checks.items())
+            keys.append((name, list(checks)))
+
+    counts = frame.select(aggregates).collect().row(0, named=True)
+
+    records = []
+    for member, (name, tests) in enumerate(keys):
+        for test in tests:
+            passed = counts[f"{member}.{test}"]
+            records.append({
+                "column": name,
+                "check": test,
+                "rows": counts["rows"],
+                "passed": passed,
+                "failed": counts["rows"] - passed,
+                "nulls": counts[f"{member}.nulls"],
+                "distinct": counts[f"{member}.distinct"],
+            })
+
+    return _summary_frame(records)
+
+
+# Recoding
+
+def _recoded(column, expr: pl.Expr) -> pl.Expr:
+    for recoder in column.recoders.values():
+        expr = _expression(recoder, expr, column.name)
+    return expr
+
+
+def _recode_exprs(column) -> t.Tuple[t.Dict[str, pl.Expr], t.Dict[str, pl.Expr]]:
+    """Return the expressions of ``column``'s recoded output columns and of its recoded compound inputs."""
+    if not hasattr(column, "input_columns"):
+        return {column.name: _recoded(column, pl.col(column.name))}, {}
+
+    inputs = {member.name: _recoded(member, pl.col(member.name)) for member in column.input_columns}
+    transformed = _transform(column, inputs)
+    outputs = {member.name: _recoded(member, transformed[member.name]) for member in column.output_columns}
+    return outputs, inputs
+
+
+def _members(columns) -> t.List[t.Tuple[str, object]]:
+    """Return ``(kind, column)`` for each plain column and member of a compound column."""
+    members = []
+    for column in columns:
+        if hasattr(column, "input_columns"):
+            members.extend(("input", member) for member in column.input_columns)
+            members.extend(("output", member) for member in column.output_columns)
+        else:
+            members.append(("output", column))
+    return members
+
+
+def _hidden(name: str) -> str:
+    return f"__recoded_input__{name}"
+
+
+def _raise_failures(columns, recoded: pl.DataFrame) -> None:
+    """Raise ``ValidationError`` for the first member of ``columns`` whose recoded values fail validation."""
+    schema = _schema(recoded)
+    indexed = recoded.with_row_index(ROW_COLUMN)
+
+    for kind, member in _members(columns):
+        name = _hidden(member.name) if kind == "input" else member.name
+        checks = _checks(member, pl.col(name), schema[name])
+        failed = indexed.select([pl.col(ROW_COLUMN)] + [expr.alias(test) for test, expr in checks.items()]).filter(
+            ~pl.all_horizontal([pl.col(test) for test in checks]))
+        if failed.height > 0:
+            raise ValidationError(f"Rows that failed to validate for column '{member.name}':\n{failed}")
+
+
+def _recode_table(columns, table, validate: bool):
+    """Return ``table`` recoded by ``columns``, as a table of the same kind as ``table``.
+
+    For a LazyFrame, failed validation surfaces when the result is collected, as the
+    ``polars.exceptions.ComputeError`` wrapping the ``ValidationError``.
+    """
+    exprs, hidden = [], []
+    for column in columns:
+        outputs, inputs = _recode_exprs(column)
+        exprs.extend(expr.alias(name) for name, expr in outputs.items())
+        if validate:
+            hidden.extend(expr.alias(_hidden(name)) for name, expr in inputs.items())
+
+    recoded = _lazy(table).select(exprs + hidden)
+    if not validate:
+        return _collect_like(table, recoded)
+
+    names = [expr.meta.output_name() for expr in exprs]
+
+    def check(batch: pl.DataFrame) -> pl.DataFrame:
+        _raise_failures(columns, batch)
+        return batch.select(names)
+
+    if isinstance(table, pl.DataFrame):
+        return check(recoded.collect())
+
+    schema = {name: dtype for name, dtype in _schema(recoded).items() if name in names}
+    # dtypes of pandas fallbacks are only known once computed
+    return recoded.map_batches(check, schema=schema, validate_output_schema=False)
+
+
+def recode_column(column, table, validate=False):
+    """Return ``column``'s recoded output columns for the Polars ``table``, as a table of the same kind."""
+    return _recode_table([column], table, validate)
+
+
+def recode(enforcer, table, validate=False):
+    """Return the table recoded by ``enforcer`` as one query, as a table of the same kind as ``table``."""
+    return _recode_table(enforcer.columns, table, validate)
@@ -0,0 +1,254 @@
+"""Provide a fast, sampling-based estimate of how a large table will fare against an ``Enforcer``.
+
+The table is streamed once (it may be given as an iterable of chunks, e.g. from
+``pd.read_csv(..., chunksize=...)``) to draw a uniform random sample of rows and to keep the
+first and last rows. The unchanged column validators are run on these rows only. Tests of
+uniqueness cannot be judged from a sample, so for ``unique=True`` columns the number of
+distinct values in the whole table is estimated with a HyperLogLog sketch instead (from the
+transformed chunks, for unique output columns of a ``CompoundColumn``).
+"""
+import math
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "HyperLogLog",
+    "reservoir_sample",
+    "wilson_interval",
+    "preflight",
+]
+
+
+def _leading_zeros(values: np.ndarray) -> np.ndarray:
+    """Return the number of leading zero bits of each ``uint64`` in ``values``."""
+    zeros = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        top_is_zero = values < (np.uint64(1) << np.uint64(64 - shift))
+        zeros += top_is_zero * shift
+        values = np.where(top_is_zero, values << np.uint64(shift), values)
+    return zeros + (values == 0)
+
+
+class HyperLogLog(object):
+    """Estimate the number of distinct values in a stream using ``2 ** precision`` registers."""
+
+    def __init__(self, precision: int = 14) -> None:
+        """Construct a new, empty ``HyperLogLog`` sketch.
+
+        Args:
+            precision (int): Number of hash bits used to select a register (4 to 18).
+        """
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Return the standard error of ``count()`` relative to the true count."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add(self, series: pd.Series) -> None:
+        """Add the values of ``series`` to the sketch."""
+        hashes = pd.util.hash_pandas_object(series, index=False).values
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        rest = hashes << np.uint64(self.precision)
+
+        # rank = position of the leftmost 1-bit in the remaining (64 - precision) bits
+        rank = np.minimum(_leading_zeros(rest) + 1, 64 - self.precision + 1)
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+    def count(self) -> float:
+        """Return the estimated number of distinct values added so far."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype(float))
+
+        empty = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and empty > 0:
+            # small range correction: linear counting
+            estimate = m * math.log(m / empty)
+
+        return float(estimate)
+
+
+def reservoir_sample(
+        chunks: t.Iterable[pd.DataFrame],
+        size: int,
+        head: int = 0,
+        tail: int = 0,
+        seed=None,
+        on_chunk: t.Callable[[pd.DataFrame], None] = None,) -> t.Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, int]:
+    """Stream ``chunks`` once and return ``(head_rows, sample, tail_rows, total_rows)``.
+
+    ``sample`` is a uniform random sample of at most ``size`` rows of the whole stream, drawn by
+    keeping the rows with the smallest random priorities.
+
+    Args:
+        chunks (iterable): DataFrames forming the table, in order.
+        size (int): Number of rows to sample.
+        head (int): Number of rows to keep from the start of the table.
+        tail (int): Number of rows to keep from the end of the table.
+        seed (int): Seed for the random number generator.
+        on_chunk (Callable): If given, called with every chunk as it streams past.
+    """
+    rng = np.random.default_rng(seed)
+    head_rows, tail_rows = [], None
+    sample, priorities = None, np.array([])
+    total_rows = 0
+    kept_head = 0
+
+    for chunk in chunks:
+        if on_chunk is not None:
+            on_chunk(chunk)
+
+        total_rows += chunk.shape[0]
+
+        if kept_head < head:
+            head_rows.append(chunk.iloc[:head - kept_head])
+            kept_head += head_rows[-1].shape[0]
+
+        tail_rows = chunk if tail_rows is None else pd.concat([tail_rows, chunk])
+        tail_rows = tail_rows.iloc[max(tail_rows.shape[0] - tail, 0):]
+
+        candidates = chunk if sample is None else pd.concat([sample, chunk])
+        candidate_priorities = np.concatenate([priorities, rng.random(chunk.shape[0])])
+        keep = np.argsort(candidate_priorities, kind="stable")[:size]
+        sample, priorities = candidates.iloc[np.sort(keep)], candidate_priorities[np.sort(keep)]
+
+    if sample is None:
+        empty = pd.DataFrame()
+        return empty, empty, empty, 0
+
+    head_rows = pd.concat(head_rows) if head_rows else sample.iloc[:0]
+    return head_rows, sample, tail_rows, total_rows
+
+
+def _z_score(confidence: float) -> float:
+    """Return the two-sided standard normal quantile for ``confidence`` (e.g. 1.96 for 0.95).
+
+    Found by bisection on ``math.erf``, as ``statistics.NormalDist`` needs Python 3.8.
+    """
+    low, high = 0.0, 40.0
+    for _ in range(100):
+        mid = (low + high) / 2
+        if math.erf(mid / math.sqrt(2)) < confidence:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+def wilson_interval(failures: int, n: int, confidence: float = 0.95) -> t.Tuple[float, float]:
+    """Return the Wilson score interval for a failure rate of ``failures`` out of ``n``."""
+    if n == 0:
+        return 0.0, 1.0
+
+    z = _z_score(confidence)
+    p = failures / n
+    center = (p + z * z / (2 * n)) / (1 + z * z / n)
+    spread = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+    return max(center - spread, 0.0), min(center + spread, 1.0)
+
+
+def _members(column) -> list:
+    """Return the member columns of ``column``: itself, or its input then output columns."""
+    return getattr(column, "input_columns", [column]) + getattr(column, "output_columns", [])
+
+
+def _member_passes(column, table: pd.DataFrame) -> t.Iterator[t.Tuple[t.Any, pd.Series]]:
+    """Yield ``(member, passes)`` for each member column of ``column``: whether each row passes its validators.
+
+    The ``unique`` test is ignored: it cannot be judged from a sample.
+    """
+    members = [(column, table)]
+    if hasattr(column, "input_columns"):
+        transformed = column.column_transform(table)
+        members = [(c, table) for c in column.input_columns] + [(c, transformed) for c in column.output_columns]
+
+    for member, data in members:
+        results = member.validate(data).drop(columns="unique", errors="ignore")
+        yield member, results.fillna(True).all(axis=1).astype(bool)
+
+
+def _sketch_unique(enforcer, sketches: dict, chunk: pd.DataFrame) -> None:
+    """Add the values of the unique members of ``enforcer`` in ``chunk`` to their ``sketches``.
+
+    Unique output columns of compound columns are sketched from the transformed chunk.
+    """
+    for column in enforcer.columns:
+        for member in getattr(column, "input_columns", [column]):
+            if member in sketches:
+                sketches[member].add(chunk[member.name])
+
+        outputs = [member for member in getattr(column, "output_columns", []) if member in sketches]
+        if outputs:
+            transformed = column.column_transform(chunk)
+            for member in outputs:
+                sketches[member].add(transformed[member.name])
+
+
+def preflight(enforcer, source, sample_size=10000, head=100, tail=100, confidence=0.95, seed=None) -> pd.DataFrame:
+    """Return estimated failure rates per column from a sample of ``source``.
+
+    The estimate (``failure_rate`` within ``[lower, upper]`` at the given ``confidence``) uses the
+    random sample only; failures in the first and last rows are reported separately, as they are
+    not representative but often reveal header or truncation problems. For unique columns,
+    ``estimated_distinct`` (within ``[distinct_lower, distinct_upper]``) estimates the number of
+    distinct values in the whole table, to be compared with ``total_rows``.
+
+    Args:
+        enforcer (Enforcer): The table definition.
+        source (pd.DataFrame, iterable): The table, or an iterable of its chunks.
+        sample_size (int): Number of rows to sample at random.
+        head (int): Number of rows to check from the start of the table.
+        tail (int): Number of rows to check from the end of the table.
+        confidence (float): Confidence level of the intervals.
+        seed (int): Seed for the random number generator.
+    """
+    if isinstance(source, pd.DataFrame):
+        source = [source]
+
+    sketches = {member: HyperLogLog() for column in enforcer.columns for member in _members(column) if member.unique}
+
+    head_rows, sample, tail_rows, total_rows = reservoir_sample(
+        source, size=sample_size, head=head, tail=tail, seed=seed,
+        on_chunk=lambda chunk: _sketch_unique(enforcer, sketches, chunk),)
+
+    sample = sample.reset_index(drop=True)
+    edges = pd.concat([head_rows, tail_rows]).reset_index(drop=True)
+    z = _z_score(confidence)
+
+    rows = {}
+    for column in enforcer.columns:
+        if total_rows == 0:
+            # nothing to check: every member gets a row without failures
+            sample_passes = edge_passes = [(member, pd.Series([], dtype=bool)) for member in _members(column)]
+        else:
+            sample_passes, edge_passes = _member_passes(column, sample), _member_passes(column, edges)
+
+        for (member, passes), (_, edge) in zip(sample_passes, edge_passes):
+            name = member.name
+            failed = int((~passes).sum())
+            lower, upper = wilson_interval(failed, len(passes), confidence=confidence)
+            rows[name] = {
+                "total_rows": total_rows,
+                "sample_rows": len(passes),
+                "failed": failed,
+                "failure_rate": failed / len(passes) if len(passes) else np.nan,
+                "lower": lower,
+                "upper": upper,
+                "edge_rows": len(edge),
+                "edge_failed": int((~edge).sum()),
+            }
+
+            if member in sketches:
+                hll = sketches[member]
+                distinct = min(hll.count(), total_rows)
+                rows[name]["estimated_distinct"] = distinct
+                rows[name]["distinct_lower"] = distinct * max(1 - z * hll.relative_error, 0)
+                rows[name]["distinct_upper"] = min(distinct * (1 + z * hll.relative_error), total_rows)
+
+    report = pd.DataFrame.from_dict(rows, orient="index")
+    report.index.name = "column_name"
+    return report
@@ -0,0 +1,120 @@
+"""Provide instrumentation recording the cost of each validator and recoder function.
+
+Profiling is off unless a ``Profiler`` is attached (see ``Enforcer.enable_profiling``); columns
+without one call their functions directly, so the only overhead when disabled is an attribute check.
+"""
+import threading
+import time
+import tracemalloc
+import typing as t
+
+import pandas as pd
+
+__all__ = [
+    "Profiler",
+    "REPORT_COLUMNS",
+]
+
+REPORT_COLUMNS = ["column", "kind", "function", "calls", "seconds", "rows", "failures", "peak_bytes"]
+
+
+class Profiler(object):
+    """Collect wall time, rows processed, failures produced and peak allocation per function per column.
+
+    A profiler may be shared by columns processed in several threads (e.g. by ``Enforcer.avalidate``).
+    """
+
+    def __init__(self, callbacks: t.List[t.Callable[[dict], None]] = None, trace_memory=False) -> None:
+        """Construct a new ``Profiler`` object.
+
+        Args:
+            callbacks (list): Functions called with a ``dict`` describing every profiled call, as
+                keyed by ``REPORT_COLUMNS`` (with ``calls`` equal to 1). Use these to export to a metrics system.
+            trace_memory (bool): If ``True``, record peak allocations with ``tracemalloc``.
+                This slows execution down considerably.
+        """
+        if callbacks is None:
+            callbacks = []
+
+        self.callbacks = callbacks
+        self.trace_memory = trace_memory
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        with self._lock:
+            self._stats = {}
+
+    def call(self, column: str, kind: str, name: str, func: t.Callable, series: pd.Series):
+        """Call ``func(series)``, record its cost under ``(column, kind, name)`` and return its result.
+
+        Args:
+            column (str): Name of the column the function belongs to.
+            kind (str): Either ``"validator"`` or ``"recoder"``.
+            name (str): Name of the function within the column.
+            func (Callable): The validator or recoder.
+            series (pd.Series): The data to pass to ``func``.
+        """
+        tracing = self.trace_memory
+        if tracing:
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        try:
+            result = func(series)
+        finally:
+            seconds = time.perf_counter() - start
+            peak_bytes = None
+            if tracing:
+                peak_bytes = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+                if started_tracing:
+                    tracemalloc.stop()
+
+        failures = None
+        if kind == "validator":
+            failures = int((~result.astype(bool)).sum())
+
+        self._record({
+            "column": column,
+            "kind": kind,
+            "function": name,
+            "calls": 1,
+            "seconds": seconds,
+            "rows": len(series),
+            "failures": failures,
+            "peak_bytes": peak_bytes,
+        })
+
+        return result
+
+    def _record(self, event: dict) -> None:
+        key = (event["column"], event["kind"], event["function"])
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                self._stats[key] = dict(event)
+            else:
+                stats["calls"] += 1
+                stats["seconds"] += event["seconds"]
+                stats["rows"] += event["rows"]
+                if event["failures"] is not None:
+                    stats["failures"] += event["failures"]
+                if event["peak_bytes"] is not None:
+                    stats["peak_bytes"] = max(stats["peak_bytes"] or 0, event["peak_bytes"])
+
+        for callback in self.callbacks:
+            callback(event)
+
+    def report(self) -> pd.DataFrame:
+        """Return a dataframe with one row per profiled function per column, slowest first."""
+        with self._lock:
+            stats = [dict(row) for row in self._stats.values()]
+        report = pd.DataFrame(stats, columns=REPORT_COLUMNS)
+        return report.sort_values("seconds", ascending=False).reset_index(drop=True)
@@ -0,0 +1,300 @@
+"""Load ``Enforcer`` definitions from declarative YAML/JSON schema files.
+
+A schema lists the columns of a table::
+
+    columns:
+      - name: sample_id
+        dtype: str
+        unique: true
+        validators: [not_null, {match: {pattern: "S[0-9]+", fullmatch: true}}]
+      - name: tissue
+        dtype: [str, none]
+        validators:
+          - choice: {choices_file: tissues.txt}
+        recoders: [lower, {function: "mypackage.recoders:fix_tissue"}]
+      - input_columns: [{name: code, dtype: str}]
+        output_columns:
+          - {name: code_number, dtype: int}
+          - {name: code_word, dtype: str, recoders: [upper]}
+        column_transform: {split: {column: code, names: [code_number, code_word], sep: ":", dtypes: {code_number: int}}}
+
+Each validator, recoder and ``column_transform`` is one of:
+
+* the name of a builtin function (``validate.funcs``/``recode.funcs``),
+* a one-key mapping from a builtin decorator (``validate.decorators``/``recode.decorators``) or
+  transform factory (``transform.funcs``) to its parameters, with an optional ``name`` parameter
+  naming the resulting check,
+* ``"module:attribute"`` or ``{function: "module:attribute"}`` for an importable custom function.
+
+``choice`` also accepts ``choices_file``: a text file, relative to the schema, holding one choice per line.
+
+dtypes are ``str``, ``int``, ``float``, ``bool``, ``none``, ``set``, ``tuple``, ``list``, ``object``,
+``"module:attribute"``, or a list of these.
+
+Compiled schemas are pickled to a cache directory under a key derived from the contents of the
+schema file, so short-lived processes only parse the schema and read its vocabularies once.
+"""
+import hashlib
+import importlib
+import json
+import os
+import pickle
+import typing as t
+from pathlib import Path
+
+import table_enforcer
+from table_enforcer.main_classes import Column, CompoundColumn, Enforcer
+from table_enforcer.utils import recode as r
+from table_enforcer.utils import transform as tr
+from table_enforcer.utils import validate as v
+
+__all__ = [
+    "SchemaError",
+    "SchemaFunction",
+    "compile_schema",
+    "load_schema",
+]
+
+DTYPES = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "none": type(None),
+    "set": set,
+    "tuple": tuple,
+    "list": list,
+    "object": object,
+}
+
+# library name -> (module holding builtin functions, module holding parameterized builtins)
+LIBRARIES = {
+    "validators": (v.funcs, v.decorators),
+    "recoders": (r.funcs, r.decorators),
+    "column_transform": (None, tr.funcs),
+}
+
+# parameterized builtins that only declare properties of a function instead of wrapping it
+_MARKERS = {"pure", "inplace", "row_local"}
+
+
+class SchemaError(ValueError):
+    """Raise when a schema file cannot be turned into an ``Enforcer``."""
+
+
+def _identity(series):
+    return series
+
+
+def _import(reference: str):
+    """Return the object named by ``"module:attribute"``."""
+    module_name, _, attribute = reference.partition(":")
+    try:
+        return getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError) as err:
+        raise SchemaError(f"Cannot import '{reference}': {err}") from err
+
+
+class SchemaFunction(object):
+    """A validator, recoder or column transform built from a parameterized builtin.
+
+    Only the builtin's name and parameters are pickled; the function is rebuilt when unpickled.
+    """
+
+    def __init__(self, library: str, builtin: str, params: dict, name: str = None) -> None:
+        """Construct a new ``SchemaFunction`` object.
+
+        Args:
+            library (str): ``"validators"``, ``"recoders"`` or ``"column_transform"``.
+            builtin (str): Name of the decorator or transform factory.
+            params (dict): Keyword arguments of the decorator or transform factory.
+            name (str): Name of the check in validation results (default: ``builtin``).
+        """
+        self.library = library
+        self.builtin = builtin
+        self.params = params
+        self.__name__ = name or builtin
+
+        factory = getattr(LIBRARIES[library][1], builtin)
+        if library == "column_transform":
+            self._func = factory(**params)
+        else:
+            self._func = factory(**params)(_identity)
+
+        if library == "recoders":
+            # the builtin recode decorators all return a new series
+            self.inplace = False
+
+    def __call__(self, *args, **kwargs):
+        return self._func(*args, **kwargs)
+
+    def __getstate__(self) -> dict:
+        return {"library": self.library, "builtin": self.builtin, "params": self.params, "name": self.__name__}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["library"], state["builtin"], state["params"], name=state["name"])
+
+    def __repr__(self) -> str:
+        return f"SchemaFunction({self.library!r}, {self.builtin!r}, name={self.__name__!r})"
+
+
+class _Compiler(object):
+    """Turn the parsed contents of a schema file into an ``Enforcer``, recording the files it reads."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.dependencies = {}
+
+    def read_lines(self, path: str) -> t.List[str]:
+        path = (self.root / path).resolve()
+        try:
+            content = path.read_bytes()
+        except OSError as err:
+            raise SchemaError(f"Cannot read '{path}': {err}") from err
+
+        self.dependencies[str(path)] = hashlib.sha256(content).hexdigest()
+        return [line.strip() for line in content.decode().splitlines() if line.strip()]
+
+    def dtype(self, spec):
+        if isinstance(spec, list):
+            return tuple(self.dtype(item) for item in spec)
+        if spec in DTYPES:
+            return DTYPES[spec]
+        if isinstance(spec, str) and ":" in spec:
+            return _import(spec)
+        raise SchemaError(f"Unknown dtype {spec!r}: use one of {sorted(DTYPES)} or 'module:attribute'.")
+
+    def function(self, library: str, spec):
+        funcs, decorators = LIBRARIES[library]
+
+        if isinstance(spec, str):
+            if ":" in spec:
+                return _import(spec)
+            if funcs is not None and hasattr(funcs, spec):
+                return getattr(funcs, spec)
+            raise SchemaError(f"Unknown builtin {library} function '{spec}'.")
+
+        if not isinstance(spec, dict) or len(spec) != 1:
+            raise SchemaError(f"{library} entries must be a name or a one-key mapping, not {spec!r}.")
+
+        (builtin, params), = spec.items()
+        if builtin == "function":
+            return _import(params)
+
+        if builtin.startswith("_") or builtin in _MARKERS or not hasattr(decorators, builtin):
+            raise SchemaError(f"Unknown parameterized builtin {library} function '{builtin}'.")
+
+        params = dict(params or {})
+        name = params.pop("name", None)
+        if builtin == "choice" and "choices_file" in params:
+            params["choices"] = self.read_lines(params.pop("choices_file"))
+        if builtin == "choice":
+            params["choices"] = frozenset(params["choices"])
+
+        try:
+            return SchemaFunction(library, builtin, params, name=name)
+        except TypeError as err:
+            raise SchemaError(f"Bad parameters for '{builtin}': {err}") from err
+
+    def column(self, spec: dict):
+        if "input_columns" in spec:
+            return CompoundColumn(
+                input_columns=[self.column(item) for item in spec["input_columns"]],
+                output_columns=[self.column(item) for item in spec["output_columns"]],
+                column_transform=self.function("column_transform", spec["column_transform"]),)
+
+        try:
+            name = spec["name"]
+        except KeyError:
+            raise SchemaError(f"Column without a name: {spec!r}") from None
+
+        return Column(
+            name=name,
+            dtype=self.dtype(spec.get("dtype", "object")),
+            unique=bool(spec.get("unique", False)),
+            validators=[self.function("validators", item) for item in spec.get("validators", [])],
+            recoders=[self.function("recoders", item) for item in spec.get("recoders", [])],)
+
+    def enforcer(self, spec: dict) -> Enforcer:
+        if not isinstance(spec, dict) or "columns" not in spec:
+            raise SchemaError("A schema must be a mapping with a 'columns' list.")
+        return Enforcer(columns=[self.column(item) for item in spec["columns"]])
+
+
+def _parse(path: Path, content: bytes) -> dict:
+    """Return the parsed contents of a YAML or JSON schema file."""
+    if path.suffix.lower() == ".json":
+        return json.loads(content.decode())
+
+    try:
+        import yaml
+    except ImportError:  # pragma: no cover
+        raise ImportError("Loading YAML schemas requires PyYAML: use a .json schema or install PyYAML.") from None
+    return yaml.safe_load(content)
+
+
+def compile_schema(spec: dict, root=".") -> Enforcer:
+    """Return the ``Enforcer`` described by the parsed schema ``spec``.
+
+    Args:
+        spec (dict): Parsed schema.
+        root (str, Path): Directory relative to which files referenced by the schema are read.
+    """
+    return _Compiler(Path(root)).enforcer(spec)
+
+
+def _default_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "table_enforcer" / "schemas"
+
+
+def _dependencies_unchanged(dependencies: dict) -> bool:
+    for path, expected in dependencies.items():
+        try:
+            content = Path(path).read_bytes()
+        except OSError:
+            return False
+        if hashlib.sha256(content).hexdigest() != expected:
+            return False
+    return True
+
+
+def load_schema(path, cache_dir=None, use_cache=True) -> Enforcer:
+    """Return the ``Enforcer`` described by the YAML/JSON schema file at ``path``, compiling it at most once.
+
+    Args:
+        path (str, Path): Schema file (``.yaml``, ``.yml`` or ``.json``).
+        cache_dir (str, Path): Where compiled schemas are kept (default: ``$XDG_CACHE_HOME/table_enforcer/schemas``).
+        use_cache (bool): If ``False``, always compile and never read or write the cache.
+    """
+    path = Path(path)
+    content = path.read_bytes()
+
+    key = hashlib.sha256(content + f"|{table_enforcer.__version__}|{path.resolve().parent}".encode()).hexdigest()
+    cache_path = Path(cache_dir or _default_cache_dir()) / f"{key}.pickle"
+
+    if use_cache and cache_path.exists():
+        try:
+            with cache_path.open(mode="rb") as handle:
+                cached = pickle.load(handle)
+        except Exception:
+            cached = None
+        if cached is not None and _dependencies_unchanged(cached["dependencies"]):
+            return cached["enforcer"]
+
+    compiler = _Compiler(path.resolve().parent)
+    enforcer = compiler.enforcer(_parse(path, content))
+
+    if use_cache:
+        try:
+            payload = pickle.dumps(
+                {"enforcer": enforcer, "dependencies": compiler.dependencies}, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # custom functions that cannot be pickled by reference: compile every time
+            return enforcer
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(cache_path)
+
+    return enforcer
@@ -0,0 +1,80 @@
+"""Hand a table to worker processes through shared memory instead of pickling it into each of them.
+
+A ``SharedTable`` writes the column buffers of a table once to a scratch directory in ``/dev/shm``
+(a RAM-backed file system; the system temporary directory where there is none) and exposes a small,
+picklable ``handle``. Workers ``attach`` the handle to get a dataframe whose fixed-width NumPy
+columns are read-only memory maps of the shared buffers: nothing is copied, however many workers
+attach. Object (and extension) dtype columns cannot be mapped; they are pickled once to the
+directory and unpickled by each worker that attaches.
+
+Workers may also write their results back to the directory (``SharedTable.directory``) and return
+the handle of those results in place of the data itself.
+"""
+import os
+import shutil
+import tempfile
+import typing as t
+from pathlib import Path
+
+import pandas as pd
+
+from table_enforcer.spill import SpillDirectory, SpilledFrame
+
+__all__ = [
+    "SHM_ROOT",
+    "SharedTable",
+    "attach",
+]
+
+SHM_ROOT = Path("/dev/shm")
+
+
+def _scratch_root() -> t.Optional[str]:
+    """Return the directory to create shared tables in: ``SHM_ROOT`` if writable, else None (the default)."""
+    if SHM_ROOT.is_dir() and os.access(str(SHM_ROOT), os.W_OK):
+        return str(SHM_ROOT)
+    return None
+
+
+class SharedTable(object):
+    """A table whose column buffers live in shared memory, removed on ``close()``."""
+
+    def __init__(self, table: pd.DataFrame, path=None) -> None:
+        """Construct a new ``SharedTable`` object, writing ``table`` to shared memory.
+
+        Args:
+            table (pd.DataFrame): The table to share.
+            path (str, Path): Directory to write to (default: a new directory in ``/dev/shm``),
+                which must be visible to every worker.
+        """
+        self._owned = path is None
+        if path is None:
+            path = tempfile.mkdtemp(prefix="table_enforcer-shared-", dir=_scratch_root())
+
+        self.directory = SpillDirectory(path)
+        self.handle = self.directory.dump(table)
+
+    def __enter__(self):
+        """Return the shared table itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Remove the shared buffers."""
+        self.close()
+
+    def close(self) -> None:
+        """Remove the shared buffers if they were written to a directory created here.
+
+        Views already attached stay readable until they are released.
+        """
+        if self._owned and self.directory.path.exists():
+            shutil.rmtree(str(self.directory.path))
+
+
+def attach(handle: SpilledFrame) -> pd.DataFrame:
+    """Return a read-only view of the table shared as ``handle``, mapping its buffers without copying them.
+
+    Args:
+        handle (SpilledFrame): The ``handle`` of a ``SharedTable``, or of results written to its ``directory``.
+    """
+    return SpillDirectory.load(handle)
@@ -0,0 +1,125 @@
+"""Provide a scratch directory that intermediate recoding results can be spilled to.
+
+Columns with a fixed-width NumPy dtype are written as ``.npy`` files and read back as read-only
+memory maps, so spilled results cost page cache rather than RAM and are not copied on load.
+Object (and extension) dtype columns cannot be memory mapped; they are pickled and read back
+into memory only when loaded.
+"""
+import itertools
+import pickle
+import shutil
+import tempfile
+import typing as t
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "SpillDirectory",
+    "SpilledFrame",
+]
+
+
+def _is_mappable(values) -> bool:
+    """Return True if ``values`` is a NumPy array whose items can be memory mapped."""
+    return isinstance(values, np.ndarray) and not values.dtype.hasobject
+
+
+class SpilledFrame(object):
+    """A handle on a dataframe written to a ``SpillDirectory``."""
+
+    def __init__(self, columns: list, index, files: t.List[t.Tuple[str, Path]]) -> None:
+        """Construct a new ``SpilledFrame`` object.
+
+        Args:
+            columns (list): The column labels, in order.
+            index (pd.Index, Path): The index itself if it is a ``RangeIndex``, else the file holding it.
+            files (list): ``(kind, path)`` for each column where ``kind`` is ``"npy"`` or ``"pickle"``.
+        """
+        self.columns = columns
+        self.index = index
+        self.files = files
+
+
+class SpillDirectory(object):
+    """A scratch directory holding spilled dataframes; removed on ``cleanup()`` if it was created here."""
+
+    def __init__(self, path=None) -> None:
+        """Construct a new ``SpillDirectory`` object.
+
+        Args:
+            path (str, Path): Directory to spill to (default: a new temporary directory).
+        """
+        self._owned = path is None
+        if path is None:
+            path = tempfile.mkdtemp(prefix="table_enforcer-spill-")
+
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._counter = itertools.count()
+
+    def __enter__(self):
+        """Return the directory itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Remove the directory if it was created here."""
+        self.cleanup()
+
+    def cleanup(self) -> None:
+        """Remove the directory if it was created here."""
+        if self._owned and self.path.exists():
+            shutil.rmtree(str(self.path))
+
+    def _write(self, values, stem: str) -> t.Tuple[str, Path]:
+        if _is_mappable(values):
+            path = self.path / f"{stem}.npy"
+            np.save(str(path), values, allow_pickle=False)
+            return "npy", path
+
+        path = self.path / f"{stem}.pkl"
+        with path.open(mode="wb") as handle:
+            pickle.dump(values, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        return "pickle", path
+
+    @staticmethod
+    def _read(kind: str, path: Path):
+        if kind == "npy":
+            return np.load(str(path), mmap_mode="r")
+
+        with path.open(mode="rb") as handle:
+            return pickle.load(handle)
+
+    def dump(self, df: pd.DataFrame) -> SpilledFrame:
+        """Write ``df`` to the directory and return a handle for ``load``."""
+        stem = f"frame{next(self._counter)}"
+
+        index = df.index
+        if not isinstance(index, pd.RangeIndex):
+            index = self._write(index, f"{stem}_index")
+
+        files = [self._write(df.iloc[:, i].values, f"{stem}_{i}") for i in range(df.shape[1])]
+        return SpilledFrame(columns=list(df.columns), index=index, files=files)
+
+    @staticmethod
+    def load(spilled: SpilledFrame) -> pd.DataFrame:
+        """Return the dataframe behind ``spilled``, memory mapping the columns that allow it.
+
+        Only the files named by ``spilled`` are read, so any process that can see them may load it.
+        """
+        index = spilled.index
+        if not isinstance(index, pd.RangeIndex):
+            index = pd.Index(SpillDirectory._read(*index))
+
+        columns = [
+            pd.Series(SpillDirectory._read(kind, path), index=index, name=name, copy=False)
+            for name, (kind, path) in zip(spilled.columns, spilled.files)
+        ]
+        if not columns:
+            return pd.DataFrame(index=index)
+        return pd.concat(columns, axis=1, copy=False)
+
+    def spill(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Write ``df`` to the directory and return it read back, so the in-memory original can be freed."""
+        return self.load(self.dump(df))
@@ -0,0 +1,146 @@
+"""Summarize how a table fares against an ``Enforcer`` as counts, without keeping per-row results.
+
+Each test of each (member) column is run on the whole column and its boolean result is reduced to a
+count straight away, so the summary only ever holds one row per (column, test): its memory does not
+grow with the number of rows. The table may also be given as an iterable of chunks (e.g. from
+``pd.read_csv(..., chunksize=...)``), in which case counts are added up chunk by chunk, distinct
+values are estimated with a ``HyperLogLog`` sketch, and ``unique`` is only checked within each chunk.
+"""
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from table_enforcer.preflight import HyperLogLog
+from table_enforcer.utils import validate as v
+from table_enforcer.utils.strings import to_bool
+
+__all__ = [
+    "SUMMARY_COLUMNS",
+    "summarize",
+]
+
+SUMMARY_COLUMNS = ["rows", "passed", "failed", "nulls", "distinct"]
+
+
+def _members(column) -> list:
+    """Return ``[column]`` or, if compound, its input columns followed by its output columns."""
+    if not hasattr(column, "input_columns"):
+        return [column]
+    return column.input_columns + column.output_columns
+
+
+def _member_series(column, table: pd.DataFrame) -> t.Iterator[pd.Series]:
+    """Yield the series tested by each of ``_members(column)``, output members reading the transformed table."""
+    if not hasattr(column, "input_columns"):
+        yield table[column.name]
+        return
+
+    for member in column.input_columns:
+        yield table[member.name]
+
+    transformed = column.column_transform(table)
+    for member in column.output_columns:
+        yield transformed[member.name]
+
+
+def _tests(member, series: pd.Series) -> t.Iterator[t.Tuple[str, pd.Series]]:
+    """Yield ``(name, results)`` for each test of ``member``, in the order of ``Column.validate``'s columns."""
+    for name, func in member.validators.items():
+        yield name, member._call("validator", name, func, series)
+
+    yield "dtype", member._call("validator", "dtype", member._validate_series_dtype, series)
+
+    if member.unique:
+        yield "unique", member._call("validator", "unique", v.funcs.unique, series)
+
+
+class _MemberCounts(object):
+    """Running counts of one member column: rows, nulls, distinct values and rows passing each test."""
+
+    def __init__(self, member, estimate_distinct: bool) -> None:
+        self.member = member
+        self.rows = 0
+        self.nulls = 0
+        self.passed = {}
+        self.distinct = None
+        self.sketch = HyperLogLog() if estimate_distinct else None
+        self.hashable = True
+
+    def add(self, series: pd.Series) -> None:
+        self.rows += series.shape[0]
+        self.nulls += int(series.isnull().sum())
+
+        for name, results in _tests(self.member, series):
+            # null results count as passing, as they do in ``find_failed_rows``
+            passed = int(np.count_nonzero(to_bool(pd.Series(results)).to_numpy()))
+            self.passed[name] = self.passed.get(name, 0) + passed
+
+        if not self.hashable:
+            return
+        try:
+            if self.sketch is None:
+                self.distinct = int(series.nunique(dropna=True))
+            else:
+                self.sketch.add(series.dropna())
+        except TypeError:
+            # unhashable values, e.g. lists
+            self.hashable = False
+
+    def records(self) -> t.List[dict]:
+        distinct = self.distinct
+        if not self.hashable:
+            distinct = None
+        elif self.sketch is not None:
+            distinct = round(self.sketch.count())
+
+        return [{
+            "column": self.member.name,
+            "check": name,
+            "rows": self.rows,
+            "passed": passed,
+            "failed": self.rows - passed,
+            "nulls": self.nulls,
+            "distinct": distinct,
+        } for name, passed in self.passed.items()]
+
+
+def _frame(records: t.List[dict]) -> pd.DataFrame:
+    """Return the summary ``records`` as a dataframe indexed by ``(column, check)``."""
+    summary = pd.DataFrame.from_records(records, columns=["column", "check"] + SUMMARY_COLUMNS)
+    summary = summary.astype({name: "int64" for name in SUMMARY_COLUMNS[:-1]})
+    summary["distinct"] = summary["distinct"].astype("Int64")
+    return summary.set_index(["column", "check"])
+
+
+def summarize(enforcer, source) -> pd.DataFrame:
+    """Return the number of rows passing and failing each test of each column of ``source``.
+
+    The result has one row per (column, test), indexed by ``column`` and ``check``. Tests are the
+    column's validators followed by ``dtype`` and, for unique columns, ``unique``; members of compound
+    columns are listed under their own names, output members being tested on the transformed table.
+    ``rows``, ``passed`` and ``failed`` count rows, null results counting as passing. ``nulls`` and
+    ``distinct`` describe the values of the column and are repeated on each of its tests; ``distinct``
+    excludes nulls and is missing for columns of unhashable values.
+
+    Args:
+        enforcer (Enforcer): The table definition.
+        source (pd.DataFrame, iterable): The table, or an iterable of its chunks.
+    """
+    chunked = not isinstance(source, pd.DataFrame)
+    chunks = source if chunked else [source]
+
+    counts = [[_MemberCounts(member, estimate_distinct=chunked) for member in _members(column)]
+              for column in enforcer.columns]
+
+    for chunk in chunks:
+        for column, member_counts in zip(enforcer.columns, counts):
+            for series, member_count in zip(_member_series(column, chunk), member_counts):
+                member_count.add(series)
+
+    records = []
+    for member_counts in counts:
+        for member_count in member_counts:
+            records.extend(member_count.records())
+
+    return _frame(records)
@@ -0,0 +1,64 @@
+"""Provide decoration functions to augment the behavior of recoder functions.
+
+Wrappers built by the parameterized builtins record their name and arguments in a ``spec``
+attribute, from which other backends (e.g. Polars) can rebuild them.
+"""
+import functools
+
+from table_enforcer.utils import strings
+
+
+def pure(version=None):
+    """Declare that a recoder maps each value on its own and always maps equal values to equal results.
+
+    Pure recoders are eligible for value-level result caching (see ``table_enforcer.cache.RecoderCache``).
+    Bump ``version`` whenever the logic changes in a way the function's bytecode would not reveal
+    (e.g. an external lookup table it reads from is updated). Without ``version``, a tag already set
+    with ``table_enforcer.fingerprint.version`` is kept.
+    """
+    def decorator(function):
+        """Mark the function as pure."""
+        function.pure = True
+        if version is not None or not hasattr(function, "version"):
+            function.version = version
+        if getattr(function, "inplace", None) is None:
+            # a pure recoder cannot modify its input
+            function.inplace = False
+        return function
+
+    return decorator
+
+
+def inplace(mutates=True):
+    """Declare whether a recoder modifies the series it is given.
+
+    ``Column.recode`` copies the source data at most once, right before the first recoder that may
+    modify it. Recoders declared ``inplace(False)`` must leave their input untouched and return a new
+    object; they are handed the caller's data without a copy. Recoders declared ``inplace(True)``,
+    and recoders with no declaration, are always handed data the column owns.
+    """
+    def decorator(function):
+        """Mark whether the function modifies its input."""
+        function.inplace = mutates
+        return function
+
+    return decorator
+
+
+def replace(pattern, repl, flags=0):
+    """Replace every match of the regular expression `pattern` in the data items with `repl`.
+
+    String columns are handled by a native kernel and come back as an Arrow-backed string dtype.
+    """
+    def decorator(function):
+        """Decorate a function with args."""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            """Wrap the function."""
+            series = function(*args, **kwargs)
+            return strings.replace(series, pattern, repl, flags=flags)
+
+        wrapper.spec = ("replace", {"pattern": pattern, "repl": repl, "flags": flags})
+        return wrapper
+
+    return decorator
@@ -6,13 +6,24 @@ instead of returning a series of `True`/`False` values, it performs some operati
 the data that gets the column data closer to being how you want it to look during
 analysis operations.
 """
+from table_enforcer.utils import strings
 
+from .decorators import inplace
 
+
+@inplace(False)
 def upper(series):
     """Transform all text to uppercase."""
-    return series.str.upper()
+    text = strings.as_strings(series)
+    if text is None:
+        return series.str.upper()
+    return text.str.upper()
 
 
+@inplace(False)
 def lower(series):
     """Transform all text to lowercase."""
-    return series.str.lower()
+    text = strings.as_strings(series)
+    if text is None:
+        return series.str.lower()
+    return text.str.lower()
@@ -0,0 +1,117 @@
+"""Provide the vectorized string kernels behind the builtin string validators and recoders.
+
+Columns holding only strings (and nulls) are converted once to pandas' Arrow-backed
+``string[pyarrow]`` dtype when ``pyarrow`` is installed, or to the plain ``string`` dtype
+otherwise, so the ``.str`` methods run as native kernels instead of Python loops.
+Columns that mix strings with other objects keep the original object-dtype behavior.
+"""
+import typing as t
+
+import pandas as pd
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pa = None
+    pc = None
+
+__all__ = [
+    "STRING_DTYPE",
+    "as_strings",
+    "to_bool",
+    "match",
+    "replace",
+    "split",
+    "substring",
+]
+
+STRING_DTYPE = pd.StringDtype("pyarrow" if pa is not None else "python")
+
+# errors raised when a pattern uses syntax the native regex engine (RE2) does not support
+_NATIVE_REGEX_ERRORS = (NotImplementedError, ) if pa is None else (NotImplementedError, pa.ArrowInvalid)
+
+
+def as_strings(series: pd.Series) -> t.Optional[pd.Series]:
+    """Return ``series`` as ``STRING_DTYPE``, or None if it holds anything other than strings and nulls."""
+    if isinstance(series.dtype, pd.StringDtype):
+        return series
+    if series.dtype != object or pd.api.types.infer_dtype(series, skipna=True) != "string":
+        return None
+    return series.astype(STRING_DTYPE)
+
+
+def to_bool(results: pd.Series) -> pd.Series:
+    """Return validation ``results`` as numpy bools, treating nulls as passing like ``find_failed_rows`` does."""
+    if results.dtype == bool:
+        return results
+    return pd.Series(results.fillna(True).to_numpy(dtype=bool), index=results.index, name=results.name)
+
+
+def match(series: pd.Series, pattern: str, flags=0, fullmatch=False) -> pd.Series:
+    """Return whether each item matches the regular expression ``pattern``."""
+    strings = as_strings(series)
+    if strings is None:
+        strings = series.astype(str).where(series.notnull())
+
+    method = "fullmatch" if fullmatch else "match"
+    try:
+        results = getattr(strings.str, method)(pattern, flags=flags)
+    except _NATIVE_REGEX_ERRORS:
+        results = getattr(strings.astype(object).str, method)(pattern, flags=flags)
+
+    return to_bool(results)
+
+
+def replace(series: pd.Series, pattern: str, repl: str, flags=0) -> pd.Series:
+    """Return ``series`` with every match of the regular expression ``pattern`` replaced by ``repl``."""
+    strings = as_strings(series)
+    if strings is None:
+        return series.str.replace(pattern, repl, flags=flags, regex=True)
+
+    try:
+        return strings.str.replace(pattern, repl, flags=flags, regex=True)
+    except _NATIVE_REGEX_ERRORS:
+        return strings.astype(object).str.replace(pattern, repl, flags=flags, regex=True).astype(STRING_DTYPE)
+
+
+def _from_arrow(array, index: pd.Index) -> pd.Series:
+    """Return a ``STRING_DTYPE`` Series wrapping the Arrow string ``array``."""
+    return pd.Series(pd.arrays.ArrowStringArray(array), index=index)
+
+
+def _is_arrow(series: pd.Series) -> bool:
+    return pa is not None and series.dtype == STRING_DTYPE and series.dtype.storage == "pyarrow"
+
+
+def split(series: pd.Series, sep: str, parts: int) -> t.List[pd.Series]:
+    """Split every item of ``series`` on ``sep`` at most ``parts - 1`` times, in a single pass.
+
+    Return one series per part. Items with fewer parts get nulls in the missing parts.
+    """
+    if not _is_arrow(series):
+        expanded = series.str.split(sep, n=parts - 1, expand=True, regex=False)
+        return [expanded.get(i, pd.Series(None, index=series.index, dtype=object)) for i in range(parts)]
+
+    array = pa.array(series.array)
+    if isinstance(array, pa.ChunkedArray):
+        # the offsets below index a single list array
+        array = array.combine_chunks()
+
+    lists = pc.split_pattern(array, sep, max_splits=parts - 1)
+    offsets = lists.offsets.to_numpy()
+    lengths = np.diff(offsets)
+
+    return [
+        _from_arrow(lists.values.take(pa.array(offsets[:-1] + i, mask=lengths <= i)), series.index)
+        for i in range(parts)
+    ]
+
+
+def substring(series: pd.Series, start: int, stop: int) -> pd.Series:
+    """Return the characters ``start:stop`` of every item of ``series``."""
+    if not _is_arrow(series):
+        return series.str.slice(start, stop)
+    return _from_arrow(pc.utf8_slice_codeunits(pa.array(series.array), start, stop), series.index)
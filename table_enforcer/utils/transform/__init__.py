@@ -0,0 +1 @@
+from . import funcs  # noqa: F401,F403
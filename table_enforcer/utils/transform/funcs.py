@@ -0,0 +1,126 @@
+"""Provide builtin ``column_transform`` factories for ``CompoundColumn``.
+
+Each factory returns a function accepting the table object and returning a DataFrame containing
+the NEW columns only, as ``CompoundColumn`` expects. The work is done columnwise, never by
+applying a Python function to each row. Each transform records the factory that built it and its
+arguments in a ``spec`` attribute, from which other backends (e.g. Polars) can rebuild it.
+"""
+import re
+import typing as t
+
+import pandas as pd
+
+from table_enforcer.utils import strings
+
+
+def zip_columns(columns: t.List[str], name: str) -> t.Callable[[pd.DataFrame], pd.DataFrame]:
+    """Return a transform combining ``columns`` into a single column ``name`` holding one tuple per row.
+
+    The tuples are built by zipping the underlying arrays, which replaces the
+    ``df.apply(lambda row: (...), axis=1)`` idiom. Validate the components of the new column with
+    ``validate.decorators.components``.
+    """
+    columns = list(columns)
+
+    def zip_transform(table: pd.DataFrame) -> pd.DataFrame:
+        values = [table[column].to_numpy(dtype=object) for column in columns]
+        packed = pd.Series(list(zip(*values)), index=table.index, dtype=object)
+        return pd.DataFrame({name: packed}, index=table.index)
+
+    zip_transform.__name__ = f"zip_{name}"
+    zip_transform.spec = ("zip_columns", {"columns": columns, "name": name})
+    return zip_transform
+
+
+def hash_columns(columns: t.List[str], name: str) -> t.Callable[[pd.DataFrame], pd.DataFrame]:
+    """Return a transform combining ``columns`` into a single ``uint64`` composite key column ``name``.
+
+    Rows with equal values in ``columns`` get equal keys, so the result can stand in for the
+    combination in ``unique`` checks and joins. Distinct combinations collide with negligible probability.
+    """
+    columns = list(columns)
+
+    def hash_transform(table: pd.DataFrame) -> pd.DataFrame:
+        keys = pd.util.hash_pandas_object(table[columns], index=False)
+        return pd.DataFrame({name: keys.to_numpy()}, index=table.index)
+
+    hash_transform.__name__ = f"hash_{name}"
+    hash_transform.spec = ("hash_columns", {"columns": columns, "name": name})
+    return hash_transform
+
+
+def _source(table: pd.DataFrame, column: str) -> pd.Series:
+    """Return ``column`` of ``table`` as the native string dtype when it holds only strings and nulls."""
+    source = strings.as_strings(table[column])
+    if source is None:
+        return table[column]
+    return source
+
+
+def _typed(parts: pd.DataFrame, names: t.List[str], dtypes) -> pd.DataFrame:
+    """Return ``parts`` with columns ``names``, cast to ``dtypes`` (a mapping or one dtype for all columns)."""
+    parts.columns = names
+    if dtypes is not None:
+        parts = parts.astype(dtypes)
+    return parts
+
+
+def split(column: str, names: t.List[str], sep: str, dtypes=None) -> t.Callable[[pd.DataFrame], pd.DataFrame]:
+    """Return a transform splitting ``column`` on ``sep`` into the new columns ``names``.
+
+    The column is split once, at most ``len(names) - 1`` times, so any further separators stay
+    in the last part. Items with too few parts get nulls in the missing columns.
+    """
+    names = list(names)
+
+    def split_transform(table: pd.DataFrame) -> pd.DataFrame:
+        parts = strings.split(_source(table, column), sep, len(names))
+        return _typed(pd.concat(parts, axis=1, keys=range(len(names))), names, dtypes)
+
+    split_transform.__name__ = f"split_{column}"
+    split_transform.spec = ("split", {"column": column, "names": names, "sep": sep, "dtypes": dtypes})
+    return split_transform
+
+
+def extract(column: str, pattern: str, names: t.List[str] = None, flags=0,
+            dtypes=None) -> t.Callable[[pd.DataFrame], pd.DataFrame]:
+    """Return a transform emitting one new column per capture group of the regular expression ``pattern``.
+
+    Columns are named after the groups of ``pattern``, or ``names`` if given. Items that do not
+    match get nulls in every new column.
+    """
+    compiled = re.compile(pattern, flags=flags)
+    if names is None:
+        groups = {position: name for name, position in compiled.groupindex.items()}
+        names = [groups.get(position, f"{column}_{position}") for position in range(1, compiled.groups + 1)]
+    names = list(names)
+
+    def extract_transform(table: pd.DataFrame) -> pd.DataFrame:
+        parts = _source(table, column).str.extract(pattern, flags=flags, expand=True)
+        return _typed(parts, names, dtypes)
+
+    extract_transform.__name__ = f"extract_{column}"
+    extract_transform.spec = (
+        "extract", {"column": column, "pattern": pattern, "names": names, "flags": flags, "dtypes": dtypes})
+    return extract_transform
+
+
+def fixed_width(column: str, widths: t.List[int], names: t.List[str],
+                dtypes=None) -> t.Callable[[pd.DataFrame], pd.DataFrame]:
+    """Return a transform slicing ``column`` into consecutive fields of ``widths`` characters named ``names``."""
+    names = list(names)
+    bounds = [0]
+    for width in widths:
+        bounds.append(bounds[-1] + width)
+
+    def fixed_width_transform(table: pd.DataFrame) -> pd.DataFrame:
+        source = _source(table, column)
+        fields = zip(bounds, bounds[1:])
+        parts = pd.DataFrame({i: strings.substring(source, start, stop) for i, (start, stop) in enumerate(fields)},
+                             index=table.index)
+        return _typed(parts, names, dtypes)
+
+    fixed_width_transform.__name__ = f"fixed_width_{column}"
+    fixed_width_transform.spec = (
+        "fixed_width", {"column": column, "widths": list(widths), "names": names, "dtypes": dtypes})
+    return fixed_width_transform
@@ -1,6 +1,30 @@
-"""Provide decoration functions to augment the behavior of validator functions."""
+"""Provide decoration functions to augment the behavior of validator functions.
+
+Wrappers built by the parameterized builtins record their name and arguments in a ``spec``
+attribute, from which other backends (e.g. Polars) can rebuild them.
+"""
 import functools
 
+import numpy as np
+import pandas as pd
+
+from table_enforcer.utils import strings
+
+
+def row_local(local=True):
+    """Declare whether a validator judges each item on its own, without looking at the other items.
+
+    Validators are assumed row-local unless declared ``row_local(False)``. When asked only for failed
+    rows, columns may then run a validator only on the rows that passed the other tests. Validators
+    declared ``row_local(False)``, such as ``unique``, always see the whole column.
+    """
+    def decorator(function):
+        """Mark whether the function is row-local."""
+        function.row_local = local
+        return function
+
+    return decorator
+
 
 def minmax(low, high):
     """Test that the data items fall within range: low <= x <= high."""
@@ -15,6 +39,7 @@ def minmax(low, high):
 
             return lo_pass & hi_pass
 
+        wrapper.spec = ("minmax", {"low": low, "high": high})
         return wrapper
 
     return decorator
@@ -30,6 +55,7 @@ def choice(choices):
             series = function(*args, **kwargs)
             return series.isin(set(choices))
 
+        wrapper.spec = ("choice", {"choices": choices})
         return wrapper
 
     return decorator
@@ -54,7 +80,62 @@ def bounded_length(low, high=None):
 
                 return lo_pass & hi_pass
 
+        wrapper.spec = ("bounded_length", {"low": low, "high": high})
+        return wrapper
+
+    return decorator
+
+
+def match(pattern, flags=0, fullmatch=False):
+    """Test that the data items match the regular expression `pattern`.
+
+    Strings are matched with a native kernel; other items are matched against their `str()` form.
+    Null items pass. If fullmatch is True, the whole item must match rather than its beginning.
+    """
+    def decorator(function):
+        """Decorate a function with args."""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            """Wrap the function."""
+            series = function(*args, **kwargs)
+            return strings.match(series, pattern, flags=flags, fullmatch=fullmatch)
+
+        wrapper.spec = ("match", {"pattern": pattern, "flags": flags, "fullmatch": fullmatch})
         return wrapper
 
     return decorator
 
+
+def components(*validators):
+    """Test the components of tuple data items columnwise: the i-th validator tests the i-th components.
+
+    The tuples are unpacked into one series per component, so each validator runs once over a
+    whole component rather than once per tuple. Use None to leave a component untested.
+    Null items pass; tuples with the wrong number of components fail.
+    """
+    def decorator(function):
+        """Decorate a function with args."""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            """Wrap the function."""
+            series = function(*args, **kwargs)
+            passed = np.ones(len(series), dtype=bool)
+
+            positions = np.flatnonzero(series.notnull().to_numpy())
+            sizes = series.iloc[positions].map(len).to_numpy()
+            passed[positions[sizes != len(validators)]] = False
+            positions = positions[sizes == len(validators)]
+
+            if positions.size > 0:
+                unpacked = pd.DataFrame(series.iloc[positions].tolist(), index=series.index[positions])
+                for position, validator in enumerate(validators):
+                    if validator is not None:
+                        results = pd.Series(validator(unpacked[position].rename(series.name)))
+                        passed[positions] &= results.fillna(True).to_numpy(dtype=bool)
+
+            return pd.Series(passed, index=series.index, name=series.name)
+
+        wrapper.spec = ("components", {"validators": validators})
+        return wrapper
+
+    return decorator
@@ -6,6 +6,10 @@ containing `True` or `False` relative to which items passed the
 validation logic.
 """
 import pandas as pd
+
+from table_enforcer.utils import strings
+
+from .decorators import row_local
 # import numpy as np
 
 # from table_enforcer import errors as e
@@ -27,6 +31,7 @@ def negative(series: pd.Series) -> pd.Series:
     return series < 0
 
 
+@row_local(False)
 def unique(series: pd.Series) -> pd.Series:
     """Test that the data items do not repeat."""
     return ~series.duplicated(keep=False)
@@ -34,10 +39,16 @@ def unique(series: pd.Series) -> pd.Series:
 
 def upper(series):
     """Test that the data items are all uppercase."""
-    return series.str.isupper()
+    text = strings.as_strings(series)
+    if text is None:
+        return series.str.isupper()
+    return strings.to_bool(text.str.isupper())
 
 
 def lower(series):
     """Test that the data items are all lowercase."""
-    return series.str.islower()
+    text = strings.as_strings(series)
+    if text is None:
+        return series.str.islower()
+    return strings.to_bool(text.str.islower())
 
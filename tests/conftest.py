@@ -3,7 +3,7 @@ from pathlib import Path
 import pytest
 import pandas as pd
 
-from table_enforcer import Column, Enforcer
+from table_enforcer import Column, CompoundColumn, Enforcer
 import table_enforcer.errors as e
 
 from table_enforcer import validate as v
@@ -85,3 +85,12 @@ def col4_no_recoders(col4_validators):
 @pytest.fixture()
 def enforcer(col4):
     return Enforcer(columns=[col4])
+
+
+@pytest.fixture()
+def abs_x():
+    """Return a compound column whose output ``x`` shares the name of its input ``x``."""
+    return CompoundColumn(
+        input_columns=[Column(name='x', dtype=int, unique=False, validators=[v.funcs.positive], recoders=[])],
+        output_columns=[Column(name='x', dtype=int, unique=False, validators=[v.funcs.positive], recoders=[])],
+        column_transform=lambda table: table[["x"]].abs(),)
@@ -0,0 +1,130 @@
+"""Test the unit: adaptive ordering of validators."""
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from .conftest import demo_good_df  # noqa: F401
+
+from table_enforcer import Column, CompoundColumn, Enforcer
+from table_enforcer import validate as v
+from table_enforcer import transform as tr
+from table_enforcer.adaptive import STATS_COLUMNS, ValidatorStats
+
+
+def counting(seen, func, delay=0.0):
+    """Return ``func`` recording the number of rows of each call in ``seen``."""
+    def check(series):
+        seen.append(len(series))
+        if delay:
+            time.sleep(delay)
+        return func(series)
+
+    check.__name__ = func.__name__
+    return check
+
+
+@pytest.fixture()
+def table():
+    rng = np.random.default_rng(0)
+    values = rng.integers(-5, 10, size=1000).astype(float)
+    values[rng.random(1000) < 0.8] = np.nan
+    return pd.DataFrame({"col1": values})
+
+
+def test_order():
+    stats = ValidatorStats()
+    stats.record("slow", 100, 1.0, 10)
+    stats.record("cheap", 100, 0.01, 80)
+    stats.record("never_fails", 100, 0.001, 0)
+
+    assert stats.order(["never_fails", "slow", "new", "cheap"]) == ["new", "cheap", "slow", "never_fails"]
+    assert list(stats.to_frame().columns) == STATS_COLUMNS
+    assert stats.to_frame().loc["cheap", "failure_rate"] == 0.8
+
+
+def test_later_validators_only_see_passing_rows(table):
+    seen = []
+    expensive = counting(seen, v.funcs.positive, delay=0.01)
+    column = Column(name='col1', dtype=float, unique=False, validators=[expensive, v.funcs.not_null], recoders=[])
+
+    first = column.validate(table, failed_only=True)
+    assert seen == [1000]
+
+    second = column.validate(table, failed_only=True)
+    passing = int((table.col1.notnull()).sum())
+    assert seen == [1000, passing]
+    assert list(column.validator_stats.order(["positive", "not_null"])) == ["not_null", "positive"]
+
+    # the same rows fail; tests a row was spared are null
+    assert list(second.index) == list(first.index)
+    assert list(second.columns) == ["positive", "not_null", "dtype"]
+    assert second.positive[table.col1.isnull()].isna().all()
+    assert not second.not_null[table.col1.isnull()].any()
+
+
+def test_full_results(table):
+    column = Column(name='col1', dtype=float, unique=False, validators=[v.funcs.positive, v.funcs.not_null], recoders=[])
+    column.validate(table, failed_only=True)
+
+    full = column.validate(table, failed_only=True, full=True)
+    results = column.validate(table)
+    expected = results[~results.all(axis=1)]
+    pd.testing.assert_frame_equal(full, expected)
+
+
+def test_unique_sees_whole_column():
+    table = pd.DataFrame({"col1": [1, 2, 3, 4, 5, 1]})
+
+    def last_two(series):
+        return pd.Series(series.index >= 4, index=series.index)
+
+    column = Column(name='col1', dtype=int, unique=True, validators=[last_two], recoders=[])
+    failed = column.validate(table, failed_only=True)
+
+    # row 5 passed ``last_two`` but duplicates row 0, which did not
+    assert list(failed.index) == [0, 1, 2, 3, 5]
+    assert not failed.loc[5, "unique"]
+    assert failed.loc[0, "dtype"] is pd.NA
+
+
+def test_enforcer_validate_stops_at_first_failure(demo_good_df):
+    seen = []
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[v.funcs.negative], recoders=[])
+    col2 = Column(name='col2', dtype=str, unique=False, validators=[counting(seen, v.funcs.not_null)], recoders=[])
+    col5 = CompoundColumn(
+        input_columns=[Column(name='col5', dtype=str, unique=False, validators=[v.funcs.upper], recoders=[])],
+        output_columns=[Column(name='col5_word', dtype=str, unique=False, validators=[], recoders=[])],
+        column_transform=tr.funcs.split("col5", ["col5_number", "col5_word"], ":"),)
+
+    assert not Enforcer(columns=[col1, col2]).validate(demo_good_df)
+    assert seen == []
+
+    col5.column_transform = lambda table: pytest.fail("transform ran after an input column failed")
+    assert not col5._passes(demo_good_df)
+
+
+def test_enforcer_validator_stats(demo_good_df):
+    col1 = Column(name='col1', dtype=int, unique=True, validators=[v.funcs.positive], recoders=[])
+    col5 = CompoundColumn(
+        input_columns=[Column(name='col5', dtype=str, unique=False, validators=[v.funcs.not_null], recoders=[])],
+        output_columns=[Column(name='col5_word', dtype=str, unique=False, validators=[v.funcs.upper], recoders=[])],
+        column_transform=tr.funcs.split("col5", ["col5_number", "col5_word"], ":"),)
+    enforcer = Enforcer(columns=[col1, col5])
+
+    enforcer.validate(demo_good_df)
+    stats = enforcer.validator_stats()
+
+    assert list(stats.index.names) == ["column", "validator"]
+    assert stats.loc[("col1", "positive"), "rows"] == 4
+    assert stats.loc[("col5_word", "upper"), "failures"] == 4
+
+
+def test_batch_results_match(demo_good_df):
+    col4 = Column(name='col4', dtype=str, unique=True, validators=[v.funcs.upper, v.funcs.not_null], recoders=[])
+    enforcer = Enforcer(columns=[col4])
+    tables = [demo_good_df, demo_good_df.assign(col4=["M", "F", "X", "Y"])]
+
+    assert enforcer.validate_many(tables) == [False, True]
+    assert enforcer.validate_many(tables) == [False, True]
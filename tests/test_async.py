@@ -0,0 +1,107 @@
+"""Test the unit: Enforcer.avalidate/arecode."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from .conftest import col4, col4_no_recoders, col4_validators, col4_recoders, source_table  # noqa: F401
+
+from table_enforcer import Column, Enforcer
+from table_enforcer import validate as v
+from table_enforcer import recode as r
+from table_enforcer.cache import RecoderCache
+from table_enforcer.errors import ValidationError
+
+
+@r.decorators.pure()
+def doubled(series):
+    return series * 2
+
+
+def slow_positive(series):
+    time.sleep(0.2)
+    return v.funcs.positive(series)
+
+
+def test_avalidate(col4, col4_no_recoders, source_table):
+    assert asyncio.run(Enforcer(columns=[col4]).avalidate(source_table)) is False
+
+    recoded = Enforcer(columns=[col4]).recode(source_table)
+    assert asyncio.run(Enforcer(columns=[col4]).avalidate(recoded)) is True
+
+
+def test_arecode(col4, col4_no_recoders, source_table):
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[v.funcs.positive], recoders=[])
+    enforcer = Enforcer(columns=[col1, col4])
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        recoded = asyncio.run(enforcer.arecode(source_table, validate=True, executor=executor))
+    assert recoded.equals(enforcer.recode(source_table, validate=True))
+
+    with pytest.raises(ValidationError):
+        asyncio.run(Enforcer(columns=[col4_no_recoders]).arecode(source_table, validate=True))
+
+
+def test_arecode_with_cache(tmp_path, source_table):
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[v.funcs.positive], recoders=[doubled])
+    enforcer = Enforcer(columns=[col1, col1, col1])
+    cache = RecoderCache(tmp_path / "cache.sqlite")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        first = asyncio.run(enforcer.arecode(source_table, validate=True, cache=cache, executor=executor))
+        second = asyncio.run(enforcer.arecode(source_table, validate=True, cache=cache, executor=executor))
+
+    assert first.equals(enforcer.recode(source_table, validate=True))
+    assert second.equals(first)
+    assert cache.hits >= 3 * source_table.col1.nunique()
+    cache.close()
+
+
+def test_event_loop_not_blocked(source_table):
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[slow_positive], recoders=[])
+    enforcer = Enforcer(columns=[col1, col1])
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        tick_task = asyncio.ensure_future(ticker())
+        result = await enforcer.avalidate(source_table, max_concurrency=1)
+        tick_task.cancel()
+        return result
+
+    assert asyncio.run(main()) is True
+    assert len(ticks) > 10
+
+
+def test_max_concurrency(source_table):
+    active, peak = [], []
+    lock = threading.Lock()
+
+    def tracked(series):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+        return v.funcs.positive(series)
+
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[tracked], recoders=[])
+    enforcer = Enforcer(columns=[col1] * 4)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        asyncio.run(enforcer.avalidate(source_table, executor=executor, max_concurrency=2))
+    assert max(peak) == 2
+
+
+def test_timeout(source_table):
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[slow_positive], recoders=[])
+    enforcer = Enforcer(columns=[col1, col1, col1])
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(enforcer.avalidate(source_table, max_concurrency=1, timeout=0.05))
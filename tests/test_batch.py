@@ -0,0 +1,111 @@
+"""Test the unit: batched validation and recoding of many tables."""
+import pandas as pd
+import pytest
+
+from .conftest import abs_x, demo_good_df  # noqa: F401
+
+from table_enforcer import Column, CompoundColumn, Enforcer
+from table_enforcer import validate as v
+from table_enforcer import recode as r
+from table_enforcer import transform as tr
+from table_enforcer.batch import Batch
+from table_enforcer.errors import ValidationError
+
+
+@pytest.fixture()
+def enforcer():
+    col1 = Column(name='col1', dtype=int, unique=True, validators=[v.funcs.positive], recoders=[])
+    col4 = Column(name='col4', dtype=str, unique=False, validators=[v.funcs.upper], recoders=[r.funcs.upper])
+    col5 = CompoundColumn(
+        input_columns=[Column(name='col5', dtype=str, unique=False, validators=[v.funcs.not_null], recoders=[])],
+        output_columns=[
+            Column(name='col5_number', dtype=str, unique=False, validators=[], recoders=[]),
+            Column(name='col5_word', dtype=str, unique=False, validators=[], recoders=[r.funcs.upper]),
+        ],
+        column_transform=tr.funcs.split("col5", ["col5_number", "col5_word"], ":"),)
+    return Enforcer(columns=[col1, col4, col5])
+
+
+@pytest.fixture()
+def tables(demo_good_df):
+    good = demo_good_df.assign(col4=["M", "M", "F", "F"])
+    return {
+        "good.csv": good,
+        "labeled.csv": good.set_axis(["a", "b", "c", "d"]),
+        "negative.csv": good.assign(col1=[7, -2, 6, 5]),
+        "lowercase.csv": good.assign(col4=["M", "m", "F", "F"]),
+        "repeated.csv": good.assign(col1=[7, 7, 6, 5]),
+        "empty.csv": good.iloc[:0],
+    }
+
+
+def test_batch_split(tables):
+    batch = Batch(tables)
+
+    assert batch.table.shape[0] == 20
+    assert list(batch.sources) == [0] * 4 + [1] * 4 + [2] * 4 + [3] * 4 + [4] * 4
+    for part, table in zip(batch.split(batch.table), tables.values()):
+        pd.testing.assert_frame_equal(part, table)
+
+
+def test_validate_many(enforcer, tables):
+    results = enforcer.validate_many(tables)
+
+    assert results == {name: enforcer.validate(table) for name, table in tables.items()}
+    assert results == {
+        "good.csv": True,
+        "labeled.csv": True,
+        "negative.csv": False,
+        "lowercase.csv": False,
+        "repeated.csv": False,
+        "empty.csv": True,
+    }
+
+    # values repeated across tables are still unique within each one
+    assert enforcer.validate_many([tables["good.csv"]] * 3) == [True, True, True]
+    assert enforcer.validate_many([]) == []
+
+
+def test_recode_many(enforcer, tables):
+    recoded = enforcer.recode_many(tables)
+
+    assert list(recoded) == list(tables)
+    for name, table in tables.items():
+        pd.testing.assert_frame_equal(recoded[name], enforcer.recode(table), check_dtype=table.shape[0] > 0)
+
+    validated = enforcer.recode_many([tables["labeled.csv"], tables["lowercase.csv"]], validate=True)
+    pd.testing.assert_frame_equal(validated[1], enforcer.recode(tables["lowercase.csv"], validate=True))
+
+
+def test_recode_many_reports_sources(enforcer, tables):
+    with pytest.raises(ValidationError) as err:
+        enforcer.recode_many({"labeled.csv": tables["labeled.csv"], "repeated.csv": tables["repeated.csv"]},
+                             validate=True)
+
+    message = str(err.value)
+    assert "column 'col1'" in message
+    assert "repeated.csv" in message and "labeled.csv" not in message
+
+
+def test_output_named_like_input(abs_x):
+    tables = [pd.DataFrame({"x": [1, 2]}), pd.DataFrame({"x": [1, -2, 3]})]
+    enforcer = Enforcer(columns=[abs_x])
+
+    assert enforcer.validate_many(tables) == [True, False]
+    with pytest.raises(ValidationError, match="column 'x'"):
+        enforcer.recode_many(tables, validate=True)
+
+
+def test_mixed_dtypes_are_not_upcast():
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[v.funcs.positive], recoders=[])
+    enforcer = Enforcer(columns=[col1])
+    ints = pd.DataFrame({"col1": [1, 2]})
+    floats = pd.DataFrame({"col1": [1.5, None]})
+
+    assert enforcer.validate_many([ints, floats, ints]) == [True, False, True]
+    assert enforcer.validate_many({"ints": ints, "floats": floats}) == {"ints": True, "floats": False}
+
+    recoded = enforcer.recode_many([ints, floats, ints])
+    assert [table.col1.dtype for table in recoded] == ["int64", "float64", "int64"]
+    pd.testing.assert_frame_equal(recoded[0], enforcer.recode(ints))
+    pd.testing.assert_frame_equal(recoded[1], enforcer.recode(floats))
@@ -0,0 +1,45 @@
+"""Test the unit: benchmark suite."""
+from benchmarks import generators as g
+from benchmarks import run as bench
+
+
+def test_make_table():
+    table = g.make_table(rows=1000, numeric_columns=3, string_columns=1, string_length=5, cardinality=10, seed=1)
+
+    assert table.shape == (1000, 3 + 1 + 1 + len(g.FLAG_COLUMNS))
+    assert table.str_0.nunique() <= 10
+    assert (table.str_0.str.len() == 5).all()
+    assert table.num_2.between(2, 10).all()
+    assert table.equals(g.make_table(rows=1000, numeric_columns=3, string_columns=1, string_length=5, cardinality=10, seed=1))
+
+    labeled = g.make_table(rows=1000, index="string")
+    assert labeled.index.is_unique and not labeled.index.is_monotonic_increasing
+    assert labeled.index.str.startswith("row_").all()
+
+
+def test_failure_and_null_rates():
+    table = g.make_table(rows=10000, failure_rate=0.1, null_rate=0.1)
+    enforcer = g.make_enforcer(table, compound=True)
+
+    assert not enforcer.validate(table)
+    assert 0.05 < table.num_0.isnull().mean() < 0.15
+    assert 0.05 < (table.num_0 < 0).mean() < 0.15
+
+    clean = g.make_table(rows=1000)
+    assert g.make_enforcer(clean).validate(clean)
+
+
+def test_run_and_compare(tmp_path):
+    results = bench.run(pattern="funcs|otm", repeat=1, rows=100)
+    assert "validate.funcs.unique" in results["results"]
+    assert "compound.otm.recode" in results["results"]
+    assert "enforcer.validate" not in results["results"]
+
+    slower = {"results": {name: {"median": t["median"] * 10} for name, t in results["results"].items()}}
+    assert bench.compare(results, results) == []
+    assert len(bench.compare(slower, results)) == len(results["results"])
+
+    baseline = tmp_path / "baseline.json"
+    assert bench.main(["--rows", "100", "--repeat", "1", "--pattern", "mto", "--save", str(baseline)]) == 0
+    assert bench.main(["--rows", "100", "--repeat", "1", "--pattern", "mto", "--compare", str(baseline),
+                       "--tolerance", "1000"]) == 0
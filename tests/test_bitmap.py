@@ -0,0 +1,104 @@
+"""Test the unit: ValidationBitmap."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from .conftest import abs_x, demo_good_df  # noqa: F401
+
+from table_enforcer import Column, CompoundColumn, Enforcer
+from table_enforcer import validate as v
+from table_enforcer import transform as tr
+from table_enforcer.bitmap import ValidationBitmap
+from table_enforcer.main_classes import find_failed_rows
+
+
+@pytest.fixture()
+def results():
+    rng = np.random.default_rng(0)
+    rows = 1003
+    nullable = pd.array(rng.random(rows) < 0.9, dtype="boolean")
+    nullable[rng.random(rows) < 0.05] = pd.NA
+    return pd.DataFrame({
+        "plain": rng.random(rows) < 0.95,
+        "nullable": nullable,
+        "objects": pd.Series(rng.random(rows) < 0.99, dtype=object).where(rng.random(rows) < 0.9, None),
+    }, index=[f"r{i}" for i in range(rows)])
+
+
+def test_round_trip(results):
+    bitmap = ValidationBitmap.from_frame(results)
+
+    assert bitmap.names == ["plain", "nullable", "objects"]
+    assert bitmap.nbytes <= 5 * 126
+
+    frame = bitmap.to_frame()
+    pd.testing.assert_frame_equal(frame[["plain", "nullable"]], results[["plain", "nullable"]])
+    assert frame.objects.dtype == "boolean"
+    assert frame.objects.isna().tolist() == results.objects.isna().tolist()
+
+
+def test_reductions(results):
+    bitmap = ValidationBitmap.from_frame(results)
+    passed = results.fillna(True).astype(bool)
+
+    expected = find_failed_rows(results)
+    assert bitmap.failed_count() == expected.shape[0]
+    assert list(bitmap.failed_frame().index) == list(expected.index)
+    pd.testing.assert_frame_equal(bitmap.failed_frame().fillna(True).astype(bool), expected.fillna(True).astype(bool))
+
+    assert bitmap.failures().to_dict() == (~passed).sum().to_dict()
+    assert bitmap.nulls().to_dict() == results.isna().sum().to_dict()
+
+    unpack = np.unpackbits(bitmap.reduce("any"), count=bitmap.rows).astype(bool)
+    assert unpack.tolist() == passed.any(axis=1).tolist()
+    assert not bitmap.passes()
+
+
+@pytest.mark.parametrize("rows", [0, 1, 7, 8, 9])
+def test_padding(rows):
+    bitmap = ValidationBitmap(rows)
+    assert bitmap.passes()
+    assert list(bitmap.failed_positions()) == []
+
+    bitmap.add("fails", np.zeros(rows, dtype=bool))
+    assert bitmap.failed_count() == rows
+    assert list(bitmap.failed_positions()) == list(range(rows))
+
+
+def test_wrong_length():
+    with pytest.raises(ValueError, match="expected 3"):
+        ValidationBitmap(3).add("short", np.ones(2, dtype=bool))
+
+
+def test_validate_bitmaps(demo_good_df):
+    col1 = Column(name='col1', dtype=int, unique=True, validators=[v.funcs.negative], recoders=[])
+    col5 = CompoundColumn(
+        input_columns=[Column(name='col5', dtype=str, unique=False, validators=[v.funcs.not_null], recoders=[])],
+        output_columns=[Column(name='col5_word', dtype=str, unique=False, validators=[v.funcs.upper], recoders=[])],
+        column_transform=tr.funcs.split("col5", ["col5_number", "col5_word"], ":"),)
+    table = demo_good_df.set_axis(["d", "b", "a", "c"])
+
+    pairs = Enforcer(columns=[col1, col5]).validate_bitmaps(table)
+    bitmaps = dict(pairs)
+
+    assert [name for name, _ in pairs] == ["col1", "col5", "col5_word"]
+    pd.testing.assert_frame_equal(bitmaps["col1"].to_frame(), col1.validate(table))
+    assert bitmaps["col1"].failures().to_dict() == {"negative": 4, "dtype": 0, "unique": 0}
+    assert bitmaps["col5"].passes()
+    assert list(bitmaps["col5_word"].failed_frame().index) == ["d", "b", "a", "c"]
+
+
+def test_output_named_like_input(abs_x):
+    pairs = Enforcer(columns=[abs_x]).validate_bitmaps(pd.DataFrame({"x": [1, -2, 3]}))
+
+    assert [name for name, _ in pairs] == ["x", "x"]
+    assert [bitmap.failed_count() for _, bitmap in pairs] == [1, 0]
+
+
+def test_full_failed_only_uses_bitmap(demo_good_df, monkeypatch):
+    column = Column(name='col1', dtype=int, unique=False, validators=[v.funcs.negative], recoders=[])
+    monkeypatch.setattr(Column, "_validate_positions", lambda *args, **kwargs: pytest.fail("unpacked results built"))
+
+    failed = column.validate(demo_good_df, failed_only=True, full=True)
+    assert failed.shape == (4, 2)
+    assert not failed.negative.any()
@@ -0,0 +1,131 @@
+"""Test the unit: FailureBudget."""
+import pytest
+from .conftest import abs_x, col4, col4_no_recoders, col4_validators, col4_recoders, source_table  # noqa: F401
+
+import pandas as pd
+
+from table_enforcer import Column, CompoundColumn, Enforcer
+from table_enforcer import validate as v
+from table_enforcer import transform as tr
+from table_enforcer.budget import FailureBudget, FailureReport
+from table_enforcer.errors import FailureBudgetExceeded, ValidationError
+
+
+@pytest.fixture()
+def big_table(source_table):
+    return pd.concat([source_table] * 25, ignore_index=True)
+
+
+def test_failure_report():
+    report = FailureReport()
+    report.rows_checked = 10
+    failed = pd.DataFrame({"positive": [False, False]}, index=[1, 2])
+    report.add({"col1": failed, "col2": failed.iloc[:1], "col3": failed.iloc[:0]})
+    report.add({"col1": pd.DataFrame({"unique": [False]}, index=[5])})
+
+    assert report.failed_rows_per_column() == {"col1": 3, "col2": 1}
+    assert report.failed_rows() == 3
+    assert report.to_frame().index.names == ["column_name", "row"]
+    assert report.to_frame().shape[0] == 4
+    assert FailureReport().to_frame().shape[0] == 0
+
+    report.add([("col2", failed), ("col2", failed.iloc[:0])])
+    assert report.failed_rows_per_column() == {"col1": 3, "col2": 2}
+
+
+def test_budget_limits():
+    report = FailureReport()
+    report.rows_checked = 4
+    report.add({"col1": pd.DataFrame({"positive": [False, False]}, index=[1, 2])})
+
+    assert FailureBudget().exceeded(report) is None
+    assert FailureBudget(max_failed_rows=2).exceeded(report) is None
+    assert "max_failed_rows=1" in FailureBudget(max_failed_rows=1).exceeded(report)
+    assert "col1" in FailureBudget(max_failed_rows_per_column=1).exceeded(report)
+    assert FailureBudget(max_failure_ratio=0.5).exceeded(report) is None
+    assert "max_failure_ratio" in FailureBudget(max_failure_ratio=0.4).exceeded(report)
+
+
+def test_recode_within_budget(col4, col4_no_recoders, source_table):
+    enforcer = Enforcer(columns=[col4_no_recoders])
+    with pytest.raises(ValidationError):
+        enforcer.recode(source_table, validate=True)
+
+    recoded = enforcer.recode(source_table, budget=FailureBudget(max_failed_rows=4))
+    assert recoded.equals(enforcer.recode(source_table))
+
+    assert Enforcer(columns=[col4]).recode(source_table, budget=FailureBudget(max_failed_rows=0)).equals(
+        Enforcer(columns=[col4]).recode(source_table, validate=True))
+
+
+def test_recode_aborts_early(col4, col4_no_recoders, big_table):
+    calls = []
+
+    def positive(series):
+        calls.append(len(series))
+        return v.funcs.positive(series)
+
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[positive], recoders=[])
+    enforcer = Enforcer(columns=[col4_no_recoders, col1])
+
+    with pytest.raises(FailureBudgetExceeded) as error:
+        enforcer.recode(big_table, budget=FailureBudget(max_failed_rows=5, chunksize=10))
+
+    report = error.value.report
+    assert report.rows_checked == 10
+    assert list(report.failed_rows_per_column()) == ["col4"]
+    assert calls == []
+    assert isinstance(error.value, ValidationError)
+
+
+def test_validate_with_budget(col4_no_recoders, big_table):
+    enforcer = Enforcer(columns=[col4_no_recoders])
+    assert enforcer.validate(big_table, budget=FailureBudget(max_failure_ratio=1.0))
+    assert not enforcer.validate(big_table, budget=FailureBudget(max_failure_ratio=0.5, chunksize=4))
+
+
+def test_unique_checked_across_chunks(big_table):
+    col1 = Column(name='col1', dtype=int, unique=True, validators=[], recoders=[])
+    table = big_table.iloc[:8].assign(col1=[1, 2, 3, 4, 5, 6, 7, 1])
+    enforcer = Enforcer(columns=[col1])
+
+    assert enforcer.validate(table, budget=FailureBudget(max_failed_rows=2, chunksize=4))
+    assert not enforcer.validate(table, budget=FailureBudget(max_failed_rows=1, chunksize=4))
+
+    with pytest.raises(FailureBudgetExceeded) as error:
+        enforcer.recode(table, budget=FailureBudget(max_failed_rows=1, chunksize=4))
+    assert error.value.report.failed_rows() == 2
+
+
+def test_validate_leaves_partial_report(col4_no_recoders, big_table):
+    enforcer = Enforcer(columns=[col4_no_recoders])
+    budget = FailureBudget(max_failed_rows=5, chunksize=10)
+
+    assert not enforcer.validate(big_table, budget=budget)
+    assert budget.report.rows_checked == 10
+    assert list(budget.report.failed_rows_per_column()) == ["col4"]
+
+
+def test_output_named_like_input(abs_x):
+    table = pd.DataFrame({"x": [1, -2, 3]})
+    enforcer = Enforcer(columns=[abs_x])
+    budget = FailureBudget(max_failed_rows=0)
+
+    assert not enforcer.validate(table)
+    assert not enforcer.validate(table, budget=budget)
+    assert budget.report.failed_rows_per_column() == {"x": 1}
+
+
+def test_unique_outputs_checked_across_chunks():
+    pair = CompoundColumn(
+        input_columns=[Column(name='pair', dtype=str, unique=False, validators=[], recoders=[])],
+        output_columns=[
+            Column(name='n', dtype=str, unique=True, validators=[], recoders=[]),
+            Column(name='letter', dtype=str, unique=False, validators=[], recoders=[]),
+        ],
+        column_transform=tr.funcs.split("pair", ["n", "letter"], ":"),)
+    table = pd.DataFrame({"pair": ["1:A", "2:B", "3:C", "1:D"]})
+    budget = FailureBudget(max_failed_rows=0, chunksize=2)
+
+    assert not Enforcer(columns=[pair]).validate(table, budget=budget)
+    assert budget.report.failed_rows_per_column() == {"n": 2}
@@ -0,0 +1,135 @@
+"""Test the unit: RecoderCache."""
+import re
+
+import pytest
+from .conftest import source_table  # noqa: F401
+
+import numpy as np
+import pandas as pd
+
+from table_enforcer import Column, Enforcer
+from table_enforcer import recode as r
+from table_enforcer.cache import RecoderCache
+from table_enforcer.fingerprint import function_identity, version
+
+bad_chars = re.compile(pattern="""[*(]""")
+SEEN = []
+
+
+@r.decorators.pure()
+def fix_bad_characters(series):
+    """Recoder"""
+    SEEN.extend(series)
+    return series.astype(str).apply(lambda x: bad_chars.sub(repl='', string=x))
+
+
+@r.decorators.pure(version=2)
+def double(series):
+    SEEN.extend(series)
+    return series * 2
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    SEEN.clear()
+    cache = RecoderCache(tmp_path / "cache.sqlite")
+    yield cache
+    cache.close()
+
+
+def test_pure_decorator():
+    assert fix_bad_characters.pure is True
+    assert fix_bad_characters.version is None
+    assert double.version == 2
+
+    @r.decorators.pure()
+    @version("3")
+    def tagged(series):
+        return series
+
+    assert tagged.version == "3"
+    assert function_identity(tagged).endswith(":v3")
+
+
+def test_apply_computes_only_misses(cache):
+    series = pd.Series(["a*", "b(", "a*", "c"], name="col5")
+
+    recoded = cache.apply(fix_bad_characters, series)
+    assert list(recoded) == ["a", "b", "a", "c"]
+    assert sorted(SEEN) == ["a*", "b(", "c"]
+
+    SEEN.clear()
+    recoded = cache.apply(fix_bad_characters, pd.Series(["c", "d*", "a*"], index=[7, 8, 9], name="col5"))
+    assert list(recoded) == ["c", "d", "a"]
+    assert list(recoded.index) == [7, 8, 9]
+    assert recoded.name == "col5"
+    assert SEEN == ["d*"]
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_apply_keeps_dtype_and_nulls(cache):
+    series = pd.Series([1.0, np.nan, 3.0, 1.0])
+    recoded = cache.apply(double, series)
+    assert recoded.dtype == np.float64
+    assert recoded.iloc[[0, 2, 3]].tolist() == [2.0, 6.0, 2.0]
+    assert np.isnan(recoded.iloc[1])
+
+
+@pytest.mark.parametrize("dtype", ["string", "Int64", "category"])
+def test_hits_and_misses_keep_recoder_dtype(tmp_path, dtype):
+    @r.decorators.pure()
+    def as_dtype(series):
+        return series.str.upper().astype(dtype) if dtype != "Int64" else series.str.len().astype(dtype)
+
+    series = pd.Series(["a", "bb", "a", None], name="col5")
+    expected = as_dtype(series)
+
+    cache = RecoderCache(tmp_path / "cache.sqlite")
+    missed = cache.apply(as_dtype, series)
+    hit = cache.apply(as_dtype, series)
+    cache.close()
+
+    # a fresh connection only has the stored dtype to go on
+    reopened = RecoderCache(tmp_path / "cache.sqlite")
+    persisted = reopened.apply(as_dtype, series)
+    reopened.close()
+
+    for recoded in (missed, hit, persisted):
+        pd.testing.assert_series_equal(recoded, expected)
+
+
+def test_cache_persists(tmp_path, cache):
+    cache.apply(double, pd.Series([1, 2, 3]))
+    cache.close()
+
+    SEEN.clear()
+    reopened = RecoderCache(tmp_path / "cache.sqlite")
+    assert reopened.apply(double, pd.Series([3, 2, 1])).tolist() == [6, 4, 2]
+    assert SEEN == []
+    reopened.close()
+
+
+def test_lru_eviction(tmp_path):
+    cache = RecoderCache(tmp_path / "cache.sqlite", max_entries=3)
+    cache.apply(double, pd.Series([1, 2, 3]))
+    cache.apply(double, pd.Series([1]))
+    cache.apply(double, pd.Series([4]))
+    assert len(cache) == 3
+
+    SEEN.clear()
+    cache.apply(double, pd.Series([1, 4]))
+    assert SEEN == []
+    cache.close()
+
+
+def test_column_recode_uses_cache(cache, source_table):
+    col5 = Column(name='col5', dtype=str, unique=False, validators=[], recoders=[fix_bad_characters, r.funcs.upper])
+    expected = Enforcer(columns=[col5]).recode(source_table)
+
+    SEEN.clear()
+    assert Enforcer(columns=[col5]).recode(source_table, cache=cache).equals(expected)
+    assert len(SEEN) == 4
+
+    SEEN.clear()
+    assert Enforcer(columns=[col5]).recode(source_table, cache=cache).equals(expected)
+    assert SEEN == []
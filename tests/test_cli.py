@@ -0,0 +1,169 @@
+"""Test the command line runner."""
+import json
+import shutil
+import textwrap
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from table_enforcer import cli
+
+DEMO_TABLE = Path(__file__).parent / "files" / "demo_table.csv"
+
+DEFINITION = textwrap.dedent('''
+    from table_enforcer import Column, Enforcer
+    from table_enforcer import validate as v
+    from table_enforcer import recode as r
+
+
+    def valid_sex(series):
+        return series.isin(["M", "F"])
+
+
+    def standardize_sex(series):
+        return series.str.slice(0, 1)
+
+
+    def make_enforcer():
+        return Enforcer(columns=[
+            Column(name="col1", dtype=int, unique=False, validators=[v.funcs.positive], recoders=[]),
+            Column(name="col4", dtype=str, unique=False, validators=[valid_sex],
+                   recoders=[r.funcs.upper, standardize_sex]),
+        ])
+
+
+    strict = Enforcer(columns=[
+        Column(name="col4", dtype=str, unique=False, validators=[v.funcs.lower], recoders=[]),
+    ])
+
+
+    negative = Enforcer(columns=[
+        Column(name="col1", dtype=int, unique=False, validators=[v.funcs.negative], recoders=[]),
+    ])
+''')
+
+
+@pytest.fixture()
+def definition(tmp_path):
+    path = tmp_path / "schema.py"
+    path.write_text(DEFINITION)
+    return str(path)
+
+
+@pytest.fixture()
+def inputs(tmp_path):
+    directory = tmp_path / "inputs"
+    directory.mkdir()
+    for name in ["a", "b", "c"]:
+        shutil.copy(DEMO_TABLE, directory / f"{name}.csv")
+    return directory
+
+
+def test_load_enforcer(definition):
+    enforcer = cli.load_enforcer(f"{definition}:make_enforcer")
+    assert [column.name for column in enforcer.columns] == ["col1", "col4"]
+    assert cli.load_enforcer(f"{definition}:make_enforcer") is enforcer
+
+    with pytest.raises(ValueError):
+        cli.load_enforcer("no_attribute")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_main_passing_files(definition, inputs, tmp_path, jobs):
+    output_dir = tmp_path / "out"
+    report_path = tmp_path / "report.json"
+
+    code = cli.main([
+        f"{definition}:make_enforcer",
+        str(inputs / "*.csv"),
+        "--output-dir", str(output_dir),
+        "--chunksize", "3",
+        "--jobs", str(jobs),
+        "--report", str(report_path),
+    ])
+
+    assert code == 0
+    report = json.loads(report_path.read_text())
+    assert report["passed"] is True
+    assert [Path(f["input"]).name for f in report["files"]] == ["a.csv", "b.csv", "c.csv"]
+
+    for name in ["a", "b", "c"]:
+        recoded = pd.read_csv(output_dir / f"{name}.csv")
+        assert recoded.col4.tolist() == ["M", "M", "F", "F"]
+        assert recoded.col1.tolist() == [7, 2, 6, 5]
+        assert not (output_dir / f"{name}.quarantine.csv").exists()
+
+    assert all(f["rows"] == 4 and f["valid_rows"] == 4 and f["rows_per_second"] > 0 for f in report["files"])
+
+
+def test_main_failing_rows_are_quarantined(definition, inputs, tmp_path, capsys):
+    output_dir = tmp_path / "out"
+
+    code = cli.main([f"{definition}:strict", str(inputs / "a.csv"), "-o", str(output_dir), "-r", "-"])
+
+    assert code == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report["passed"] is False
+    file_report = report["files"][0]
+    assert file_report["valid_rows"] == 2
+    assert file_report["quarantined_rows"] == 2
+    assert file_report["failures"] == {"col4:lower": 2}
+
+    quarantine = pd.read_csv(file_report["quarantine"])
+    assert quarantine.col4.tolist() == ["F", "Female"]
+    assert quarantine.failed_validations.tolist() == ["col4:lower"] * 2
+
+
+def test_main_removes_stale_outputs(definition, inputs, tmp_path):
+    output_dir = tmp_path / "out"
+    valid, quarantine = output_dir / "a.csv", output_dir / "a.quarantine.csv"
+
+    assert cli.main([f"{definition}:strict", str(inputs / "a.csv"), "-o", str(output_dir)]) == 1
+    assert valid.exists() and quarantine.exists()
+
+    assert cli.main([f"{definition}:make_enforcer", str(inputs / "a.csv"), "-o", str(output_dir)]) == 0
+    assert valid.exists() and not quarantine.exists()
+
+    assert cli.main([f"{definition}:negative", str(inputs / "a.csv"), "-o", str(output_dir)]) == 1
+    assert not valid.exists() and quarantine.exists()
+    assert sorted(path.name for path in output_dir.iterdir()) == ["a.quarantine.csv"]
+
+
+def test_main_with_schema_file(inputs, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps({"columns": [{"name": "col1", "dtype": "int", "validators": ["positive"]}]}))
+
+    code = cli.main([str(schema), str(inputs / "a.csv"), "-o", str(tmp_path / "out")])
+
+    assert code == 0
+    assert pd.read_csv(tmp_path / "out" / "a.csv").columns.tolist() == ["col1"]
+
+
+def test_main_parquet(definition, inputs, tmp_path):
+    pytest.importorskip("pyarrow")
+    source = tmp_path / "demo.parquet"
+    pd.read_csv(inputs / "a.csv").to_parquet(source)
+
+    code = cli.main([f"{definition}:make_enforcer", str(source), "-o", str(tmp_path / "out"), "-c", "3"])
+
+    assert code == 0
+    recoded = pd.read_parquet(tmp_path / "out" / "demo.parquet")
+    assert recoded.col4.tolist() == ["M", "M", "F", "F"]
+
+
+def test_main_reports_unreadable_files(definition, tmp_path, capsys):
+    code = cli.main([f"{definition}:make_enforcer", str(tmp_path / "missing.csv"), "-o", str(tmp_path), "-r", "-"])
+
+    assert code == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report["files"][0]["error"].startswith("FileNotFoundError")
+
+
+def test_main_refuses_clashing_outputs(definition, inputs, tmp_path):
+    other = tmp_path / "other"
+    other.mkdir()
+    shutil.copy(inputs / "a.csv", other / "a.csv")
+
+    assert cli.main([f"{definition}:make_enforcer", str(inputs / "a.csv"), str(other / "a.csv")]) == 2
@@ -0,0 +1,139 @@
+"""Test validating and recoding partitioned Dask dataframes."""
+import pandas as pd
+import pytest
+
+dd = pytest.importorskip("dask.dataframe")
+
+from table_enforcer import Column, Enforcer  # noqa: E402
+from table_enforcer import distributed  # noqa: E402
+from table_enforcer import validate as v  # noqa: E402
+from table_enforcer import recode as r  # noqa: E402
+from table_enforcer import transform as tr  # noqa: E402
+from table_enforcer.errors import ValidationError  # noqa: E402
+from table_enforcer.main_classes import CompoundColumn  # noqa: E402
+
+
+def valid_sex(series):
+    return series.isin(["M", "F"])
+
+
+def standardize_sex(series):
+    return series.str.slice(0, 1)
+
+
+def make_enforcer(unique=True):
+    return Enforcer(columns=[
+        Column(name="id", dtype=int, unique=unique, validators=[v.funcs.positive], recoders=[]),
+        Column(name="sex", dtype=str, unique=False, validators=[valid_sex], recoders=[r.funcs.upper, standardize_sex]),
+        CompoundColumn(
+            input_columns=[Column(name="code", dtype=str, unique=False, validators=[v.funcs.not_null], recoders=[])],
+            output_columns=[
+                Column(name="code_number", dtype=int, unique=unique, validators=[v.funcs.positive], recoders=[]),
+                Column(name="code_word", dtype=str, unique=False, validators=[v.funcs.upper],
+                       recoders=[r.funcs.upper]),
+            ],
+            column_transform=tr.funcs.split("code", names=["code_number", "code_word"], sep=":",
+                                             dtypes={"code_number": int}),),
+    ])
+
+
+def make_table(rows=12):
+    return pd.DataFrame({
+        "id": range(1, rows + 1),
+        "sex": ["m", "F"] * (rows // 2),
+        "code": [f"{i}:WORD" for i in range(1, rows + 1)],
+    })
+
+
+@pytest.fixture(params=["sync", "threads", "processes"])
+def scheduler(request):
+    import dask
+    with dask.config.set(scheduler=request.param):
+        yield request.param
+
+
+def test_recode_matches_pandas(scheduler):
+    enforcer = make_enforcer()
+    table = make_table()
+    frame = dd.from_pandas(table, npartitions=3)
+
+    recoded = distributed.recode(enforcer, frame, validate=True)
+
+    assert isinstance(recoded, dd.DataFrame)
+    assert list(recoded.columns) == ["id", "sex", "code_number", "code_word"]
+    assert recoded.dtypes.code_number == "int64"
+    pd.testing.assert_frame_equal(recoded.compute(), enforcer.recode(table, validate=True), check_dtype=False)
+
+
+def test_validate(scheduler):
+    enforcer = make_enforcer()
+    table = make_table()
+
+    assert not distributed.validate(enforcer, dd.from_pandas(table, npartitions=3))
+
+    table["sex"] = table.sex.str.upper()
+    assert distributed.validate(enforcer, dd.from_pandas(table, npartitions=3))
+    assert enforcer.validate(table)
+
+    table.loc[7, "sex"] = "X"
+    assert not distributed.validate(enforcer, dd.from_pandas(table, npartitions=3))
+
+
+def test_unique_is_checked_across_partitions():
+    table = make_table()
+    table["sex"] = "F"
+    table.loc[10, "id"] = 1  # duplicates row 0, which is in another partition
+
+    frame = dd.from_pandas(table, npartitions=3)
+    assert not distributed.validate(make_enforcer(), frame)
+    assert distributed.validate(make_enforcer(unique=False), frame)
+
+
+@pytest.mark.parametrize("npartitions", [1, 2])
+def test_unique_compound_outputs_are_checked(npartitions):
+    table = make_table()
+    table["sex"] = "F"
+    table.loc[10, "code"] = "1:AGAIN"  # duplicates the code_number of row 0
+    enforcer = make_enforcer()
+
+    assert not enforcer.validate(table)
+    assert not distributed.validate(enforcer, dd.from_pandas(table, npartitions=npartitions))
+    assert distributed.validate(make_enforcer(unique=False), dd.from_pandas(table, npartitions=npartitions))
+
+
+def test_repeated_nulls_are_duplicates():
+    enforcer = Enforcer(columns=[Column(name="key", dtype=float, unique=True, validators=[], recoders=[])])
+    table = pd.DataFrame({"key": [1.0, None, 2.0, 3.0, None, 4.0]})
+    frame = dd.from_pandas(table, npartitions=2)
+
+    assert not enforcer.validate(table)
+    assert not distributed.validate(enforcer, frame)
+    with pytest.raises(ValidationError, match="key") as error:
+        distributed.recode(enforcer, frame, validate=True).compute(scheduler="sync")
+    assert "NaN" in str(error.value)
+
+    table.loc[4, "key"] = 5.0
+    assert enforcer.validate(table)
+    assert distributed.validate(enforcer, dd.from_pandas(table, npartitions=2))
+
+
+def test_recode_validate_raises_on_duplicates_across_partitions():
+    table = make_table()
+    table.loc[10, "code"] = "1:again"
+    frame = dd.from_pandas(table, npartitions=3)
+
+    recoded = distributed.recode(make_enforcer(), frame, validate=True)
+    with pytest.raises(ValidationError, match="code_number"):
+        recoded.compute(scheduler="sync")
+
+    distributed.recode(make_enforcer(unique=False), frame, validate=True).compute(scheduler="sync")
+
+
+def test_recode_with_explicit_meta():
+    enforcer = make_enforcer()
+    table = make_table()
+    meta = enforcer.recode(table).iloc[:0]
+
+    recoded = distributed.recode(enforcer, dd.from_pandas(table, npartitions=2), meta=meta)
+
+    assert recoded.compute().shape == (12, 4)
@@ -0,0 +1,118 @@
+"""Test the unit: schema fingerprints."""
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+
+from .conftest import col4, col4_validators, col4_recoders, length_is_one  # noqa: F401
+
+from table_enforcer import Column, CompoundColumn, Enforcer
+from table_enforcer import validate as v
+from table_enforcer import recode as r
+from table_enforcer.fingerprint import function_identity, version
+
+
+def make_col1(**kwargs):
+    definition = dict(name='col1', dtype=int, unique=False, validators=[v.funcs.positive], recoders=[])
+    definition.update(kwargs)
+    return Column(**definition)
+
+
+def between(low, high):
+    @v.decorators.minmax(low=low, high=high)
+    def bounds(series):
+        return series
+
+    return bounds
+
+
+def test_function_identity():
+    assert function_identity(v.funcs.upper) == function_identity(v.funcs.upper)
+    assert function_identity(v.funcs.upper) != function_identity(r.funcs.upper)
+    assert function_identity(v.funcs.upper).startswith("table_enforcer.utils.validate.funcs.upper:")
+
+    assert function_identity(between(2, 10)) == function_identity(between(2, 10))
+    assert function_identity(between(2, 10)) != function_identity(between(2, 11))
+
+
+def in_vocabulary(vocabulary):
+    def known(series):
+        return series.isin(vocabulary)
+
+    return known
+
+
+def test_large_bound_data_hashed_by_contents():
+    words = np.array([f"word{i}" for i in range(5000)], dtype=object)
+    changed = words.copy()
+    changed[2500] = "other"
+    codes = np.arange(5000)
+    changed_codes = codes.copy()
+    changed_codes[2500] = -1
+
+    for same, other in [
+            (words, changed),
+            (codes, changed_codes),
+            (pd.Series(words), pd.Series(changed)),
+            (pd.Index(codes), pd.Index(changed_codes)),
+            (pd.DataFrame({"word": words}), pd.DataFrame({"word": changed})),]:
+        assert repr(same) == repr(other)
+        assert function_identity(in_vocabulary(same)) == function_identity(in_vocabulary(same.copy()))
+        assert function_identity(in_vocabulary(same)) != function_identity(in_vocabulary(other))
+
+    assert function_identity(in_vocabulary(codes)) != function_identity(in_vocabulary(codes.astype(np.int32)))
+
+
+def test_version_tag():
+    @version("3")
+    def lookup(series):
+        return series
+
+    assert function_identity(lookup).endswith(":v3")
+
+
+def test_column_fingerprint(col4):
+    assert col4.fingerprint == col4.fingerprint
+    assert make_col1().fingerprint == make_col1().fingerprint
+
+    assert make_col1().fingerprint != make_col1(name='col2').fingerprint
+    assert make_col1().fingerprint != make_col1(dtype=float).fingerprint
+    assert make_col1().fingerprint != make_col1(unique=True).fingerprint
+    assert make_col1().fingerprint != make_col1(validators=[v.funcs.negative]).fingerprint
+    assert make_col1().fingerprint != make_col1(recoders=[r.funcs.upper]).fingerprint
+
+
+def test_fingerprint_is_memoized():
+    col1 = make_col1()
+    first = col1.fingerprint
+    col1.name = 'other'
+    assert col1.fingerprint is first
+
+
+def test_compound_and_enforcer_fingerprint(col4):
+    def split(df):
+        return df
+
+    compound = CompoundColumn(input_columns=[col4], output_columns=[make_col1()], column_transform=split)
+    same = CompoundColumn(input_columns=[col4], output_columns=[make_col1()], column_transform=split)
+    other = CompoundColumn(input_columns=[col4], output_columns=[make_col1(unique=True)], column_transform=split)
+    assert compound.fingerprint == same.fingerprint
+    assert compound.fingerprint != other.fingerprint
+
+    assert Enforcer([col4, compound]).fingerprint == Enforcer([col4, same]).fingerprint
+    assert Enforcer([col4, compound]).fingerprint != Enforcer([compound, col4]).fingerprint
+
+
+def test_fingerprint_stable_across_processes():
+    script = (
+        "from table_enforcer import Column, Enforcer; from table_enforcer import validate as v\n"
+        "@v.decorators.choice({'M', 'F', 'X'})\n"
+        "def sex(series):\n"
+        "    return series\n"
+        "print(Enforcer([Column('col4', str, False, [sex, v.funcs.upper], None)]).fingerprint)\n")
+    prints = {
+        subprocess.run([sys.executable, "-c", script], stdout=subprocess.PIPE, check=True).stdout
+        for _ in range(2)
+    }
+    assert len(prints) == 1
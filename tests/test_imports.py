@@ -17,5 +17,45 @@ def test_import_recode():
     from table_enforcer import recode as r
 
 
+def test_import_transform():
+    from table_enforcer import transform as tr
+
+
 def test_import_ValidationError():
     from table_enforcer.errors import ValidationError
+
+
+IMPORT_BUDGET_SECONDS = 0.25
+
+
+def test_import_is_lazy():
+    import subprocess
+    import sys
+
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import table_enforcer\n"
+        "import table_enforcer.errors\n"
+        "elapsed = time.perf_counter() - start\n"
+        "heavy = sorted(m for m in ['pandas', 'numpy', 'box', 'table_enforcer.main_classes'] if m in sys.modules)\n"
+        "print(elapsed, ','.join(heavy))\n")
+    output = subprocess.run([sys.executable, "-c", script], stdout=subprocess.PIPE, check=True).stdout.decode()
+    elapsed, heavy = output.split()[0], output.split()[1:]
+
+    assert heavy == []
+    assert float(elapsed) < IMPORT_BUDGET_SECONDS
+
+
+def test_import_star():
+    namespace = {}
+    exec("from table_enforcer import *", namespace)
+    assert {"Enforcer", "BaseColumn", "Column", "CompoundColumn", "validate", "recode", "transform"} <= set(namespace)
+
+
+def test_unknown_attribute():
+    import pytest
+    import table_enforcer
+
+    with pytest.raises(AttributeError):
+        table_enforcer.not_a_thing
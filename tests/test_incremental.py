@@ -0,0 +1,148 @@
+"""Test the unit: IncrementalStore."""
+import pandas as pd
+import pytest
+from .conftest import col4, col4_validators, col4_recoders, source_table  # noqa: F401
+
+from table_enforcer import Column, CompoundColumn, Enforcer
+from table_enforcer import validate as v
+from table_enforcer import recode as r
+from table_enforcer import transform as tr
+from table_enforcer.errors import ValidationError
+from table_enforcer.incremental import IncrementalStore, hash_rows
+
+
+def counting(func, calls):
+    """Wrap a validator/recoder so that the rows it sees are recorded in ``calls``."""
+
+    def wrapper(series):
+        calls.append(len(series))
+        return func(series)
+
+    wrapper.__name__ = func.__name__
+    return wrapper
+
+
+def test_hash_rows(source_table):
+    hashes = hash_rows(source_table, ["col1", "col4"])
+    assert hashes.dtype == "uint64"
+    assert hashes.index.equals(source_table.index)
+    assert hashes.equals(hash_rows(source_table.copy(), ["col1", "col4"]))
+
+
+def test_validate_only_new_rows(tmp_path, source_table):
+    calls = []
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[counting(v.funcs.positive, calls)], recoders=[])
+    enforcer = Enforcer(columns=[col1])
+    store = IncrementalStore(tmp_path / "store.pkl")
+
+    assert enforcer.validate(source_table, store=store)
+    assert calls == [4]
+
+    changed = source_table.copy()
+    changed.loc[1, "col1"] = -5
+    assert not enforcer.validate(changed, store=IncrementalStore(tmp_path / "store.pkl"))
+    assert calls == [4, 1]
+
+    assert enforcer.validate(source_table, store=store)
+    assert calls == [4, 1, 1]
+
+
+def test_unique_checked_over_whole_table(tmp_path, source_table):
+    col1 = Column(name='col1', dtype=int, unique=True, validators=[v.funcs.positive], recoders=[])
+    enforcer = Enforcer(columns=[col1])
+    store = IncrementalStore(tmp_path / "store.pkl")
+
+    assert enforcer.validate(source_table, store=store)
+
+    duplicated = source_table.copy()
+    duplicated.loc[1, "col1"] = duplicated.loc[0, "col1"]
+    assert not enforcer.validate(duplicated, store=store)
+
+
+def test_unique_compound_outputs_checked_over_whole_table(tmp_path):
+    calls = []
+    pair = CompoundColumn(
+        input_columns=[Column(name='pair', dtype=str, unique=False, validators=[], recoders=[])],
+        output_columns=[
+            Column(name='n', dtype=str, unique=True, validators=[counting(v.funcs.not_null, calls)], recoders=[]),
+            Column(name='letter', dtype=str, unique=False, validators=[], recoders=[]),
+        ],
+        column_transform=tr.funcs.split("pair", ["n", "letter"], ":"),)
+    enforcer = Enforcer(columns=[pair])
+    store = IncrementalStore(tmp_path / "store.pkl")
+    table = pd.DataFrame({"pair": ["1:A", "2:B"]})
+
+    assert enforcer.validate(table, store=store)
+    assert calls == [2]
+
+    duplicated = pd.DataFrame({"pair": ["1:A", "2:B", "1:C"]})
+    assert not enforcer.validate(duplicated, store=store)
+    assert calls == [2, 1]
+    assert not Enforcer(columns=[pair]).validate(pd.DataFrame({"pair": ["1:A", "1:B"]}), store=store)
+
+
+def test_recode_only_new_rows(tmp_path, col4_validators, source_table):
+    calls = []
+    upper = counting(r.funcs.upper, calls)
+    col4 = Column(name='col4', dtype=str, unique=False, validators=col4_validators, recoders=[upper])
+    enforcer = Enforcer(columns=[col4])
+    store = IncrementalStore(tmp_path / "store.pkl")
+
+    expected = enforcer.recode(source_table)
+    calls.clear()
+
+    assert enforcer.recode(source_table, store=store).equals(expected)
+    assert calls == [4]
+
+    changed = source_table.copy()
+    changed.loc[2, "col4"] = "boy"
+    recoded = enforcer.recode(changed, store=store)
+    assert calls == [4, 1]
+    assert recoded.index.equals(changed.index)
+    assert list(recoded.col4) == ["MALE", "M", "BOY", "FEMALE"]
+
+
+def test_recode_repeated_labels(tmp_path):
+    col = Column(name='a', dtype=str, unique=False, validators=[], recoders=[r.funcs.upper])
+    enforcer = Enforcer(columns=[col])
+    store = IncrementalStore(tmp_path / "store.pkl")
+
+    enforcer.recode(pd.DataFrame({"a": ["x", "y"]}), store=store)
+    table = pd.DataFrame({"a": ["x", "z", "y"]}, index=[0, 0, 1])
+    recoded = enforcer.recode(table, store=store)
+
+    assert recoded.shape[0] == 3
+    assert list(recoded.index) == [0, 0, 1]
+    assert recoded.a.tolist() == ["X", "Z", "Y"]
+
+
+def test_recode_validate(tmp_path, col4, source_table):
+    col1 = Column(name='col1', dtype=int, unique=True, validators=[v.funcs.positive], recoders=[])
+    enforcer = Enforcer(columns=[col1, col4])
+    store = IncrementalStore(tmp_path / "store.pkl")
+
+    assert enforcer.recode(source_table, validate=True, store=store).equals(enforcer.recode(source_table))
+
+    duplicated = source_table.copy()
+    duplicated.loc[1, "col1"] = duplicated.loc[0, "col1"]
+    with pytest.raises(ValidationError):
+        enforcer.recode(duplicated, validate=True, store=store)
+
+
+def test_schema_change_invalidates_store(tmp_path, source_table):
+    calls = []
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[counting(v.funcs.positive, calls)], recoders=[])
+    store = IncrementalStore(tmp_path / "store.pkl")
+
+    Enforcer(columns=[col1]).validate(source_table, store=store)
+    Enforcer(columns=[col1]).validate(source_table, store=store)
+    assert calls == [4]
+
+    col1 = Column(
+        name='col1',
+        dtype=int,
+        unique=False,
+        validators=[counting(v.funcs.positive, calls), counting(v.funcs.not_null, calls)],
+        recoders=[])
+    Enforcer(columns=[col1]).validate(source_table, store=store)
+    assert calls == [4, 4, 4]
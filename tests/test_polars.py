@@ -0,0 +1,163 @@
+"""Test the Polars backend against the pandas backend."""
+import functools
+
+import pandas as pd
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from .conftest import demo_good_df  # noqa: E402,F401
+
+from table_enforcer import Column, CompoundColumn, Enforcer  # noqa: E402
+from table_enforcer import validate as v  # noqa: E402
+from table_enforcer import recode as r  # noqa: E402
+from table_enforcer import transform as tr  # noqa: E402
+from table_enforcer import polars_backend  # noqa: E402
+from table_enforcer.errors import ValidationError  # noqa: E402
+from table_enforcer.schema import SchemaFunction  # noqa: E402
+
+
+def valid_sex(series):
+    return series.isin(["M", "F"])
+
+
+def standardize_sex(series):
+    return series.str.slice(0, 1)
+
+
+@v.decorators.minmax(low=1, high=10)
+def between_1_and_10(series):
+    return series
+
+
+@v.decorators.bounded_length(low=1, high=6)
+def short(series):
+    return series
+
+
+@v.decorators.choice(["M", "F", "m", "F", "male", "Female"])
+def known_sex(series):
+    return series
+
+
+def make_enforcer():
+    return Enforcer(columns=[
+        Column(name="col1", dtype=int, unique=True, validators=[v.funcs.positive, between_1_and_10], recoders=[]),
+        Column(
+            name="col4",
+            dtype=str,
+            unique=False,
+            validators=[valid_sex, v.funcs.upper, short, known_sex],
+            recoders=[r.funcs.upper, standardize_sex]),
+        CompoundColumn(
+            input_columns=[Column(name="col5", dtype=str, unique=False, validators=[v.funcs.not_null], recoders=[])],
+            output_columns=[
+                Column(name="col5_number", dtype=int, unique=False, validators=[v.funcs.positive], recoders=[]),
+                Column(name="col5_word", dtype=str, unique=False, validators=[v.funcs.upper],
+                       recoders=[r.decorators.replace(r"[*]", "")(lambda series: series), r.funcs.upper]),
+            ],
+            column_transform=tr.funcs.split("col5", names=["col5_number", "col5_word"], sep=":",
+                                            dtypes={"col5_number": int}),),
+    ])
+
+
+def to_pandas_results(results):
+    return results.to_pandas().set_index("row").rename_axis(None)
+
+
+def test_enforcer_matches_pandas(demo_good_df):
+    enforcer = make_enforcer()
+    table = pl.from_pandas(demo_good_df)
+
+    assert enforcer.validate(table) == enforcer.validate(demo_good_df)
+
+    recoded = enforcer.recode(table, validate=True)
+    assert isinstance(recoded, pl.DataFrame)
+    pd.testing.assert_frame_equal(
+        recoded.to_pandas(), enforcer.recode(demo_good_df, validate=True).reset_index(drop=True), check_dtype=False)
+
+
+@pytest.mark.parametrize("failed_only", [False, True])
+def test_column_validate_matches_pandas(demo_good_df, failed_only):
+    column = make_enforcer().columns[1]
+    results = column.validate(pl.from_pandas(demo_good_df), failed_only=failed_only)
+
+    expected = column.validate(demo_good_df, failed_only=failed_only, full=True)
+    pd.testing.assert_frame_equal(to_pandas_results(results), expected, check_dtype=False, check_index_type=False)
+
+
+def test_compound_validate_matches_pandas(demo_good_df):
+    column = make_enforcer().columns[2]
+    results = column.validate(pl.from_pandas(demo_good_df)).to_pandas()
+    expected = column.validate(demo_good_df).reset_index()
+
+    key = ["validation_type", "column_name", "row"]
+    results = results.set_index(key).sort_index()
+    expected = expected.set_index(key).sort_index()[results.columns]
+    pd.testing.assert_frame_equal(results, expected, check_dtype=False, check_index_type=False)
+
+
+def test_lazy_frames_stay_lazy(demo_good_df):
+    enforcer = make_enforcer()
+    lazy = pl.from_pandas(demo_good_df).lazy()
+
+    recoded = enforcer.recode(lazy)
+    assert isinstance(recoded, pl.LazyFrame)
+    assert "python_udf" in recoded.explain()  # standardize_sex runs through the pandas fallback
+    assert recoded.collect().columns == ["col1", "col4", "col5_number", "col5_word"]
+
+    assert isinstance(enforcer.columns[0].validate(lazy), pl.LazyFrame)
+    assert enforcer.validate(lazy) is False
+
+
+def test_builtins_are_translated():
+    assert polars_backend._translate(v.funcs.upper, pl.col("a")) is not None
+    assert polars_backend._translate(between_1_and_10, pl.col("a")) is not None
+    assert polars_backend._translate(SchemaFunction("validators", "choice", {"choices": ["a"]}), pl.col("a")) is not None
+    assert polars_backend._translate(valid_sex, pl.col("a")) is None
+
+    # python-only regex syntax falls back to pandas
+    lookahead = v.decorators.match(r"a(?=b)")(lambda series: series)
+    assert polars_backend._translate(lookahead, pl.col("a")) is None
+
+    # other decorators copy ``spec`` through functools.wraps: they must not be taken for the builtin
+    def negate(function):
+        @functools.wraps(function)
+        def wrapper(series):
+            return ~function(series)
+        return wrapper
+
+    assert polars_backend._translate(negate(between_1_and_10), pl.col("a")) is None
+
+
+def test_translated_builtins_match_pandas():
+    series = pd.Series(["AB", "ab", None, "Ab", "12", "A1", "male"], name="a")
+    table = pl.from_pandas(series.to_frame())
+    validators = [
+        v.funcs.upper,
+        v.funcs.lower,
+        v.funcs.not_null,
+        known_sex,
+        v.decorators.match("[A-Z]")(lambda s: s),
+        v.decorators.match("[A-Z]+", fullmatch=True)(lambda s: s),
+    ]
+
+    for func in validators:
+        expected = pd.Series(func(series)).fillna(True).astype(bool).tolist()
+        result = table.select(polars_backend._translate(func, pl.col("a")).fill_null(True)).to_series().to_list()
+        assert result == expected, func.__name__
+
+
+def test_recode_validate_raises(demo_good_df):
+    table = pl.from_pandas(demo_good_df.assign(col1=[1, 2, 20, 3]))
+
+    with pytest.raises(ValidationError, match="col1"):
+        make_enforcer().recode(table, validate=True)
+
+    with pytest.raises(pl.exceptions.ComputeError, match="ValidationError"):
+        make_enforcer().recode(table.lazy(), validate=True).collect()
+
+
+def test_pandas_only_options_raise(demo_good_df):
+    with pytest.raises(ValueError, match="store"):
+        make_enforcer().validate(pl.from_pandas(demo_good_df), store=object())
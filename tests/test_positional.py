@@ -0,0 +1,84 @@
+"""Test the unit: positional validation results labeled with the table's index."""
+import pandas as pd
+import pytest
+
+from .conftest import demo_good_df  # noqa: F401
+
+from table_enforcer import Column, CompoundColumn, Enforcer
+from table_enforcer import validate as v
+from table_enforcer import transform as tr
+from table_enforcer.main_classes import find_failed_rows
+
+
+def seen_index(seen):
+    def check(series):
+        seen.append(series.index)
+        return series.notnull()
+
+    return check
+
+
+@pytest.fixture()
+def col1():
+    return Column(name='col1', dtype=int, unique=True, validators=[v.funcs.positive], recoders=[])
+
+
+@pytest.fixture()
+def col5():
+    return CompoundColumn(
+        input_columns=[Column(name='col5', dtype=str, unique=False, validators=[v.funcs.not_null], recoders=[])],
+        output_columns=[
+            Column(name='col5_number', dtype=str, unique=False, validators=[], recoders=[]),
+            Column(name='col5_word', dtype=str, unique=False, validators=[v.funcs.upper], recoders=[]),
+        ],
+        column_transform=tr.funcs.split("col5", ["col5_number", "col5_word"], ":"),)
+
+
+@pytest.mark.parametrize("index", [["d", "b", "a", "c"], [3, 1, 3, 0]])
+def test_column_results_keep_labels(col1, demo_good_df, index):
+    table = demo_good_df.assign(col1=[7, -2, 7, 5])
+    labeled = table.set_axis(index)
+
+    results = col1.validate(labeled)
+    expected = col1.validate(table).set_axis(index)
+    pd.testing.assert_frame_equal(results, expected)
+
+    failed = col1.validate(labeled, failed_only=True)
+    assert list(failed.index) == [index[0], index[1], index[2]]
+    assert list(failed.columns) == ["positive", "dtype", "unique"]
+
+
+def test_validators_see_positions(demo_good_df):
+    seen = []
+    column = Column(name='col1', dtype=int, unique=False, validators=[seen_index(seen)], recoders=[])
+
+    results = column.validate(demo_good_df.set_axis(["w", "x", "y", "z"]))
+
+    assert isinstance(seen[0], pd.RangeIndex)
+    assert list(results.index) == ["w", "x", "y", "z"]
+
+
+@pytest.mark.parametrize("index", [["d", "b", "a", "c"], [3, 1, 3, 0]])
+def test_compound_results_keep_labels(col5, demo_good_df, index):
+    labeled = demo_good_df.set_axis(index)
+
+    results = col5.validate(labeled)
+    expected = col5.validate(demo_good_df).reset_index()
+    expected["row"] = expected.row.map(dict(enumerate(index)))
+    pd.testing.assert_frame_equal(results.reset_index(), expected)
+
+    failed = col5.validate(labeled, failed_only=True)
+    assert list(failed.index) == [("output", "col5_word", row) for row in index]
+
+
+def test_find_failed_rows_treats_nulls_as_passing():
+    results = pd.DataFrame({"a": [True, False, None, True], "b": [True, True, None, False]}, index=list("wxyz"))
+    assert list(find_failed_rows(results).index) == ["x", "z"]
+
+
+def test_enforcer_validate(col1, col5, demo_good_df):
+    enforcer = Enforcer(columns=[col1, col5])
+    labeled = demo_good_df.set_axis(["d", "b", "a", "c"])
+
+    assert not enforcer.validate(labeled)
+    assert Enforcer(columns=[col1]).validate(labeled)
@@ -0,0 +1,116 @@
+"""Test the unit: preflight."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from table_enforcer import Column, CompoundColumn, Enforcer
+from table_enforcer import validate as v
+from table_enforcer import transform as tr
+from table_enforcer.preflight import HyperLogLog, _z_score, reservoir_sample, wilson_interval
+
+
+@pytest.fixture()
+def big_table():
+    rng = np.random.default_rng(0)
+    col1 = rng.integers(1, 11, size=20000)
+    return pd.DataFrame({"col1": col1, "id": np.arange(20000) % 15000})
+
+
+@pytest.fixture()
+def enforcer():
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[v.funcs.positive, gte2], recoders=[])
+    ids = Column(name='id', dtype=int, unique=True, validators=[v.funcs.not_null], recoders=[])
+    return Enforcer(columns=[col1, ids])
+
+
+def gte2(series):
+    return series >= 2
+
+
+def chunked(table, size):
+    return (table.iloc[start:start + size] for start in range(0, table.shape[0], size))
+
+
+def test_hyperloglog():
+    hll = HyperLogLog()
+    hll.add(pd.Series(np.arange(100000) % 40000))
+    hll.add(pd.Series(np.arange(100000) % 40000))
+    assert abs(hll.count() - 40000) < 40000 * 3 * hll.relative_error
+
+    small = HyperLogLog()
+    small.add(pd.Series(["a", "b", "c", "a"]))
+    assert round(small.count()) == 3
+
+
+def test_wilson_interval():
+    lower, upper = wilson_interval(10, 100)
+    assert lower < 0.1 < upper
+    assert wilson_interval(0, 100)[0] == 0
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    assert wilson_interval(10, 100, confidence=0.99)[1] > upper
+
+
+@pytest.mark.parametrize("confidence, z", [(0.8, 1.281552), (0.9, 1.644854), (0.95, 1.959964), (0.99, 2.575829)])
+def test_z_score(confidence, z):
+    assert _z_score(confidence) == pytest.approx(z, abs=1e-6)
+
+
+def test_reservoir_sample(big_table):
+    head, sample, tail, total = reservoir_sample(chunked(big_table, 3000), size=500, head=10, tail=20, seed=1)
+
+    assert total == 20000
+    assert list(head.index) == list(range(10))
+    assert list(tail.index) == list(range(19980, 20000))
+    assert sample.shape[0] == 500
+    assert sample.index.is_unique and sample.index.is_monotonic_increasing
+    assert sample.index.max() > 10000
+
+    _, whole, _, _ = reservoir_sample([big_table], size=500, seed=1)
+    assert whole.index.equals(sample.index)
+
+
+def test_preflight(big_table, enforcer):
+    report = enforcer.preflight(chunked(big_table, 4000), sample_size=2000, seed=0)
+
+    assert list(report.index) == ["col1", "id"]
+    col1 = report.loc["col1"]
+    assert col1.total_rows == 20000
+    assert col1.sample_rows == 2000
+    assert col1.edge_rows == 200
+    assert col1.lower <= 0.1 <= col1.upper
+    assert report.loc["id"].failed == 0
+
+    ids = report.loc["id"]
+    assert ids.distinct_lower <= 15000 <= ids.distinct_upper
+    assert np.isnan(col1.estimated_distinct)
+
+
+def test_preflight_dataframe(big_table, enforcer):
+    report = enforcer.preflight(big_table.iloc[:50], sample_size=100, head=5, tail=5)
+    assert report.loc["col1"].sample_rows == 50
+    assert report.loc["col1"].failed == (big_table.col1.iloc[:50] < 2).sum()
+
+
+def test_preflight_unique_compound_output():
+    pair = CompoundColumn(
+        input_columns=[Column(name='pair', dtype=str, unique=False, validators=[], recoders=[])],
+        output_columns=[
+            Column(name='n', dtype=str, unique=True, validators=[], recoders=[]),
+            Column(name='letter', dtype=str, unique=False, validators=[], recoders=[]),
+        ],
+        column_transform=tr.funcs.split("pair", ["n", "letter"], ":"),)
+    table = pd.DataFrame({"pair": [f"{i % 500}:A" for i in range(2000)]})
+
+    report = Enforcer(columns=[pair]).preflight(chunked(table, 300), seed=0)
+
+    n = report.loc["n"]
+    assert n.distinct_lower <= 500 <= n.distinct_upper
+    assert np.isnan(report.loc["letter"].estimated_distinct)
+
+
+def test_preflight_empty_source(enforcer):
+    report = enforcer.preflight(iter([]))
+
+    assert list(report.index) == ["col1", "id"]
+    assert (report.total_rows == 0).all() and (report.failed == 0).all()
+    assert report.loc["id"].estimated_distinct == 0
@@ -0,0 +1,88 @@
+"""Test the unit: Profiler."""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from .conftest import col4, col4_validators, col4_recoders, source_table  # noqa: F401
+
+import pandas as pd
+
+from table_enforcer import Column, Enforcer
+from table_enforcer import validate as v
+from table_enforcer.profiling import Profiler, REPORT_COLUMNS
+
+
+def test_profiler_call():
+    profiler = Profiler()
+    series = pd.Series([1, -1, 2])
+    result = profiler.call("col1", "validator", "positive", v.funcs.positive, series)
+    profiler.call("col1", "validator", "positive", v.funcs.positive, series)
+
+    assert result.tolist() == [True, False, True]
+
+    report = profiler.report()
+    assert list(report.columns) == REPORT_COLUMNS
+    assert report.shape[0] == 1
+    row = report.iloc[0]
+    assert (row.column, row.kind, row.function) == ("col1", "validator", "positive")
+    assert (row.calls, row.rows, row.failures) == (2, 6, 2)
+    assert row.seconds > 0
+
+
+def test_enforcer_profile_report(col4, source_table):
+    enforcer = Enforcer(columns=[col4])
+
+    with pytest.raises(ValueError):
+        enforcer.profile_report()
+
+    events = []
+    enforcer.enable_profiling(callbacks=[events.append], trace_memory=True)
+    enforcer.recode(source_table, validate=True)
+
+    report = enforcer.profile_report()
+    recoders = report[report.kind == "recoder"]
+    validators = report[report.kind == "validator"]
+
+    assert sorted(recoders.function) == ["standardize_sex", "upper"]
+    assert sorted(validators.function) == ["dtype", "length_is_one", "upper", "valid_sex"]
+    assert (validators.failures == 0).all()
+    assert (report.rows == 4).all()
+    assert report.peak_bytes.notnull().all()
+    assert len(events) == report.shape[0]
+    assert set(events[0]) == set(REPORT_COLUMNS)
+
+    enforcer.disable_profiling()
+    assert col4.profiler is None
+
+
+def test_failures_counted(source_table):
+    col1 = Column(name='col1', dtype=int, unique=True, validators=[v.funcs.negative], recoders=[])
+    enforcer = Enforcer(columns=[col1])
+    enforcer.enable_profiling()
+    # Enforcer.validate stops at the first failing test: full results run every one
+    col1.validate(source_table)
+
+    failures = enforcer.profile_report().set_index("function").failures
+    assert failures["negative"] == 4
+    assert failures["unique"] == 0
+
+
+def test_profiler_shared_by_threads():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    profiler = Profiler()
+    series = pd.Series([1, -1, 2])
+
+    def work():
+        for _ in range(500):
+            profiler.call("col1", "validator", "positive", v.funcs.positive, series)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(work) for _ in range(8)]:
+                future.result()
+    finally:
+        sys.setswitchinterval(interval)
+
+    row = profiler.report().iloc[0]
+    assert (row.calls, row.rows, row.failures) == (4000, 12000, 4000)
@@ -0,0 +1,80 @@
+"""Test the unit: Enforcer.recode_quarantine."""
+import pytest
+from .conftest import abs_x, col4, col4_no_recoders, col4_validators, col4_recoders, source_table  # noqa: F401
+
+import pandas as pd
+
+from table_enforcer import Column, Enforcer
+from table_enforcer import validate as v
+from . import Usage_Demo as ud
+from .conftest import TABLE_PATH_2
+
+
+@pytest.fixture()
+def bad_table():
+    return pd.read_csv(TABLE_PATH_2)
+
+
+def test_all_valid(col4, source_table):
+    enforcer = Enforcer(columns=[col4])
+    valid, quarantine = enforcer.recode_quarantine(source_table)
+
+    assert valid.equals(enforcer.recode(source_table, validate=True))
+    assert quarantine.shape[0] == 0
+    assert "failed_validations" in quarantine.columns
+
+
+def test_split(bad_table):
+    enforcer = Enforcer(columns=[ud.col1, ud.col3, ud.col4_new])
+    valid, quarantine = enforcer.recode_quarantine(bad_table)
+
+    assert list(valid.index) == [0, 1, 3]
+    assert list(valid.columns) == ["col1", "col3", "col4"]
+    assert valid.equals(ud.demo3.recode(bad_table).loc[[0, 1, 3]])
+
+    assert list(quarantine.index) == [2]
+    assert quarantine.drop(columns="failed_validations").equals(bad_table.loc[[2]])
+    assert quarantine.loc[2, "failed_validations"] == ["col1:bt_2_and_10"]
+
+
+def test_annotations(col4_no_recoders, source_table):
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[v.funcs.negative], recoders=[])
+    enforcer = Enforcer(columns=[col1, col4_no_recoders])
+    valid, quarantine = enforcer.recode_quarantine(source_table, annotation_column="why")
+
+    assert valid.shape[0] == 0
+    assert quarantine.drop(columns="why").equals(source_table)
+    assert quarantine.loc[1, "why"] == ["col1:negative", "col4:upper", "col4:valid_sex"]
+    assert quarantine.loc[2, "why"] == ["col1:negative"]
+
+
+def test_sinks(col4_no_recoders, source_table):
+    valid_chunks, quarantine_chunks = [], []
+    enforcer = Enforcer(columns=[col4_no_recoders])
+
+    valid, quarantine = enforcer.recode_quarantine(
+        source_table, chunksize=2, valid_sink=valid_chunks.append, quarantine_sink=quarantine_chunks.append)
+
+    assert valid is None and quarantine is None
+    assert len(valid_chunks) == len(quarantine_chunks) == 2
+    assert list(pd.concat(valid_chunks).index) == [2]
+    assert list(pd.concat(quarantine_chunks).index) == [0, 1, 3]
+
+
+def test_output_named_like_input(abs_x):
+    table = pd.DataFrame({"x": [1, -2, 3]})
+    valid, quarantine = Enforcer(columns=[abs_x]).recode_quarantine(table)
+
+    assert list(valid.index) == [0, 2]
+    assert quarantine.failed_validations.tolist() == [["x:positive"]]
+
+
+def test_repeated_labels():
+    col = Column(name='a', dtype=int, unique=False, validators=[v.funcs.positive], recoders=[])
+    table = pd.DataFrame({"a": [1, -1, 2]}, index=[0, 0, 1])
+    valid, quarantine = Enforcer(columns=[col]).recode_quarantine(table)
+
+    assert valid.a.tolist() == [1, 2]
+    assert list(valid.index) == [0, 1]
+    assert quarantine.a.tolist() == [-1]
+    assert quarantine.failed_validations.tolist() == [["a:positive"]]
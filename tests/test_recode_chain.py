@@ -0,0 +1,100 @@
+"""Test the copy-at-most-once contract of ``Column.recode``."""
+import pandas as pd
+
+from table_enforcer import Column
+from table_enforcer import recode as r
+
+
+def make_table():
+    return pd.DataFrame({"x": [-2, -1, 0, 1, 2]})
+
+
+def make_column(recoders):
+    return Column(name="x", dtype=int, unique=False, validators=[], recoders=recoders)
+
+
+@r.decorators.inplace(True)
+def clip_negative(series):
+    series[series < 0] = 0
+    return series
+
+
+def undeclared_clip(series):
+    series[series < 0] = 0
+    return series
+
+
+@r.decorators.inplace(False)
+def add_one(series):
+    return series + 1
+
+
+def test_inplace_attribute():
+    assert clip_negative.inplace is True
+    assert add_one.inplace is False
+    assert r.funcs.upper.inplace is False
+    assert r.funcs.lower.inplace is False
+
+    @r.decorators.pure()
+    def pure_recoder(series):
+        return series * 2
+
+    assert pure_recoder.inplace is False
+
+
+def test_inplace_recoders_never_touch_source():
+    table = make_table()
+    for recoders in ([clip_negative], [undeclared_clip], [add_one, clip_negative, undeclared_clip]):
+        recoded = make_column(recoders).recode(table)
+        assert table.x.tolist() == [-2, -1, 0, 1, 2]
+        assert recoded.x.min() >= 0
+
+
+def test_copying_recoders_get_source_without_copy():
+    table = make_table()
+    seen = []
+
+    @r.decorators.inplace(False)
+    def record(series):
+        seen.append(series)
+        return series + 0
+
+    make_column([record]).recode(table)
+
+    assert seen[0] is table["x"]
+
+
+def test_chain_copies_at_most_once(monkeypatch):
+    table = make_table()
+    copies = []
+    original_copy = pd.Series.copy
+
+    def counting_copy(self, *args, **kwargs):
+        if self.name == "x":
+            copies.append(self)
+        return original_copy(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.Series, "copy", counting_copy)
+
+    recoded = make_column([clip_negative, add_one, undeclared_clip]).recode(table)
+    assert len(copies) == 1
+    assert recoded.x.tolist() == [1, 1, 1, 2, 3]
+
+    # a copying recoder first hands the rest of the chain a new object: no copy at all
+    copies.clear()
+    recoded = make_column([add_one, clip_negative, undeclared_clip]).recode(table)
+    assert len(copies) == 0
+    assert recoded.x.tolist() == [0, 0, 1, 2, 3]
+
+
+def test_result_is_independent_of_source():
+    table = make_table()
+
+    @r.decorators.inplace(False)
+    def identity(series):
+        return series
+
+    recoded = make_column([identity]).recode(table)
+    recoded.loc[0, "x"] = 100
+
+    assert table.x.tolist() == [-2, -1, 0, 1, 2]
@@ -0,0 +1,137 @@
+"""Test loading Enforcer definitions from declarative schema files."""
+import json
+import pickle
+import textwrap
+
+import pandas as pd
+import pytest
+
+from .conftest import demo_good_df  # noqa: F401
+
+from table_enforcer import Column, CompoundColumn, load_schema
+from table_enforcer import validate as v
+from table_enforcer import recode as r
+from table_enforcer.schema import SchemaError, SchemaFunction, compile_schema
+
+SCHEMA = textwrap.dedent('''
+    columns:
+      - name: col1
+        dtype: int
+        unique: false
+        validators: [positive, {minmax: {low: 1, high: 10, name: one_to_ten}}]
+      - name: col4
+        dtype: [str, none]
+        validators:
+          - upper
+          - choice: {choices_file: sexes.txt}
+        recoders:
+          - upper
+          - "tests.test_schema:standardize_sex"
+      - input_columns: [{name: col5, dtype: str, validators: [not_null]}]
+        output_columns:
+          - {name: col5_number, dtype: int, validators: [positive]}
+          - name: col5_word
+            dtype: str
+            recoders: [{replace: {pattern: "[*]", repl: ""}}, {function: "table_enforcer.utils.recode.funcs:upper"}]
+        column_transform:
+          split: {column: col5, names: [col5_number, col5_word], sep: ":", dtypes: {col5_number: int}}
+''')
+
+
+def standardize_sex(series):
+    return series.str.slice(0, 1)
+
+
+@pytest.fixture()
+def schema_path(tmp_path):
+    (tmp_path / "sexes.txt").write_text("M\nF\n")
+    path = tmp_path / "schema.yaml"
+    path.write_text(SCHEMA)
+    return path
+
+
+def test_load_schema(schema_path, tmp_path, demo_good_df):
+    enforcer = load_schema(schema_path, cache_dir=tmp_path / "cache")
+
+    col1, col4, col5 = enforcer.columns
+    assert isinstance(col1, Column) and isinstance(col5, CompoundColumn)
+    assert col1.dtype is int
+    assert col4.dtype == (str, type(None))
+    assert list(col1.validators) == ["positive", "one_to_ten"]
+    assert col4.recoders["upper"] is r.funcs.upper
+    assert col4.recoders["standardize_sex"] is standardize_sex
+
+    recoded = enforcer.recode(demo_good_df, validate=True)
+    assert recoded.col4.tolist() == ["M", "M", "F", "F"]
+    assert recoded.col5_number.tolist() == [1, 3, 10, 6]
+    assert recoded.col5_word.tolist() == ["ONE", "THREE", "TEN", "SIX"]
+
+    assert not col1.validate(pd.DataFrame({"col1": [0, 11]}))["one_to_ten"].any()
+
+
+def test_json_schema_matches_yaml(schema_path, tmp_path):
+    import yaml
+
+    json_path = tmp_path / "schema.json"
+    json_path.write_text(json.dumps(yaml.safe_load(SCHEMA)))
+
+    assert load_schema(json_path, use_cache=False).fingerprint == load_schema(schema_path, use_cache=False).fingerprint
+
+
+def test_compiled_schema_is_cached(schema_path, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    first = load_schema(schema_path, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schema was compiled again")
+
+    monkeypatch.setattr("table_enforcer.schema._Compiler.enforcer", fail)
+    second = load_schema(schema_path, cache_dir=cache_dir)
+
+    assert second is not first
+    assert second.fingerprint == first.fingerprint
+
+
+def test_cache_invalidated_by_changes(schema_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+    load_schema(schema_path, cache_dir=cache_dir)
+
+    (tmp_path / "sexes.txt").write_text("M\nF\nX\n")
+    enforcer = load_schema(schema_path, cache_dir=cache_dir)
+    assert enforcer.columns[1].validate(pd.DataFrame({"col4": ["X"]}))["choice"].all()
+
+    schema_path.write_text(SCHEMA.replace("high: 10", "high: 5"))
+    enforcer = load_schema(schema_path, cache_dir=cache_dir)
+    assert not enforcer.columns[0].validate(pd.DataFrame({"col1": [7]}))["one_to_ten"].any()
+    assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+
+def test_schema_function_pickles_by_parameters():
+    func = SchemaFunction("validators", "bounded_length", {"low": 1, "high": 2})
+    clone = pickle.loads(pickle.dumps(func))
+
+    series = pd.Series(["a", "abc"])
+    assert clone.__name__ == "bounded_length"
+    assert clone(series).tolist() == func(series).tolist() == [True, False]
+
+
+@pytest.mark.parametrize("spec", [
+    {},
+    {"columns": [{"dtype": "int"}]},
+    {"columns": [{"name": "a", "dtype": "complex128"}]},
+    {"columns": [{"name": "a", "validators": ["no_such_validator"]}]},
+    {"columns": [{"name": "a", "validators": [{"minmax": {"lo": 1}}]}]},
+    {"columns": [{"name": "a", "validators": [{"inplace": {}}]}]},
+    {"columns": [{"name": "a", "recoders": ["no_such_module:func"]}]},
+])
+def test_bad_schemas(spec):
+    with pytest.raises(SchemaError):
+        compile_schema(spec)
+
+
+def test_builtin_names_resolve_to_library_functions():
+    enforcer = compile_schema({"columns": [{"name": "a", "validators": ["positive"], "recoders": ["lower"]}]})
+
+    assert enforcer.columns[0].validators["positive"] is v.funcs.positive
+    assert enforcer.columns[0].recoders["lower"] is r.funcs.lower
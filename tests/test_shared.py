@@ -0,0 +1,103 @@
+"""Test the unit: SharedTable and parallel validation/recoding."""
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from .conftest import col4, col4_validators, col4_recoders, source_table  # noqa: F401
+from .test_OTMColumn import col5, col5_a, col5_b, col5_split  # noqa: F401
+
+from table_enforcer import Column, Enforcer
+from table_enforcer import validate as v
+from table_enforcer.cache import RecoderCache
+from table_enforcer.errors import RecodingError, ValidationError
+from table_enforcer.shared import SharedTable, attach
+from table_enforcer import recode as r
+
+
+@pytest.fixture()
+def enforcer(col4, col5_split):
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[lambda series: series > 0], recoders=[])
+    return Enforcer(columns=[col1, col4, col5_split])
+
+
+def test_attach_maps_buffers():
+    df = pd.DataFrame({"a": np.arange(5), "b": list("abcde"), "c": np.arange(5.0)}, index=list("vwxyz"))
+
+    with SharedTable(df) as shared:
+        handle = pickle.loads(pickle.dumps(shared.handle))
+        attached = attach(handle)
+
+        assert attached.equals(df)
+        assert isinstance(attached["a"].values.base, np.memmap) or isinstance(attached["a"].values, np.memmap)
+        assert not attached["c"].values.flags.writeable
+        assert len(pickle.dumps(handle)) < 1000
+
+    assert not shared.directory.path.exists()
+
+
+def test_given_directory_kept(tmp_path):
+    with SharedTable(pd.DataFrame({"a": [1, 2]}), path=tmp_path / "shared") as shared:
+        assert attach(shared.handle).a.tolist() == [1, 2]
+
+    assert (tmp_path / "shared").exists()
+
+
+def test_validate_jobs(enforcer, source_table):
+    assert enforcer.validate(source_table, jobs=2) == enforcer.validate(source_table)
+
+    good = source_table.assign(col1=source_table.col1.abs() + 1)
+    assert enforcer.validate(good, jobs=2) == enforcer.validate(good)
+
+
+def test_validate_jobs_stops_at_first_failure(tmp_path):
+    def slow(series):
+        (tmp_path / series.name).touch()
+        time.sleep(0.2)
+        return series > 0
+
+    names = [f"slow{i}" for i in range(8)]
+    failing = Column(name='failing', dtype=int, unique=False, validators=[v.funcs.negative], recoders=[])
+    columns = [failing] + [Column(name=name, dtype=int, unique=False, validators=[slow], recoders=[]) for name in names]
+    table = pd.DataFrame({name: [1, 2] for name in ["failing"] + names})
+
+    assert not Enforcer(columns=columns).validate(table, jobs=2)
+    # pending columns were cancelled rather than validated
+    assert len(list(tmp_path.iterdir())) < len(names)
+
+
+def test_recode_jobs(enforcer, source_table):
+    table = source_table.set_axis([f"row{i}" for i in range(source_table.shape[0])][::-1])
+
+    pd.testing.assert_frame_equal(enforcer.recode(table, jobs=2), enforcer.recode(table))
+
+
+def test_recode_jobs_errors(enforcer, source_table):
+    negative = Column(name='col1', dtype=int, unique=False, validators=[v.funcs.negative], recoders=[])
+    with pytest.raises(ValidationError, match="col1"):
+        Enforcer(columns=enforcer.columns + [negative]).recode(source_table, validate=True, jobs=2)
+
+    def broken(series):
+        raise ValueError("broken")
+
+    with pytest.raises(RecodingError, match="broken"):
+        Enforcer(columns=[Column(name='col1', dtype=int, unique=False, validators=[], recoders=[broken])]).recode(
+            source_table, jobs=2)
+
+
+def test_recode_jobs_cache(source_table, tmp_path):
+    @r.decorators.pure()
+    def double(series):
+        return series * 2
+
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[], recoders=[double])
+    col3 = Column(name='col3', dtype=int, unique=False, validators=[], recoders=[double])
+    enforcer = Enforcer(columns=[col1, col3])
+
+    cache = RecoderCache(tmp_path / "cache.sqlite")
+    recoded = enforcer.recode(source_table, cache=cache, jobs=2)
+
+    assert recoded.col1.tolist() == (source_table.col1 * 2).tolist()
+    assert len(cache) > 0
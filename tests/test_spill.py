@@ -0,0 +1,44 @@
+"""Test the unit: SpillDirectory."""
+import numpy as np
+import pandas as pd
+
+from .conftest import col4, col4_validators, col4_recoders, source_table  # noqa: F401
+from .test_OTMColumn import col5, col5_a, col5_b, col5_split  # noqa: F401
+
+from table_enforcer import Column, Enforcer
+from table_enforcer import validate as v
+from table_enforcer.spill import SpillDirectory
+
+
+def test_round_trip(tmp_path):
+    df = pd.DataFrame({"a": np.arange(5), "b": list("abcde"), "c": np.arange(5.0)}, index=list("vwxyz"))
+
+    with SpillDirectory(tmp_path / "scratch") as spill:
+        loaded = spill.load(spill.dump(df))
+        assert loaded.equals(df)
+        assert isinstance(loaded["a"].values.base, np.memmap) or isinstance(loaded["a"].values, np.memmap)
+        assert not loaded["a"].values.flags.writeable
+
+        assert spill.spill(pd.DataFrame(index=[1, 2])).index.tolist() == [1, 2]
+
+    assert (tmp_path / "scratch").exists()
+
+
+def test_temporary_directory_removed():
+    spill = SpillDirectory()
+    spill.spill(pd.DataFrame({"a": [1, 2]}))
+    assert any(spill.path.iterdir())
+
+    spill.cleanup()
+    assert not spill.path.exists()
+
+
+def test_enforcer_recode_spill(col4, col5_split, source_table):
+    col1 = Column(name='col1', dtype=int, unique=False, validators=[v.funcs.positive], recoders=[])
+    enforcer = Enforcer(columns=[col1, col4, col5_split])
+    expected = enforcer.recode(source_table)
+
+    with SpillDirectory() as spill:
+        recoded = enforcer.recode(source_table, spill=spill)
+        assert recoded.equals(expected)
+        assert len(list(spill.path.iterdir())) > len(recoded.columns)
@@ -0,0 +1,88 @@
+"""Test the vectorized string builtins and the regex decorators."""
+import numpy as np
+import pandas as pd
+
+from table_enforcer import validate as v
+from table_enforcer import recode as r
+from table_enforcer.utils import strings
+
+
+def test_as_strings():
+    assert strings.as_strings(pd.Series(["a", None, "b"])).dtype == strings.STRING_DTYPE
+    assert strings.as_strings(pd.Series(["a", 1])) is None
+    assert strings.as_strings(pd.Series([1, 2])) is None
+
+    converted = strings.as_strings(pd.Series(["a"]))
+    assert strings.as_strings(converted) is converted
+
+
+def test_case_validators_return_numpy_bools():
+    series = pd.Series(["AB", "ab", None, "Ab"])
+
+    upper = v.funcs.upper(series)
+    lower = v.funcs.lower(series)
+
+    assert upper.dtype == np.bool_
+    assert upper.tolist() == [True, False, True, False]
+    assert lower.tolist() == [False, True, True, False]
+
+
+def test_case_validators_mixed_objects_keep_object_behavior():
+    series = pd.Series(["AB", 1])
+    assert v.funcs.upper(series).tolist()[0] is True
+    assert pd.isnull(v.funcs.upper(series).tolist()[1])
+
+
+def test_case_recoders_stay_in_string_dtype():
+    series = pd.Series(["aB", None])
+
+    upper = r.funcs.upper(series)
+    assert upper.dtype == strings.STRING_DTYPE
+    assert upper.tolist() == ["AB", pd.NA]
+
+    lower = r.funcs.lower(upper)
+    assert lower.dtype == strings.STRING_DTYPE
+    assert lower.tolist() == ["ab", pd.NA]
+
+
+def test_match_decorator():
+    @v.decorators.match(r"[A-Z]{2}\d")
+    def code(series):
+        return series
+
+    @v.decorators.match(r"[A-Z]{2}\d", fullmatch=True)
+    def exact_code(series):
+        return series
+
+    series = pd.Series(["AB1", "AB12", "ab1", None])
+
+    assert code(series).dtype == np.bool_
+    assert code(series).tolist() == [True, True, False, True]
+    assert exact_code(series).tolist() == [True, False, False, True]
+    assert code.__name__ == "code"
+
+
+def test_match_decorator_non_strings_and_python_only_syntax():
+    @v.decorators.match(r"\d+$")
+    def digits(series):
+        return series
+
+    @v.decorators.match(r"(?!x)\w")
+    def not_x(series):
+        return series
+
+    assert digits(pd.Series([12, "3", "a"])).tolist() == [True, True, False]
+    assert not_x(pd.Series(["a", "x"])).tolist() == [True, False]
+
+
+def test_replace_decorator():
+    @r.decorators.replace(r"[^A-Za-z0-9]", "")
+    def strip_punctuation(series):
+        return series
+
+    @r.decorators.replace(r"(\w)(?=\1)", "")
+    def collapse_repeats(series):
+        return series
+
+    assert strip_punctuation(pd.Series(["a-b", "c.d", None])).tolist() == ["ab", "cd", pd.NA]
+    assert collapse_repeats(pd.Series(["aab"])).tolist() == ["ab"]
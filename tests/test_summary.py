@@ -0,0 +1,114 @@
+"""Test the unit: summary."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from .conftest import demo_good_df  # noqa: F401
+
+from table_enforcer import Column, CompoundColumn, Enforcer
+from table_enforcer import validate as v
+from table_enforcer import transform as tr
+from table_enforcer.summary import SUMMARY_COLUMNS, summarize
+
+
+def valid_sex(series):
+    return series.isin(["M", "F"])
+
+
+@v.decorators.minmax(low=1, high=6)
+def between_1_and_6(series):
+    return series
+
+
+@pytest.fixture()
+def enforcer():
+    col1 = Column(name='col1', dtype=int, unique=True, validators=[v.funcs.positive, between_1_and_6], recoders=[])
+    col4 = Column(name='col4', dtype=str, unique=False, validators=[v.funcs.upper, valid_sex], recoders=[])
+    col5 = CompoundColumn(
+        input_columns=[Column(name='col5', dtype=str, unique=False, validators=[v.funcs.not_null], recoders=[])],
+        output_columns=[
+            Column(name='col5_number', dtype=str, unique=False, validators=[], recoders=[]),
+            Column(name='col5_word', dtype=str, unique=False, validators=[v.funcs.upper], recoders=[]),
+        ],
+        column_transform=tr.funcs.split("col5", ["col5_number", "col5_word"], ":"),)
+    return Enforcer(columns=[col1, col4, col5])
+
+
+def failures_from_validate(enforcer, table):
+    """Return the failure counts per (column, check) computed from the per-row validation results."""
+    failures = {}
+    for column in enforcer.columns:
+        results = column.validate(table).fillna(True).astype(bool)
+        if isinstance(results.index, pd.MultiIndex):
+            for name, member in results.groupby(level="column_name"):
+                failures.update({(name, check): int((~member[check]).sum()) for check in member})
+        else:
+            failures.update({(column.name, check): int((~results[check]).sum()) for check in results})
+    return failures
+
+
+def test_summarize_matches_validate(enforcer, demo_good_df):
+    table = demo_good_df.assign(col1=[7, 2, 2, 5], col4=["M", None, "f", "F"])
+    summary = enforcer.summarize(table)
+
+    assert list(summary.columns) == SUMMARY_COLUMNS
+    assert list(summary.index.names) == ["column", "check"]
+    assert list(summary.loc["col1"].index) == ["positive", "between_1_and_6", "dtype", "unique"]
+    assert list(summary.index.get_level_values("column").unique()) == [
+        "col1", "col4", "col5", "col5_number", "col5_word"]
+
+    expected = failures_from_validate(enforcer, table)
+    assert summary.failed.to_dict() == {key: expected[key] for key in summary.index}
+    assert (summary.passed + summary.failed == 4).all()
+
+    assert summary.loc[("col1", "unique"), "failed"] == 2
+    assert summary.loc[("col4", "dtype"), "nulls"] == 1
+    assert summary.loc[("col1", "positive"), "distinct"] == 3
+    assert summary.loc[("col4", "upper"), "distinct"] == 3
+
+
+def test_summarize_keeps_no_per_row_results(enforcer, demo_good_df, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("per-row validation results were built")
+
+    monkeypatch.setattr(Column, "validate", fail)
+    monkeypatch.setattr(CompoundColumn, "validate", fail)
+
+    assert summarize(enforcer, demo_good_df).failed.sum() > 0
+
+
+def test_summarize_chunks(enforcer):
+    rng = np.random.default_rng(0)
+    table = pd.DataFrame({
+        "col1": rng.integers(0, 9, size=3000),
+        "col4": rng.choice(["M", "F", "m"], size=3000),
+        "col5": rng.choice(["1:ONE", "2:two", "3"], size=3000),
+    })
+    chunks = (table.iloc[start:start + 700] for start in range(0, 3000, 700))
+
+    whole = summarize(enforcer, table)
+    chunked = summarize(enforcer, chunks)
+
+    tests = whole.index.get_level_values("check") != "unique"
+    pd.testing.assert_frame_equal(
+        chunked.loc[tests].drop(columns="distinct"), whole.loc[tests].drop(columns="distinct"))
+    assert (abs(chunked.distinct - whole.distinct) <= 1).all()
+
+    # uniqueness is only checked within each chunk
+    assert chunked.loc[("col1", "unique"), "failed"] <= whole.loc[("col1", "unique"), "failed"]
+
+
+def test_summarize_unhashable_values():
+    lists = Column(name='lists', dtype=list, unique=False, validators=[], recoders=[])
+    summary = summarize(Enforcer(columns=[lists]), pd.DataFrame({"lists": [[1], [2], None]}))
+
+    assert summary.loc[("lists", "dtype"), "failed"] == 1
+    assert pd.isna(summary.loc[("lists", "dtype"), "distinct"])
+
+
+def test_summarize_polars(enforcer, demo_good_df):
+    pl = pytest.importorskip("polars")
+    table = demo_good_df.assign(col1=[7, 2, 2, 5], col4=["M", "f", "f", "F"])
+
+    pd.testing.assert_frame_equal(enforcer.summarize(pl.from_pandas(table)), enforcer.summarize(table))
+    pd.testing.assert_frame_equal(enforcer.summarize(pl.from_pandas(table).lazy()), enforcer.summarize(table))
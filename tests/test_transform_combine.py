@@ -0,0 +1,78 @@
+"""Test the many-to-one combiner transforms and the columnwise component validators."""
+import pandas as pd
+
+from .conftest import demo_good_df  # noqa: F401
+
+from table_enforcer import Column, CompoundColumn
+from table_enforcer import validate as v
+from table_enforcer import transform as tr
+
+
+def join_as_tuple(df):
+    return pd.DataFrame({"col6_7_8": df[["col6", "col7", "col8"]].apply(lambda row: tuple(row), axis=1)})
+
+
+def translator(name):
+    def translate(series):
+        return series.map({0: None, 1: name})
+
+    translate.__name__ = f"translate_{name}"
+    return translate
+
+
+def test_zip_columns_matches_row_apply(demo_good_df):
+    transform = tr.funcs.zip_columns(["col6", "col7", "col8"], name="col6_7_8")
+    zipped = transform(demo_good_df)
+
+    assert list(zipped.columns) == ["col6_7_8"]
+    assert zipped.index.equals(demo_good_df.index)
+    assert zipped.col6_7_8.tolist() == join_as_tuple(demo_good_df).col6_7_8.tolist()
+
+
+def test_hash_columns(demo_good_df):
+    transform = tr.funcs.hash_columns(["col6", "col7"], name="key")
+    keys = transform(demo_good_df).key
+
+    assert keys.dtype == "uint64"
+    pairs = list(zip(demo_good_df.col6, demo_good_df.col7))
+    for i in range(len(pairs)):
+        for j in range(len(pairs)):
+            assert (keys.iloc[i] == keys.iloc[j]) == (pairs[i] == pairs[j])
+
+
+def test_components_decorator():
+    @v.decorators.components(lambda s: s.isin(["a", None]), None, lambda s: s > 0)
+    def valid_parts(series):
+        return series
+
+    series = pd.Series([("a", "x", 1), (None, "y", 2), ("b", "z", 3), ("a", "x", 0), ("a", 1), None],
+                       index=[5, 5, 6, 7, 8, 9], name="parts")
+    result = valid_parts(series)
+
+    assert result.dtype == bool
+    assert result.index.equals(series.index)
+    assert result.tolist() == [True, True, False, False, False, True]
+    assert valid_parts.__name__ == "valid_parts"
+
+
+def test_compound_column_with_builtin_combiner(demo_good_df):
+    names = {"col6": "DNASeq", "col7": "Protein Function", "col8": "RNASeq"}
+    input_columns = [
+        Column(name=column, dtype=(str, type(None)), unique=False, validators=[], recoders=[translator(name)])
+        for column, name in names.items()
+    ]
+
+    @v.decorators.components(*[(lambda s, name=name: s.isin([None, name])) for name in names.values()])
+    def col6_7_8_valid_values(series):
+        return series
+
+    output = Column(name="col6_7_8", dtype=tuple, unique=False, validators=[col6_7_8_valid_values], recoders=[])
+    column = CompoundColumn(
+        input_columns=input_columns,
+        output_columns=[output],
+        column_transform=tr.funcs.zip_columns(list(names), name="col6_7_8"))
+
+    recoded = column.recode(demo_good_df, validate=True)
+    translated = pd.DataFrame({column: translator(name)(demo_good_df[column]) for column, name in names.items()})
+
+    assert recoded.col6_7_8.tolist() == join_as_tuple(translated).col6_7_8.tolist()
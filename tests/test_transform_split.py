@@ -0,0 +1,110 @@
+"""Test the one-to-many split transforms."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from .conftest import demo_good_df  # noqa: F401
+
+from table_enforcer import Column, CompoundColumn
+from table_enforcer import validate as v
+from table_enforcer import recode as r
+from table_enforcer import transform as tr
+from table_enforcer.utils import strings
+
+
+def split_on_colon(df):
+    return pd.DataFrame({
+        "col5_number": df.col5.apply(lambda x: x.split(":")[0]),
+        "col5_word": df.col5.apply(lambda x: x.split(":")[1]),
+    })
+
+
+def test_split_matches_per_column_apply(demo_good_df):
+    transform = tr.funcs.split("col5", names=["col5_number", "col5_word"], sep=":")
+    parts = transform(demo_good_df)
+
+    expected = split_on_colon(demo_good_df)
+    assert list(parts.columns) == ["col5_number", "col5_word"]
+    assert parts.index.equals(demo_good_df.index)
+    for name in expected.columns:
+        assert parts[name].tolist() == expected[name].tolist()
+
+
+def test_split_keeps_extra_separators_and_pads_missing_parts():
+    table = pd.DataFrame({"code": ["a-b-c", "d", None]}, index=[3, 1, 2])
+    parts = tr.funcs.split("code", names=["head", "rest"], sep="-")(table)
+
+    assert parts.index.equals(table.index)
+    assert parts["head"].tolist() == ["a", "d", pd.NA]
+    assert parts["rest"].tolist() == ["b-c", pd.NA, pd.NA]
+
+
+def test_split_chunked_arrow_input():
+    pa = pytest.importorskip("pyarrow")
+    chunked = pa.chunked_array([["a-b-c", "d"], [None, "e-f"]])
+    table = pd.DataFrame({"code": pd.arrays.ArrowStringArray(chunked)}, index=[3, 1, 2, 0])
+
+    parts = tr.funcs.split("code", names=["head", "rest"], sep="-")(table)
+
+    assert parts.index.equals(table.index)
+    assert parts["head"].tolist() == ["a", "d", pd.NA, "e"]
+    assert parts["rest"].tolist() == ["b-c", pd.NA, pd.NA, "f"]
+
+
+def test_split_typed_output(demo_good_df):
+    transform = tr.funcs.split("col5", names=["col5_number", "col5_word"], sep=":", dtypes={"col5_number": int})
+    parts = transform(demo_good_df)
+
+    assert parts.col5_number.dtype == np.int64
+    assert parts.col5_number.tolist() == [1, 3, 10, 6]
+
+
+def test_extract_names_from_groups(demo_good_df):
+    transform = tr.funcs.extract("col5", r"(?P<col5_number>\d+):(\w+)", dtypes={"col5_number": int})
+    parts = transform(demo_good_df)
+
+    assert list(parts.columns) == ["col5_number", "col5_2"]
+    assert parts.col5_number.tolist() == [1, 3, 10, 6]
+    assert parts.col5_2.tolist() == ["one", "Three", "ten", "Six"]
+
+    named = tr.funcs.extract("col5", r"(\d+):(\w+)", names=["number", "word"])(demo_good_df)
+    assert list(named.columns) == ["number", "word"]
+
+
+def test_fixed_width():
+    table = pd.DataFrame({"record": ["20240131AB", "19991231CD"]})
+    transform = tr.funcs.fixed_width("record", widths=[4, 2, 2, 2], names=["year", "month", "day", "code"],
+                                     dtypes={"year": int, "month": int, "day": int})
+    parts = transform(table)
+
+    assert parts.year.tolist() == [2024, 1999]
+    assert parts.month.tolist() == [1, 12]
+    assert parts.code.tolist() == ["AB", "CD"]
+
+
+def test_compound_column_with_builtin_split(demo_good_df):
+    column = CompoundColumn(
+        input_columns=[Column(name="col5", dtype=str, unique=False, validators=[v.funcs.not_null], recoders=[])],
+        output_columns=[
+            Column(name="col5_number", dtype=int, unique=False, validators=[v.funcs.positive], recoders=[]),
+            Column(name="col5_word", dtype=str, unique=False, validators=[v.funcs.upper], recoders=[r.funcs.upper]),
+        ],
+        column_transform=tr.funcs.split("col5", names=["col5_number", "col5_word"], sep=":",
+                                        dtypes={"col5_number": int}),
+    )
+
+    recoded = column.recode(demo_good_df, validate=True)
+
+    assert recoded.col5_number.tolist() == [1, 3, 10, 6]
+    assert recoded.col5_word.tolist() == ["ONE*", "THREE", "TEN", "SIX"]
+
+
+def test_split_and_substring_without_arrow_storage():
+    for dtype in ["string[python]", object]:
+        series = pd.Series(["a-b-c", "d", None], dtype=dtype)
+        head, rest = strings.split(series, "-", 2)
+
+        assert head.tolist()[:2] == ["a", "d"]
+        assert rest.tolist()[0] == "b-c"
+        assert pd.isnull(rest.tolist()[1:]).all()
+        assert strings.substring(series, 1, 3).tolist()[:2] == ["-b", ""]